@@ -1,8 +1,10 @@
+from typing import Annotated
+
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from pydantic import AfterValidator, BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.gateway.dependencies import get_db
+from app.gateway.dependencies import default_segmenter_config, get_db, warmup_service
 from app.gateway.repositories.character_repo import (
     create_character,
     get_character,
@@ -15,11 +17,24 @@ from app.gateway.repositories.character_repo import (
 router = APIRouter(prefix="/characters", tags=["characters"])
 
 
+def _check_segmenter(v: dict[str, int]) -> dict[str, int]:
+    # 범위 밖이면 SegmenterConfig가 ValueError를 내고 pydantic이 422로 돌려준다
+    default_segmenter_config.with_overrides(v)
+    return v
+
+
+SegmenterOverrides = Annotated[dict[str, int], AfterValidator(_check_segmenter)]
+
+
 class CharacterCreate(BaseModel):
     name: str
     system_prompt: str = "You are a helpful assistant."
     model: str = "gpt-4o-mini"
     voice: str = "alloy"
+    greeting: str | None = None
+    segmenter: SegmenterOverrides | None = None
+    llm_cache: bool = False
+    history_token_budget: int | None = None
 
 
 class CharacterUpdate(BaseModel):
@@ -27,6 +42,10 @@ class CharacterUpdate(BaseModel):
     system_prompt: str | None = None
     model: str | None = None
     voice: str | None = None
+    greeting: str | None = None
+    segmenter: SegmenterOverrides | None = None
+    llm_cache: bool | None = None
+    history_token_budget: int | None = None
 
 
 @router.post("")
@@ -40,7 +59,13 @@ async def create_character_endpoint(
         system_prompt=body.system_prompt,
         model=body.model,
         voice=body.voice,
+        greeting=body.greeting,
+        segmenter=body.segmenter,
+        llm_cache=body.llm_cache,
+        history_token_budget=body.history_token_budget,
     )
+    if warmup_service is not None:
+        warmup_service.schedule_character(character_id)
     return {"id": character_id}
 
 
@@ -57,6 +82,10 @@ async def list_characters_endpoint(
             "system_prompt": c.system_prompt,
             "model": c.model,
             "voice": c.voice,
+            "greeting": c.greeting,
+            "segmenter": c.segmenter,
+            "llm_cache": c.llm_cache,
+            "history_token_budget": c.history_token_budget,
             "created_at": c.created_at,
             "updated_at": c.updated_at,
         }
@@ -78,6 +107,10 @@ async def get_character_endpoint(
         "system_prompt": character.system_prompt,
         "model": character.model,
         "voice": character.voice,
+        "greeting": character.greeting,
+        "segmenter": character.segmenter,
+        "llm_cache": character.llm_cache,
+        "history_token_budget": character.history_token_budget,
         "created_at": character.created_at,
         "updated_at": character.updated_at,
     }
@@ -96,9 +129,15 @@ async def update_character_endpoint(
         system_prompt=body.system_prompt,
         model=body.model,
         voice=body.voice,
+        greeting=body.greeting,
+        segmenter=body.segmenter,
+        llm_cache=body.llm_cache,
+        history_token_budget=body.history_token_budget,
     )
     if not updated:
         raise HTTPException(status_code=404, detail="Character not found")
+    if warmup_service is not None and (body.voice is not None or body.greeting is not None):
+        warmup_service.schedule_character(character_id)
     return {"ok": True}
 
 
@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+
+from app.gateway.dependencies import (
+    connection_buffers,
+    llm_hedge_policy,
+    llm_http_transport,
+    llm_response_cache,
+    llm_upstream,
+    tts_upstream,
+)
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def metrics():
+    return {
+        "websocket": connection_buffers.to_dict(),
+        "llm_http": llm_http_transport.stats() if llm_http_transport is not None else None,
+        "llm_hedge": llm_hedge_policy.stats.to_dict() if llm_hedge_policy is not None else None,
+        "upstreams": {
+            "llm": llm_upstream.snapshot(),
+            "tts": tts_upstream.snapshot(),
+        },
+        "llm_cache": llm_response_cache.stats().to_dict() if llm_response_cache is not None else None,
+    }
@@ -38,6 +38,7 @@ async def list_turns(session_id: str, limit: int = 50, db: AsyncSession = Depend
             "assistant_text": t.assistant_text,
             "ttft_ms": t.ttft_ms,
             "ttaf_ms": t.ttaf_ms,
+            "interrupted": t.interrupted,
             "created_at": t.created_at,
             "completed_at": t.completed_at,
         }
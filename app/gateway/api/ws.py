@@ -1,36 +1,148 @@
-import json
+import asyncio
+from contextlib import aclosing
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from starlette.websockets import WebSocketState
 
-from app.gateway.dependencies import get_turn_service, get_db_context
+from app.gateway.config import settings
+from app.gateway.dependencies import connection_buffers, get_turn_service, get_db_context
+from app.gateway.schemas.audio_frame import BINARY_SUBPROTOCOL, encode_audio_frame
+from app.gateway.schemas.client_message import CancelMessage, ClientMessageError, parse_client_message
+from app.gateway.services.backpressure import ConnectionBuffer, SlowConsumerError
+from app.gateway.services.coalescer import coalesce_tokens
+from app.gateway.services.multiplex import FairSender
 from app.gateway.services.turn import TurnService
 
 router = APIRouter()
 
 
+async def _send_event(ws: WebSocket, event: dict, binary: bool) -> None:
+    if binary and event.get("type") == "audio_chunk":
+        await ws.send_bytes(encode_audio_frame(event["turnId"], event["seq"], event["format"], event["audio"]))
+    else:
+        await ws.send_json(event)
+
+
+async def _run_turn(
+    ws: WebSocket,
+    sender: FairSender,
+    turn_service: TurnService,
+    session_id: str,
+    user_text: str,
+    binary: bool,
+    buffer: ConnectionBuffer,
+) -> None:
+    try:
+        async with get_db_context() as db:
+            events = turn_service.process_message(
+                db, session_id, user_text, binary_audio=binary, buffer=buffer, tag_events=True
+            )
+            if settings.WS_TOKEN_COALESCE_MS > 0:
+                events = coalesce_tokens(
+                    events,
+                    window_s=settings.WS_TOKEN_COALESCE_MS / 1000,
+                    max_bytes=settings.WS_TOKEN_COALESCE_BYTES,
+                    buffer=buffer,
+                )
+            async with aclosing(events):
+                async for event in events:
+                    await sender.put(session_id, event)
+                    if event.get("type") == "done":
+                        break
+    except SlowConsumerError as e:
+        await ws.close(code=1008, reason=f"slow consumer: {e}"[:120])
+    except Exception as e:
+        await sender.put(session_id, {"type": "error", "message": str(e), "sessionId": session_id})
+    finally:
+        sender.finish(session_id)
+
+
+async def _cancel(task: asyncio.Task | None) -> bool:
+    """진행 중인 턴을 취소하고 정리(finalize)가 끝날 때까지 기다린다. 취소했으면 True."""
+    if task is None or task.done():
+        return False
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    return True
+
+
 @router.websocket("/ws")
 async def ws_chat(
     ws: WebSocket,
     turn_service: TurnService = Depends(get_turn_service),
 ):
-    await ws.accept()
+    """한 연결에서 여러 세션의 턴을 동시에 돌린다 (세션당 진행 중인 턴은 하나).
+
+    - {"sessionId", "text"}: 그 세션에 새 턴. 같은 세션의 턴이 돌고 있으면 먼저 취소한다(barge-in).
+    - {"type": "cancel", "sessionId"?}: 그 세션의 턴만, sessionId가 없으면 모든 턴을 취소한다.
+
+    모든 이벤트에는 sessionId/turnId가 붙고, 턴들의 이벤트는 FairSender가 돌아가며 섞어 보낸다.
+    취소된 턴은 LLM 스트림과 대기/진행 중인 TTS 요청이 함께 취소되고 부분 텍스트로 interrupted 처리된다.
+    """
+    # subprotocol(rc.audio.v1) 또는 ?audio=binary 면 오디오를 binary frame으로 보낸다 (그 외는 기존 JSON)
+    offered = BINARY_SUBPROTOCOL in ws.scope.get("subprotocols", [])
+    binary = offered or ws.query_params.get("audio") == "binary"
+    await ws.accept(subprotocol=BINARY_SUBPROTOCOL if offered else None)
+    buffer = connection_buffers.open()
+    sender = FairSender(
+        lambda event: _send_event(ws, event, binary), per_stream=settings.WS_STREAM_BUFFER_EVENTS, buffer=buffer
+    )
+    writer = asyncio.create_task(sender.run())
+    turns: dict[str, asyncio.Task] = {}
+
+    async def cancel(session_id: str) -> None:
+        if await _cancel(turns.pop(session_id, None)):
+            sender.discard(session_id)
+            await sender.put(session_id, {"type": "cancelled", "sessionId": session_id})
+            sender.finish(session_id)
+
+    async def reject(session_id: str | None, message: str) -> None:
+        event = {"type": "error", "message": message}
+        if session_id is not None:
+            event["sessionId"] = session_id
+        await sender.put(session_id, event)
+        # 그 세션의 턴이 돌고 있으면 stream은 턴이 끝낸다
+        if session_id not in turns:
+            sender.finish(session_id)
+
     try:
         while True:
             raw = await ws.receive_text()
-            # 제어 문자 제거
-            clean = "".join(ch for ch in raw if ch >= " ").strip()
-            msg = json.loads(clean)
+            for session_id in [sid for sid, task in turns.items() if task.done()]:
+                del turns[session_id]
+            try:
+                msg = parse_client_message(raw)
+            except ClientMessageError as e:
+                # 메시지 하나가 잘못됐다고 연결(과 그 위의 다른 세션 턴들)을 끊지 않는다
+                await reject(e.session_id, str(e))
+                continue
 
-            session_id = msg["sessionId"]
-            user_text = msg["text"]
+            if isinstance(msg, CancelMessage):
+                targets = [msg.sessionId] if msg.sessionId else list(turns)
+                for session_id in targets:
+                    await cancel(session_id)
+                continue
 
-            async with get_db_context() as db:
-                async for event in turn_service.process_message(db, session_id, user_text):
-                    await ws.send_json(event)
-                    if event.get("type") == "done":
-                        break
+            session_id = msg.sessionId
+            user_text = msg.text
+
+            # 같은 세션의 이전 턴이 아직 끝나지 않았으면 새 발화가 끼어든 것
+            await cancel(session_id)
+            if len(turns) >= settings.WS_MAX_CONCURRENT_TURNS:
+                await reject(session_id, f"too many concurrent turns (max {settings.WS_MAX_CONCURRENT_TURNS})")
+                continue
+            turns[session_id] = asyncio.create_task(
+                _run_turn(ws, sender, turn_service, session_id, user_text, binary, buffer)
+            )
 
     except WebSocketDisconnect:
         return
     except Exception as e:
-        await ws.send_json({"type": "error", "message": str(e)})
+        if ws.application_state == WebSocketState.CONNECTED:
+            await ws.send_json({"type": "error", "message": str(e)})
+    finally:
+        for task in list(turns.values()):
+            await _cancel(task)
+        writer.cancel()
+        await asyncio.gather(writer, return_exceptions=True)
+        connection_buffers.close(buffer)
@@ -6,7 +6,10 @@ from app.gateway.schemas.message import Message
 
 
 class CacheClient:
-    """Redis 기반 세션 히스토리 캐시 (LLM 컨텍스트용)"""
+    """Redis 기반 세션 히스토리 캐시 (LLM 컨텍스트용)
+
+    명령이 여러 개인 작업은 MULTI/EXEC 파이프라인 하나로 보내서 왕복 한 번에 끝낸다.
+    """
 
     def __init__(
         self,
@@ -18,10 +21,14 @@ class CacheClient:
         self._max_turns = max_turns
         self._ttl = ttl_seconds
         self._hist: dict[str, deque[Message]] = defaultdict(lambda: deque(maxlen=max_turns * 2))
+        self._summary: dict[str, str] = {}
 
     def _key(self, session_id: str) -> str:
         return f"session:{session_id}:history"
 
+    def _summary_key(self, session_id: str) -> str:
+        return f"session:{session_id}:summary"
+
     def append_user(self, session_id: str, content: str):
         self._hist[session_id].append(Message(role="user", content=content))
 
@@ -38,26 +45,76 @@ class CacheClient:
         asst_msg = Message(role="assistant", content=assistant_text).model_dump_json()
 
         try:
-            await self._cache.lpush(key, asst_msg)
-            await self._cache.lpush(key, user_msg)
-
-            await self._cache.ltrim(key, 0, self._max_turns * 2 - 1)
-            await self._cache.expire(key, self._ttl)
+            async with self._cache.pipeline(transaction=True) as pipe:
+                # lpush(key, a, u)는 a, u 순서로 앞에 넣는다 (lpush 두 번과 같은 결과)
+                pipe.lpush(key, asst_msg, user_msg)
+                pipe.ltrim(key, 0, self._max_turns * 2 - 1)
+                pipe.expire(key, self._ttl)
+                # summary는 히스토리와 같이 살아 있어야 한다 (없으면 아무 일도 안 함)
+                pipe.expire(self._summary_key(session_id), self._ttl)
+                await pipe.execute()
         except Exception:
             return
 
     async def get_history(self, session_id: str) -> list[Message]:
+        history, _ = await self.get_history_and_summary(session_id)
+        return history
+
+    async def get_history_and_summary(self, session_id: str) -> tuple[list[Message], str | None]:
+        """히스토리와 히스토리 창에서 잘려 나간 대화의 rolling summary를 같은 왕복에서 읽는다."""
         key = self._key(session_id)
+        summary_key = self._summary_key(session_id)
 
         try:
-            raw = await self._cache.lrange(key, 0, -1)
+            # 히스토리와 summary를 읽으면서 TTL도 연장한다 (fetch-and-touch, 왕복 한 번)
+            async with self._cache.pipeline(transaction=True) as pipe:
+                pipe.lrange(key, 0, -1)
+                pipe.get(summary_key)
+                pipe.expire(key, self._ttl)
+                pipe.expire(summary_key, self._ttl)
+                raw, raw_summary, _, _ = await pipe.execute()
+            self._remember_summary(session_id, raw_summary)
             if raw:
                 msgs = [Message.model_validate_json(x) for x in reversed(raw)]
 
                 self._hist[session_id].clear()
                 self._hist[session_id].extend(msgs)
-                return msgs
+                return msgs, self._summary.get(session_id)
         except Exception:
             pass
 
-        return self.get_history_local(session_id)
+        return self.get_history_local(session_id), self._summary.get(session_id)
+
+    def _remember_summary(self, session_id: str, raw: bytes | str | None):
+        # Redis에 없으면(다른 프로세스가 지웠거나 만료) 로컬 사본도 버린다. 로컬 값은 Redis가 안 될 때만 쓴다
+        if raw is None:
+            self._summary.pop(session_id, None)
+        else:
+            self._summary[session_id] = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+
+    async def compact_history(self, session_id: str, keep: int, summary: str | None):
+        """오래된 메시지를 지우고 최근 keep개만 남긴 뒤, 지운 내용을 접은 summary를 저장한다."""
+        hist = self._hist[session_id]
+        while len(hist) > keep:
+            hist.popleft()
+        if summary:
+            self._summary[session_id] = summary
+        else:
+            self._summary.pop(session_id, None)
+
+        key = self._key(session_id)
+        summary_key = self._summary_key(session_id)
+        try:
+            async with self._cache.pipeline(transaction=True) as pipe:
+                # 리스트는 최신이 앞(lpush)이므로 앞에서 keep개를 남긴다
+                if keep:
+                    pipe.ltrim(key, 0, keep - 1)
+                else:
+                    pipe.delete(key)
+                if summary:
+                    pipe.set(summary_key, summary, ex=self._ttl)
+                else:
+                    pipe.delete(summary_key)
+                await pipe.execute()
+        except Exception:
+            return
@@ -0,0 +1,176 @@
+import asyncio
+import math
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+
+from app.gateway.clients.llm import BaseLLM
+from app.gateway.schemas.message import Message
+
+
+@dataclass
+class HedgeStats:
+    requests: int = 0
+    hedged: int = 0  # 두 번째 요청을 보낸 수
+    hedge_wins: int = 0  # 두 번째 요청이 먼저 첫 토큰을 준 수
+    budget_denied: int = 0  # 지연은 넘었지만 예산이 없어 보내지 않은 수
+
+    def to_dict(self) -> dict:
+        return asdict(self) | {
+            "hedge_rate": round(self.hedged / self.requests, 3) if self.requests else None,
+            "win_rate": round(self.hedge_wins / self.hedged, 3) if self.hedged else None,
+        }
+
+
+class HedgeBudget:
+    """요청마다 ratio만큼 쌓이고 hedge 하나에 1씩 쓰는 예산 (최대 burst).
+
+    장기적으로 hedge가 전체 요청의 ratio 비율을 넘지 않아서 추가 비용의 상한이 된다.
+    """
+
+    def __init__(self, ratio: float, burst: float):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = burst
+
+    def deposit(self) -> None:
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class HedgePolicy:
+    """프로세스 전체가 공유하는 hedge 설정/예산/최근 TTFT 기록."""
+
+    def __init__(
+        self,
+        delay_s: float,
+        budget: HedgeBudget,
+        percentile: float = 0.0,
+        min_delay_s: float = 0.1,
+        min_samples: int = 20,
+        window: int = 200,
+    ):
+        self.delay_s = delay_s
+        self.budget = budget
+        self.percentile = percentile
+        self.min_delay_s = min_delay_s
+        self.min_samples = min_samples
+        self.stats = HedgeStats()
+        self._ttft: deque[float] = deque(maxlen=window)
+
+    def record_ttft(self, seconds: float) -> None:
+        self._ttft.append(seconds)
+
+    def hedge_delay(self) -> float:
+        """percentile이 켜져 있고 표본이 충분하면 최근 TTFT의 p-분위수, 아니면 고정 지연."""
+        if not self.percentile or len(self._ttft) < self.min_samples:
+            return self.delay_s
+        ordered = sorted(self._ttft)
+        rank = max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+        return max(self.min_delay_s, ordered[rank])
+
+
+_EMPTY = object()  # 토큰 없이 끝난 스트림
+
+
+async def _first_token(stream: AsyncIterator[str]):
+    try:
+        return await anext(stream)
+    except StopAsyncIteration:
+        return _EMPTY
+
+
+class _Attempt:
+    """스트림 하나와 그 첫 토큰을 기다리는 task."""
+
+    def __init__(self, stream: AsyncIterator[str]):
+        self.stream = stream
+        self.first: asyncio.Task = asyncio.create_task(_first_token(stream))
+
+    async def cancel(self) -> None:
+        # 첫 토큰 task가 끝난 뒤에야 제너레이터를 닫을 수 있다 (실행 중인 제너레이터는 aclose 불가)
+        self.first.cancel()
+        await asyncio.gather(self.first, return_exceptions=True)
+        await self.stream.aclose()
+
+
+class HedgedLLM(BaseLLM):
+    """첫 토큰이 늦으면 같은 요청을 한 번 더 보내고, 먼저 첫 토큰을 준 쪽을 쓴다.
+
+    진 쪽 스트림은 바로 취소한다. hedge 여부는 HedgePolicy의 지연과 예산으로 정한다.
+    """
+
+    def __init__(self, llm: BaseLLM, policy: HedgePolicy):
+        self.llm = llm
+        self.policy = policy
+
+    async def stream(
+        self, user_text: str, history: list[Message]
+    ) -> AsyncIterator[str]:
+        policy = self.policy
+        policy.stats.requests += 1
+        policy.budget.deposit()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        attempts = [_Attempt(self.llm.stream(user_text, history))]
+        winner: _Attempt | None = None
+        try:
+            done, _ = await asyncio.wait({attempts[0].first}, timeout=policy.hedge_delay())
+            if not done:
+                if policy.budget.withdraw():
+                    policy.stats.hedged += 1
+                    attempts.append(_Attempt(self.llm.stream(user_text, history)))
+                else:
+                    policy.stats.budget_denied += 1
+
+            winner = await self._first_to_answer(attempts)
+            self._record_primary(attempts[0], winner, loop.time() - start)
+            if winner is not attempts[0]:
+                policy.stats.hedge_wins += 1
+            for attempt in attempts:
+                if attempt is not winner:
+                    await attempt.cancel()
+
+            token = winner.first.result()
+            if token is _EMPTY:
+                return
+            yield token
+            async for token in winner.stream:
+                yield token
+        finally:
+            for attempt in attempts:
+                if attempt is winner:
+                    await attempt.stream.aclose()
+                else:
+                    await attempt.cancel()
+
+    def _record_primary(self, primary: _Attempt, winner: _Attempt, elapsed: float) -> None:
+        """hedge 지연을 정하는 TTFT 표본은 항상 primary 요청 기준으로 넣는다.
+
+        이긴 hedge의 TTFT만 넣으면 느린 primary가 빠지면서 분위수가 점점 내려가 hedge가 잦아진다.
+        진 primary는 적어도 elapsed만큼 걸린 것이므로 그 값을 넣고, 실패한 primary는 표본에서 뺀다.
+        """
+        if winner is not primary:
+            if not primary.first.done():
+                self.policy.record_ttft(elapsed)
+            return
+        if primary.first.result() is not _EMPTY:
+            self.policy.record_ttft(elapsed)
+
+    @staticmethod
+    async def _first_to_answer(attempts: list[_Attempt]) -> _Attempt:
+        """첫 토큰(또는 빈 응답)을 먼저 준 시도. 모두 에러면 첫 번째 시도의 에러를 올린다."""
+        pending = {a.first: a for a in attempts}
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                attempt = pending.pop(task)
+                if task.exception() is None:
+                    return attempt
+        raise attempts[0].first.exception()
@@ -0,0 +1,84 @@
+from collections.abc import AsyncIterator
+
+import httpx
+
+
+class _MeteredStream(httpx.AsyncByteStream):
+    """응답 body가 닫힐 때(스트림을 끝까지 읽었거나 중간에 끊었을 때) 요청을 끝난 것으로 센다."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
+
+
+class MeteredTransport(httpx.AsyncBaseTransport):
+    """공유 커넥션 풀(AsyncHTTPTransport)을 감싸서 사용량을 센다 (/metrics용).
+
+    in_flight는 응답 body를 다 읽을 때까지 살아 있는 요청 수라서 LLM 스트리밍처럼
+    오래 열려 있는 요청도 그대로 잡힌다.
+    """
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, max_connections: int | None = None):
+        self._transport = transport
+        self.max_connections = max_connections
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self.errors += 1
+            self._release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_MeteredStream(response.stream, self._release),
+            extensions=response.extensions,
+        )
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+
+    def _connections(self) -> list:
+        # httpcore 풀을 직접 들여다본다. 구현이 바뀌어 못 찾으면 연결 수는 비워 둔다.
+        pool = getattr(self._transport, "_pool", None)
+        return list(getattr(pool, "connections", None) or [])
+
+    def stats(self) -> dict:
+        connections = self._connections()
+        idle = sum(1 for c in connections if c.is_idle())
+        active = len(connections) - idle
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "connections": len(connections),
+            "active_connections": active,
+            "idle_connections": idle,
+            "max_connections": self.max_connections,
+            "utilization": round(active / self.max_connections, 3) if self.max_connections else None,
+        }
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -4,13 +4,20 @@ from collections.abc import AsyncIterator
 
 import httpx
 
+from app.gateway.clients.sse import iter_sse_content
 from app.gateway.schemas.message import Message
+from app.shared.resilience import RETRYABLE_STATUS, CircuitOpenError, Upstream
 
 
 class LLMError(Exception):
-    """Base exception for LLM errors."""
+    """Base exception for LLM errors.
 
-    pass
+    retryable: 다시 보내면 성공할 수 있는 실패인지 (timeout, 네트워크, 429, 5xx).
+    """
+
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
 
 
 class BaseLLM(ABC):
@@ -52,6 +59,9 @@ class OpenAILLM(BaseLLM):
         system_prompt: str | None = None,
         temperature: float = 0.7,
         max_tokens: int = 1024,
+        client: httpx.AsyncClient | None = None,
+        base_url: str | None = None,
+        upstream: Upstream | None = None,
     ):
         if not api_key:
             raise ValueError("OpenAI API key is required")
@@ -60,56 +70,72 @@ class OpenAILLM(BaseLLM):
         self.system_prompt = system_prompt
         self.temperature = temperature
         self.max_tokens = max_tokens
+        # 공유 커넥션 풀 (lifespan이 소유하므로 여기서 닫지 않는다). 없으면 호출마다 새로 연다.
+        self._client = client
+        # OpenAI 호환 서버(로컬 stand-in 등)를 쓸 때만 바꾼다
+        self.chat_url = f"{base_url.rstrip('/')}/chat/completions" if base_url else self.OPENAI_CHAT_URL
+        # 공유 circuit breaker + 첫 토큰 전 재시도 (app.shared.resilience)
+        self.upstream = upstream
 
     async def stream(
         self, user_text: str, history: list[Message]
     ) -> AsyncIterator[str]:
         messages = self._build_messages(user_text, history)
-
+        if self.upstream is None:
+            async for token in self._attempt(messages):
+                yield token
+            return
+        try:
+            async for token in self.upstream.stream(lambda: self._attempt(messages)):
+                yield token
+        except CircuitOpenError as e:
+            raise LLMError(f"OpenAI unavailable: {e}") from e
+
+    async def _attempt(self, messages: list[dict[str, str]]) -> AsyncIterator[str]:
+        if self._client is not None:
+            async for token in self._stream(self._client, messages):
+                yield token
+            return
         async with httpx.AsyncClient(timeout=60.0) as client:
-            try:
-                async with client.stream(
-                    "POST",
-                    self.OPENAI_CHAT_URL,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": messages,
-                        "temperature": self.temperature,
-                        "max_tokens": self.max_tokens,
-                        "stream": True,
-                    },
-                ) as response:
-                    if response.status_code == 401:
-                        raise LLMError("Invalid OpenAI API key")
-                    elif response.status_code == 429:
-                        raise LLMError("OpenAI rate limit exceeded")
-                    elif response.status_code >= 400:
-                        raise LLMError(f"OpenAI API error: {response.status_code}")
-
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: "):
-                            data = line[6:]
-                            if data == "[DONE]":
-                                break
-                            try:
-                                import json
-
-                                chunk = json.loads(data)
-                                delta = chunk["choices"][0].get("delta", {})
-                                content = delta.get("content")
-                                if content:
-                                    yield content
-                            except (json.JSONDecodeError, KeyError, IndexError):
-                                continue
-
-            except httpx.TimeoutException as e:
-                raise LLMError("OpenAI API timeout") from e
-            except httpx.RequestError as e:
-                raise LLMError(f"Network error: {e}") from e
+            async for token in self._stream(client, messages):
+                yield token
+
+    async def _stream(
+        self, client: httpx.AsyncClient, messages: list[dict[str, str]]
+    ) -> AsyncIterator[str]:
+        try:
+            async with client.stream(
+                "POST",
+                self.chat_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": self.model,
+                    "messages": messages,
+                    "temperature": self.temperature,
+                    "max_tokens": self.max_tokens,
+                    "stream": True,
+                },
+            ) as response:
+                if response.status_code == 401:
+                    raise LLMError("Invalid OpenAI API key")
+                elif response.status_code == 429:
+                    raise LLMError("OpenAI rate limit exceeded", retryable=True)
+                elif response.status_code >= 400:
+                    raise LLMError(
+                        f"OpenAI API error: {response.status_code}",
+                        retryable=response.status_code in RETRYABLE_STATUS,
+                    )
+
+                async for content in iter_sse_content(response.aiter_bytes()):
+                    yield content
+
+        except httpx.TimeoutException as e:
+            raise LLMError("OpenAI API timeout", retryable=True) from e
+        except httpx.RequestError as e:
+            raise LLMError(f"Network error: {e}", retryable=True) from e
 
     def _build_messages(
         self, user_text: str, history: list[Message]
@@ -0,0 +1,99 @@
+"""OpenAI 스트리밍 응답(Server-Sent Events) 파서.
+
+응답 bytes를 받은 그대로 이어 붙여 줄 단위로 자르고, 빈 줄을 만나면 모아 둔 data: 필드들을
+하나의 이벤트로 내보낸다. 줄 단위 str 디코딩을 거치지 않고, content가 없는 청크(role, finish_reason)는
+JSON을 풀지 않고 건너뛴다.
+
+참고: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation
+"""
+import json
+from collections.abc import AsyncIterator
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson이 없으면 표준 json으로
+    _loads = json.loads
+
+DONE = b"[DONE]"
+_CONTENT_KEY = b'"content"'
+
+
+class SSEParser:
+    """bytes 청크를 받아 완성된 이벤트의 data를 돌려주는 incremental 파서.
+
+    - 여러 줄의 data: 필드는 "\\n"으로 이어 붙인다 (SSE 규칙)
+    - 주석(":")과 event/id/retry 필드는 무시한다
+    - 줄 끝은 "\\n"과 "\\r\\n"을 받는다
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._data: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        buf = self._buf
+        buf += chunk
+        events: list[bytes] = []
+        start = 0
+        while True:
+            end = buf.find(b"\n", start)
+            if end < 0:
+                break
+            line = buf[start:end]
+            start = end + 1
+            self._line(line, events)
+        if start:
+            del buf[:start]
+        return events
+
+    def flush(self) -> list[bytes]:
+        """스트림이 끝났을 때 마지막 줄/이벤트를 마저 내보낸다 (빈 줄 없이 끝나는 서버 대비)."""
+        events: list[bytes] = []
+        if self._buf:
+            self._line(self._buf, events)
+            self._buf = bytearray()
+        self._line(b"", events)
+        return events
+
+    def _line(self, line: bytes | bytearray, events: list[bytes]) -> None:
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        if not line:
+            if self._data:
+                data = self._data
+                events.append(data[0] if len(data) == 1 else b"\n".join(data))
+                self._data = []
+            return
+        if line.startswith(b"data:"):
+            value = line[6:] if line[5:6] == b" " else line[5:]
+            self._data.append(bytes(value))
+
+
+def delta_content(data: bytes) -> str | None:
+    """chat.completion.chunk에서 choices[0].delta.content만 꺼낸다. 없거나 깨진 청크면 None."""
+    if _CONTENT_KEY not in data:
+        return None
+    try:
+        return _loads(data)["choices"][0]["delta"].get("content")
+    except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+        return None
+
+
+async def iter_sse_content(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """응답 bytes 스트림에서 delta content만 순서대로 내보낸다. [DONE]에서 멈춘다."""
+    parser = SSEParser()
+    async for chunk in chunks:
+        for data in parser.feed(chunk):
+            if data == DONE:
+                return
+            content = delta_content(data)
+            if content:
+                yield content
+    for data in parser.flush():
+        if data == DONE:
+            return
+        content = delta_content(data)
+        if content:
+            yield content
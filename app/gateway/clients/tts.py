@@ -1,12 +1,32 @@
+import asyncio
+import itertools
+import json
+from collections.abc import AsyncIterator
+
 import httpx
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed, WebSocketException
+
+from app.shared.framing import STATUS_END, STATUS_ERROR, STATUS_FATAL, Frame, decode_frames
+from app.shared.logging import get_logger
+from app.shared.resilience import Upstream
+
+logger = get_logger(__name__)
 
 
 class TTSClient:
-    def __init__(self, base_url: str, voice: str = "alloy"):
+    def __init__(self, base_url: str, voice: str = "alloy", upstream: Upstream | None = None):
         self.base_url = base_url.rstrip("/")
         self.voice = voice
+        # 공유 circuit breaker + 재시도 (app.shared.resilience)
+        self.upstream = upstream
 
     async def synthesize(self, text: str, fmt: str = "wav") -> bytes:
+        if self.upstream is None:
+            return await self._synthesize_once(text, fmt)
+        return await self.upstream.call(lambda: self._synthesize_once(text, fmt))
+
+    async def _synthesize_once(self, text: str, fmt: str) -> bytes:
         async with httpx.AsyncClient(timeout=30.0) as client:
             r = await client.post(
                 f"{self.base_url}/tts",
@@ -14,3 +34,142 @@ class TTSClient:
             )
             r.raise_for_status()
             return r.content
+
+    async def warm(
+        self, texts: list[str], fmt: str = "wav", budget_ms: int = 30000, group: str | None = None
+    ) -> dict:
+        """phrase들을 TTS 쪽 warm store에 미리 합성해 둔다. 결과 카운트(dict)를 돌려준다.
+
+        group을 주면 그 group에 고정된 phrase 목록을 texts로 바꾼다 (빠진 phrase는 고정이 풀린다).
+        """
+        phrases = [{"text": t, "format": fmt, "voice": self.voice} for t in texts]
+        body = {"phrases": phrases, "budget_ms": budget_ms}
+        if group is not None:
+            body["group"] = group
+        async with httpx.AsyncClient(timeout=budget_ms / 1000 + 5.0) as client:
+            r = await client.post(f"{self.base_url}/tts/warm", json=body)
+            r.raise_for_status()
+            return r.json()
+
+
+class TTSChannelError(Exception):
+    """The TTS channel failed a request or lost its connection.
+
+    retryable: 다시 보내면 성공할 수 있는 실패인지 (연결 끊김/실패, 서버 쪽 합성 실패나 부하 거절).
+    """
+
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class TTSChannel:
+    """TTS 서비스의 /ws/tts 와 맺는 장기 WebSocket 연결 하나를 여러 요청이 같이 쓴다.
+
+    요청마다 id를 붙여 보내고, 돌아오는 frame(app.shared.framing)의 index로 요청별
+    큐에 나눠 담는다. 연결은 첫 요청 때 맺고, 끊기면 다음 요청 때 다시 맺는다.
+    """
+
+    def __init__(self, url: str, max_inflight: int = 16, open_timeout: float = 5.0):
+        self.url = url
+        self.open_timeout = open_timeout
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self._ws: ClientConnection | None = None
+        self._reader: asyncio.Task | None = None
+        self._connect_lock = asyncio.Lock()
+        self._pending: dict[int, asyncio.Queue[Frame | None]] = {}
+        self._ids = itertools.count()
+
+    async def _connection(self) -> ClientConnection:
+        async with self._connect_lock:
+            if self._ws is None:
+                self._ws = await connect(self.url, max_size=None, open_timeout=self.open_timeout)
+                self._reader = asyncio.create_task(self._read_loop(self._ws))
+                logger.info("tts_channel_connected", url=self.url)
+            return self._ws
+
+    async def _read_loop(self, ws: ClientConnection) -> None:
+        try:
+            async for message in ws:
+                if isinstance(message, str):
+                    continue
+                for frame in decode_frames(message):
+                    queue = self._pending.get(frame.index)
+                    if queue is not None:
+                        queue.put_nowait(frame)
+        except ConnectionClosed:
+            pass
+        finally:
+            if self._ws is ws:
+                self._ws = None
+            logger.warning("tts_channel_disconnected", url=self.url, pending=len(self._pending))
+            # 진행 중이던 요청들을 깨워서 실패로 끝낸다
+            for queue in self._pending.values():
+                queue.put_nowait(None)
+
+    async def stream(self, text: str, voice: str, fmt: str = "wav") -> AsyncIterator[bytes]:
+        """오디오가 만들어지는 대로 청크를 yield 한다."""
+        async with self._inflight:
+            try:
+                ws = await self._connection()
+            except (OSError, TimeoutError, WebSocketException) as e:
+                raise TTSChannelError(f"TTS channel connect failed: {e}", retryable=True) from e
+            req_id = next(self._ids)
+            queue: asyncio.Queue[Frame | None] = asyncio.Queue()
+            self._pending[req_id] = queue
+            finished = False
+            try:
+                await ws.send(json.dumps({"id": req_id, "text": text, "voice": voice, "format": fmt}))
+                while True:
+                    frame = await queue.get()
+                    if frame is None:
+                        finished = True
+                        raise TTSChannelError("TTS channel closed", retryable=True)
+                    if frame.status == STATUS_END:
+                        finished = True
+                        return
+                    if frame.status in (STATUS_ERROR, STATUS_FATAL):
+                        finished = True
+                        # ERROR는 HTTP의 5xx/503 (합성 실패, admission 거절), FATAL은 4xx에 해당한다 (검증 실패 등)
+                        raise TTSChannelError(frame.payload.decode("utf-8"), retryable=frame.status == STATUS_ERROR)
+                    yield frame.payload
+            except ConnectionClosed as e:
+                finished = True
+                raise TTSChannelError("TTS channel closed", retryable=True) from e
+            finally:
+                self._pending.pop(req_id, None)
+                if not finished:
+                    # 소비자가 중간에 그만두면 서버 쪽 합성도 취소한다
+                    try:
+                        await ws.send(json.dumps({"id": req_id, "cancel": True}))
+                    except ConnectionClosed:
+                        pass
+
+    async def synthesize(self, text: str, voice: str, fmt: str = "wav") -> bytes:
+        return b"".join([chunk async for chunk in self.stream(text, voice, fmt)])
+
+    async def aclose(self) -> None:
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+
+
+class TTSChannelClient:
+    """TTSClient와 같은 인터페이스로 공유 TTSChannel을 쓰는 캐릭터별 클라이언트."""
+
+    def __init__(self, channel: TTSChannel, voice: str = "alloy", upstream: Upstream | None = None):
+        self.channel = channel
+        self.voice = voice
+        # HTTP 경로(TTSClient)와 같은 circuit breaker + 재시도 (app.shared.resilience)
+        self.upstream = upstream
+
+    async def synthesize(self, text: str, fmt: str = "wav") -> bytes:
+        if self.upstream is None:
+            return await self.channel.synthesize(text, self.voice, fmt)
+        return await self.upstream.call(lambda: self.channel.synthesize(text, self.voice, fmt))
+
+    def stream(self, text: str, fmt: str = "wav") -> AsyncIterator[bytes]:
+        if self.upstream is None:
+            return self.channel.stream(text, self.voice, fmt)
+        return self.upstream.stream(lambda: self.channel.stream(text, self.voice, fmt))
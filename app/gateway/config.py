@@ -5,6 +5,21 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
     TTS_URL: str | None = None
+    # TTS transport: "http" (요청마다 POST /tts) | "ws" (공유 WebSocket 채널 /ws/tts)
+    TTS_TRANSPORT: str = "http"
+    TTS_WS_URL: str | None = None  # 비어 있으면 TTS_URL에서 유도
+    TTS_WS_MAX_INFLIGHT: int = 16
+    # Orchestrator TTS pipeline: 턴당 동시 합성 segment 수 / 프로세스 전체 동시 합성 수
+    TTS_PIPELINE_DEPTH: int = 3
+    TTS_PIPELINE_MAX_INFLIGHT: int = 64
+    # TTS segmenter 기본값 (캐릭터별 segmenter 설정으로 덮어쓸 수 있음)
+    SEGMENTER_MAX_CHARS: int = 60
+    SEGMENTER_MIN_CHARS: int = 0
+    SEGMENTER_FIRST_MAX_WORDS: int = 8
+    SEGMENTER_FIRST_CLAUSE_MIN_CHARS: int = 12
+    # LLM 히스토리 토큰 상한 (요약 포함, 캐릭터별 history_token_budget으로 덮어쓸 수 있음, 0이면 끔)
+    HISTORY_TOKEN_BUDGET: int = 2000
+    HISTORY_SUMMARY_TOKENS: int = 200
     DATABASE_URL: str | None = None
     CACHE_URL: str | None = None
 
@@ -17,9 +32,75 @@ class Settings(BaseSettings):
     OPENAI_LLM_TEMPERATURE: float = 0.7
     OPENAI_LLM_MAX_TOKENS: int = 1024
     OPENAI_LLM_SYSTEM_PROMPT: str | None = None
+    OPENAI_BASE_URL: str | None = None  # OpenAI 호환 서버 (예: 로컬 stand-in http://localhost:8002/v1)
+    # LLM HTTP connection pool (lifespan 동안 하나만 만들고 모든 OpenAILLM이 공유)
+    LLM_HTTP_TIMEOUT: float = 60.0  # read/write/pool 대기
+    LLM_HTTP_CONNECT_TIMEOUT: float = 5.0
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    LLM_HTTP2: bool = False  # requires `h2` (pip install "httpx[http2]")
+    # 업스트림 장애 대응: 첫 바이트 전 실패(timeout/429/5xx)만 jitter 있는 지수 backoff로 재시도,
+    # 연속 실패가 THRESHOLD번이면 breaker를 열고 RESET_MS 동안 바로 실패시킨다 (FAST_FAIL=False면 기록만)
+    LLM_RETRY_MAX_ATTEMPTS: int = 3
+    LLM_RETRY_BASE_DELAY_MS: int = 200
+    LLM_RETRY_MAX_DELAY_MS: int = 2000
+    LLM_BREAKER_THRESHOLD: int = 5
+    LLM_BREAKER_RESET_MS: int = 10000
+    LLM_BREAKER_FAST_FAIL: bool = True
+    TTS_RETRY_MAX_ATTEMPTS: int = 2
+    TTS_RETRY_BASE_DELAY_MS: int = 100
+    TTS_RETRY_MAX_DELAY_MS: int = 1000
+    TTS_BREAKER_THRESHOLD: int = 5
+    TTS_BREAKER_RESET_MS: int = 5000
+    TTS_BREAKER_FAST_FAIL: bool = True
+    # LLM hedging: 첫 토큰이 지연(또는 최근 TTFT의 percentile)을 넘으면 같은 요청을 한 번 더 보낸다
+    LLM_HEDGE_ENABLED: bool = False
+    LLM_HEDGE_DELAY_MS: int = 1000  # percentile 표본이 모이기 전/percentile=0일 때의 고정 지연
+    LLM_HEDGE_PERCENTILE: float = 95.0  # 0이면 고정 지연만 사용
+    LLM_HEDGE_MIN_DELAY_MS: int = 100
+    LLM_HEDGE_MIN_SAMPLES: int = 20
+    LLM_HEDGE_WINDOW: int = 200  # percentile 계산에 쓰는 최근 TTFT 수
+    LLM_HEDGE_BUDGET_RATIO: float = 0.05  # hedge는 장기적으로 요청의 5%까지
+    LLM_HEDGE_BUDGET_BURST: float = 5.0
+    # LLM 응답 캐시 (캐릭터별 llm_cache=true이고 OPENAI_LLM_TEMPERATURE가 0일 때만 사용)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_ENTRIES: int = 1000
+    LLM_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+    LLM_CACHE_TTL_SECONDS: int = 3600
+    LLM_CACHE_REPLAY: str = "paced"  # "paced" (녹화된 토큰 간격) | "instant"
+    LLM_CACHE_MAX_GAP_MS: int = 200  # paced replay에서 토큰 간격 상한
+
+    # Client WebSocket: 연속 token 이벤트를 묶어서 보낸다 (첫 token은 즉시, 기본 0 = 비활성, 예: 20)
+    WS_TOKEN_COALESCE_MS: int = 0
+    WS_TOKEN_COALESCE_BYTES: int = 256
+    # 느린 클라이언트: 이벤트 큐 크기와 꽉 찼을 때 정책 ("pause" | "drop_tokens" | "disconnect")
+    WS_EVENT_QUEUE_SIZE: int = 64
+    WS_SLOW_CONSUMER_POLICY: str = "pause"
+    WS_SLOW_CONSUMER_TIMEOUT_MS: int = 5000  # disconnect 정책에서 기다리는 시간
+    TTS_TEXT_QUEUE_SIZE: int = 16  # LLM -> TTS segment 큐 (차면 LLM 읽기를 멈춘다)
+    # 한 연결에서 동시에 돌릴 수 있는 턴(세션) 수 / 턴별 송신 대기 이벤트 수
+    WS_MAX_CONCURRENT_TURNS: int = 8
+    WS_STREAM_BUFFER_EVENTS: int = 8
+
+    # TTS warm-up (시작 시 / 캐릭터 변경 시 인사말과 filler를 미리 합성)
+    WARMUP_ENABLED: bool = True
+    WARMUP_FILLER_PHRASES: list[str] = ["Hmm.", "Okay.", "Let me think."]
+    WARMUP_MAX_CHARACTERS: int = 20  # 최근 수정 순
+    WARMUP_BUDGET_MS: int = 30000
+    WARMUP_CONCURRENCY: int = 4
+    WARMUP_FORMAT: str = "wav"
 
     # Logging
     LOG_JSON: bool = True  # False for colored console output (dev)
 
 
+    @property
+    def tts_ws_url(self) -> str:
+        if self.TTS_WS_URL:
+            return self.TTS_WS_URL
+        base = (self.TTS_URL or "").rstrip("/")
+        return base.replace("https://", "wss://", 1).replace("http://", "ws://", 1) + "/ws/tts"
+
+
 settings = Settings()
@@ -1,5 +1,7 @@
+import asyncio
 from contextlib import asynccontextmanager
 
+import httpx
 from fastapi import Depends
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,11 +9,128 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.gateway.config import settings
 from app.gateway.db import SessionLocal, cache
 from app.gateway.services.orchestrator import Orchestrator
+from app.gateway.services.backpressure import BufferRegistry, ConnectionBuffer
+from app.gateway.services.history import HistoryBudget
+from app.gateway.services.llm_cache import CachedLLM, LLMResponseCache
+from app.gateway.services.segmenter import SegmenterConfig
 from app.gateway.services.turn import TurnService
+from app.gateway.services.warmup import WarmupService
+from app.gateway.clients.hedge import HedgeBudget, HedgedLLM, HedgePolicy
+from app.gateway.clients.http_pool import MeteredTransport
 from app.gateway.clients.llm import BaseLLM, MockLLM, OpenAILLM
-from app.gateway.clients.tts import TTSClient
+from app.gateway.clients.tts import TTSChannel, TTSChannelClient, TTSClient
 from app.gateway.clients.cache import CacheClient
 from app.gateway.models.character import Character
+from app.shared.resilience import CircuitBreaker, RetryPolicy, Upstream
+
+
+# Shared TTS channel (TTS_TRANSPORT=ws). 첫 요청 때 연결하고 lifespan 종료 시 닫는다.
+tts_channel: TTSChannel | None = (
+    TTSChannel(settings.tts_ws_url, max_inflight=settings.TTS_WS_MAX_INFLIGHT)
+    if settings.TTS_TRANSPORT == "ws"
+    else None
+)
+
+
+def build_llm_http_transport() -> MeteredTransport:
+    """Keep-alive (HTTP/2 가능) connection pool shared by every OpenAILLM stream."""
+    return MeteredTransport(
+        httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+            ),
+            http2=settings.LLM_HTTP2,
+        ),
+        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+    )
+
+
+def build_llm_http_client(transport: MeteredTransport) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(settings.LLM_HTTP_TIMEOUT, connect=settings.LLM_HTTP_CONNECT_TIMEOUT),
+    )
+
+
+# Shared LLM HTTP client (LLM_PROVIDER=openai). 캐릭터별 OpenAILLM도 모두 이 풀을 쓰고 lifespan 종료 시 닫는다.
+llm_http_transport: MeteredTransport | None = (
+    build_llm_http_transport() if settings.LLM_PROVIDER == "openai" else None
+)
+llm_http_client: httpx.AsyncClient | None = (
+    build_llm_http_client(llm_http_transport) if llm_http_transport is not None else None
+)
+
+
+# 업스트림별 circuit breaker + 재시도 정책 (프로세스 공유, /metrics에 상태 노출)
+llm_upstream = Upstream(
+    CircuitBreaker(
+        "openai_llm",
+        failure_threshold=settings.LLM_BREAKER_THRESHOLD,
+        reset_timeout_s=settings.LLM_BREAKER_RESET_MS / 1000,
+        fast_fail=settings.LLM_BREAKER_FAST_FAIL,
+    ),
+    RetryPolicy(
+        max_attempts=settings.LLM_RETRY_MAX_ATTEMPTS,
+        base_delay_s=settings.LLM_RETRY_BASE_DELAY_MS / 1000,
+        max_delay_s=settings.LLM_RETRY_MAX_DELAY_MS / 1000,
+    ),
+)
+tts_upstream = Upstream(
+    CircuitBreaker(
+        "tts",
+        failure_threshold=settings.TTS_BREAKER_THRESHOLD,
+        reset_timeout_s=settings.TTS_BREAKER_RESET_MS / 1000,
+        fast_fail=settings.TTS_BREAKER_FAST_FAIL,
+    ),
+    RetryPolicy(
+        max_attempts=settings.TTS_RETRY_MAX_ATTEMPTS,
+        base_delay_s=settings.TTS_RETRY_BASE_DELAY_MS / 1000,
+        max_delay_s=settings.TTS_RETRY_MAX_DELAY_MS / 1000,
+    ),
+)
+
+
+# LLM hedging 정책 (예산과 TTFT 기록은 프로세스 전체가 공유)
+llm_hedge_policy: HedgePolicy | None = (
+    HedgePolicy(
+        delay_s=settings.LLM_HEDGE_DELAY_MS / 1000,
+        budget=HedgeBudget(ratio=settings.LLM_HEDGE_BUDGET_RATIO, burst=settings.LLM_HEDGE_BUDGET_BURST),
+        percentile=settings.LLM_HEDGE_PERCENTILE,
+        min_delay_s=settings.LLM_HEDGE_MIN_DELAY_MS / 1000,
+        min_samples=settings.LLM_HEDGE_MIN_SAMPLES,
+        window=settings.LLM_HEDGE_WINDOW,
+    )
+    if settings.LLM_HEDGE_ENABLED
+    else None
+)
+
+
+def with_hedging(llm: BaseLLM) -> BaseLLM:
+    if llm_hedge_policy is None:
+        return llm
+    return HedgedLLM(llm, llm_hedge_policy)
+
+
+# 캐릭터별로 켜는 LLM 응답 캐시 (프로세스 공유)
+llm_response_cache: LLMResponseCache | None = (
+    LLMResponseCache(
+        max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        max_bytes=settings.LLM_CACHE_MAX_BYTES,
+        ttl_s=settings.LLM_CACHE_TTL_SECONDS,
+    )
+    if settings.LLM_CACHE_ENABLED
+    else None
+)
+
+
+# 모든 턴이 공유하는 TTS 합성 슬롯 (TTS_PIPELINE_DEPTH는 턴당 상한)
+tts_slots = asyncio.Semaphore(settings.TTS_PIPELINE_MAX_INFLIGHT)
+
+
+# 연결별로 gateway에 쌓여 있는 이벤트 양 (/metrics)
+connection_buffers = BufferRegistry()
 
 
 # DB session (for FastAPI Depends)
@@ -27,6 +146,22 @@ async def get_db_context() -> AsyncSession:
         yield session
 
 
+# TTS warm-up (TTS_URL이 있어야 /tts/warm을 부를 수 있다)
+warmup_service: WarmupService | None = (
+    WarmupService(
+        tts_factory=lambda voice: TTSClient(base_url=settings.TTS_URL, voice=voice),
+        session_factory=get_db_context,
+        filler_phrases=settings.WARMUP_FILLER_PHRASES,
+        budget_s=settings.WARMUP_BUDGET_MS / 1000,
+        concurrency=settings.WARMUP_CONCURRENCY,
+        max_characters=settings.WARMUP_MAX_CHARACTERS,
+        fmt=settings.WARMUP_FORMAT,
+    )
+    if settings.WARMUP_ENABLED and settings.TTS_URL
+    else None
+)
+
+
 # Cache
 async def get_cache() -> Redis:
     return cache
@@ -47,13 +182,16 @@ def get_llm() -> BaseLLM:
     if settings.LLM_PROVIDER == "openai":
         if not settings.OPENAI_API_KEY:
             raise RuntimeError("OPENAI_API_KEY is required when LLM_PROVIDER=openai")
-        return OpenAILLM(
+        return with_hedging(OpenAILLM(
             api_key=settings.OPENAI_API_KEY,
             model=settings.OPENAI_LLM_MODEL,
             system_prompt=settings.OPENAI_LLM_SYSTEM_PROMPT,
             temperature=settings.OPENAI_LLM_TEMPERATURE,
             max_tokens=settings.OPENAI_LLM_MAX_TOKENS,
-        )
+            client=llm_http_client,
+            base_url=settings.OPENAI_BASE_URL,
+            upstream=llm_upstream,
+        ))
     return MockLLM()
 
 
@@ -62,29 +200,79 @@ def create_llm_for_character(character: Character) -> BaseLLM:
     if settings.LLM_PROVIDER == "openai":
         if not settings.OPENAI_API_KEY:
             raise RuntimeError("OPENAI_API_KEY is required when LLM_PROVIDER=openai")
-        return OpenAILLM(
+        llm = with_hedging(OpenAILLM(
             api_key=settings.OPENAI_API_KEY,
             model=character.model,
             system_prompt=character.system_prompt,
             temperature=settings.OPENAI_LLM_TEMPERATURE,
             max_tokens=settings.OPENAI_LLM_MAX_TOKENS,
-        )
+            client=llm_http_client,
+            base_url=settings.OPENAI_BASE_URL,
+            upstream=llm_upstream,
+        ))
+        # 응답이 매번 같은 설정에서만 캐시한다
+        if character.llm_cache and llm_response_cache is not None and settings.OPENAI_LLM_TEMPERATURE == 0:
+            return CachedLLM(
+                llm,
+                llm_response_cache,
+                model=character.model,
+                system_prompt=character.system_prompt,
+                temperature=settings.OPENAI_LLM_TEMPERATURE,
+                replay=settings.LLM_CACHE_REPLAY,
+                max_gap_s=settings.LLM_CACHE_MAX_GAP_MS / 1000,
+            )
+        return llm
     return MockLLM()
 
 
-def create_tts_for_character(character: Character) -> TTSClient:
+def create_tts_for_character(character: Character) -> TTSClient | TTSChannelClient:
     """Create TTS client with character-specific voice."""
-    return TTSClient(base_url=settings.TTS_URL, voice=character.voice)
+    if tts_channel is not None:
+        return TTSChannelClient(tts_channel, voice=character.voice, upstream=tts_upstream)
+    return TTSClient(base_url=settings.TTS_URL, voice=character.voice, upstream=tts_upstream)
+
+
+default_segmenter_config = SegmenterConfig(
+    max_chars=settings.SEGMENTER_MAX_CHARS,
+    min_chars=settings.SEGMENTER_MIN_CHARS,
+    first_max_words=settings.SEGMENTER_FIRST_MAX_WORDS,
+    first_clause_min_chars=settings.SEGMENTER_FIRST_CLAUSE_MIN_CHARS,
+)
+
+
+def history_budget_for_character(character: Character) -> HistoryBudget | None:
+    max_tokens = character.history_token_budget
+    if max_tokens is None:
+        max_tokens = settings.HISTORY_TOKEN_BUDGET
+    if max_tokens <= 0:
+        return None
+    return HistoryBudget(max_tokens=max_tokens, summary_tokens=settings.HISTORY_SUMMARY_TOKENS)
 
 
 def create_orchestrator_for_character(
     character: Character,
     cache_client: CacheClient,
+    binary_audio: bool = False,
+    buffer: ConnectionBuffer | None = None,
 ) -> Orchestrator:
     """Create orchestrator with character-specific LLM and TTS."""
     llm = create_llm_for_character(character)
     tts = create_tts_for_character(character)
-    return Orchestrator(cache_client=cache_client, llm=llm, tts=tts)
+    return Orchestrator(
+        cache_client=cache_client,
+        llm=llm,
+        tts=tts,
+        binary_audio=binary_audio,
+        tts_depth=settings.TTS_PIPELINE_DEPTH,
+        tts_slots=tts_slots,
+        segmenter_config=default_segmenter_config.with_overrides(character.segmenter),
+        event_queue_size=settings.WS_EVENT_QUEUE_SIZE,
+        tts_text_queue_size=settings.TTS_TEXT_QUEUE_SIZE,
+        slow_policy=settings.WS_SLOW_CONSUMER_POLICY,
+        slow_timeout_s=settings.WS_SLOW_CONSUMER_TIMEOUT_MS / 1000,
+        buffer=buffer,
+        history_budget=history_budget_for_character(character),
+    )
 
 
 # Services
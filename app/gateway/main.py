@@ -7,8 +7,10 @@ from app.gateway.api.health import router as health_router
 from app.gateway.api.sessions import router as sessions_router
 from app.gateway.api.turns import router as turns_router
 from app.gateway.api.characters import router as characters_router
+from app.gateway.api.metrics import router as metrics_router
 from app.shared.logging import setup_logging, get_logger
 from app.gateway.config import settings
+from app.gateway.dependencies import llm_http_client, tts_channel, warmup_service
 
 # Initialize structured logging
 setup_logging(json_format=settings.LOG_JSON)
@@ -18,8 +20,16 @@ logger = get_logger(__name__)
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
-    logger.info("gateway_started", port=8000)
+    logger.info("gateway_started", port=8000, tts_transport=settings.TTS_TRANSPORT)
+    if warmup_service is not None:
+        warmup_service.schedule_all()
     yield
+    if warmup_service is not None:
+        await warmup_service.aclose()
+    if tts_channel is not None:
+        await tts_channel.aclose()
+    if llm_http_client is not None:
+        await llm_http_client.aclose()
     logger.info("gateway_shutdown")
 
 
@@ -37,4 +47,5 @@ app.include_router(ws_router)
 app.include_router(health_router)
 app.include_router(sessions_router)
 app.include_router(turns_router)
-app.include_router(characters_router)
\ No newline at end of file
+app.include_router(characters_router)
+app.include_router(metrics_router)
\ No newline at end of file
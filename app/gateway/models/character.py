@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Integer, String, Text, DateTime
+from sqlalchemy import JSON, Boolean, Integer, String, Text, DateTime, false
 from sqlalchemy.orm import Mapped, mapped_column
 from app.shared.db_base import Base
 
@@ -12,5 +12,12 @@ class Character(Base):
     system_prompt: Mapped[str] = mapped_column(Text, nullable=False, default="You are a helpful assistant.")
     model: Mapped[str] = mapped_column(String(50), nullable=False, default="gpt-4o-mini")
     voice: Mapped[str] = mapped_column(String(20), nullable=False, default="alloy")
+    greeting: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # TTS segmenter 설정 덮어쓰기 (SegmenterConfig 필드명 -> 값), None이면 기본값
+    segmenter: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # 같은 질문에 대한 LLM 응답 캐시 사용 여부 (temperature 0일 때만 적용)
+    llm_cache: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false(), nullable=False)
+    # LLM 히스토리 토큰 상한, None이면 HISTORY_TOKEN_BUDGET
+    history_token_budget: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import String, DateTime, Integer, Text, ForeignKey
+from sqlalchemy import Boolean, String, DateTime, Integer, Text, ForeignKey, false
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.shared.db_base import Base
@@ -23,5 +23,8 @@ class Turn(Base):
     ttft_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     ttaf_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # 사용자가 끼어들어(barge-in) 중간에 끊긴 턴이면 True, assistant_text는 그때까지의 부분 텍스트
+    interrupted: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false(), nullable=False)
+
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -11,12 +11,20 @@ async def create_character(
     system_prompt: str = "You are a helpful assistant.",
     model: str = "gpt-4o-mini",
     voice: str = "alloy",
+    greeting: str | None = None,
+    segmenter: dict | None = None,
+    llm_cache: bool = False,
+    history_token_budget: int | None = None,
 ) -> int:
     character = Character(
         name=name,
         system_prompt=system_prompt,
         model=model,
         voice=voice,
+        greeting=greeting,
+        segmenter=segmenter,
+        llm_cache=llm_cache,
+        history_token_budget=history_token_budget,
     )
     db.add(character)
     await db.flush()
@@ -43,6 +51,10 @@ async def update_character(
     system_prompt: str | None = None,
     model: str | None = None,
     voice: str | None = None,
+    greeting: str | None = None,
+    segmenter: dict | None = None,
+    llm_cache: bool | None = None,
+    history_token_budget: int | None = None,
 ) -> bool:
     values: dict = {"updated_at": datetime.now(timezone.utc)}
     if name is not None:
@@ -53,6 +65,14 @@ async def update_character(
         values["model"] = model
     if voice is not None:
         values["voice"] = voice
+    if greeting is not None:
+        values["greeting"] = greeting
+    if segmenter is not None:
+        values["segmenter"] = segmenter
+    if llm_cache is not None:
+        values["llm_cache"] = llm_cache
+    if history_token_budget is not None:
+        values["history_token_budget"] = history_token_budget
 
     result = await db.execute(
         update(Character).where(Character.id == character_id).values(**values)
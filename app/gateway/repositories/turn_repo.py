@@ -23,11 +23,17 @@ async def set_ttaf(db: AsyncSession, turn_id: int, ttaf_ms: int) -> None:
     )
     await db.commit()
 
-async def finalize_turn(db: AsyncSession, turn_id: int, assistant_text: str | None) -> None:
+async def finalize_turn(
+    db: AsyncSession, turn_id: int, assistant_text: str | None, interrupted: bool = False
+) -> None:
     await db.execute(
         update(Turn)
         .where(Turn.id == turn_id)
-        .values(assistant_text=assistant_text, completed_at=datetime.now(timezone.utc))
+        .values(
+            assistant_text=assistant_text,
+            completed_at=datetime.now(timezone.utc),
+            interrupted=interrupted,
+        )
     )
     await db.commit()
 
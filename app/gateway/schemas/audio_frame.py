@@ -0,0 +1,40 @@
+"""Binary audio frames for the client WebSocket (/ws) in binary mode.
+
+A client that negotiates binary mode (subprotocol ``rc.audio.v1`` or the
+``?audio=binary`` query parameter) receives each audio chunk as one binary
+WebSocket message instead of a base64 ``audio_chunk`` JSON event::
+
+    version: uint8 | format: uint8 | turn_id: uint32 | seq: uint32 | audio...
+
+All integers are big-endian. Token/control events (token, done, error) are
+still sent as JSON text messages.
+"""
+import struct
+from dataclasses import dataclass
+
+AUDIO_FRAME_HEADER = struct.Struct(">BBII")
+AUDIO_FRAME_VERSION = 1
+
+BINARY_SUBPROTOCOL = "rc.audio.v1"
+
+FORMAT_CODES = {"wav": 1, "mp3": 2, "opus": 3, "aac": 4, "flac": 5, "pcm": 6}
+FORMAT_NAMES = {code: name for name, code in FORMAT_CODES.items()}
+
+
+@dataclass
+class AudioFrame:
+    turn_id: int
+    seq: int
+    format: str
+    audio: bytes
+
+
+def encode_audio_frame(turn_id: int, seq: int, fmt: str, audio: bytes) -> bytes:
+    return AUDIO_FRAME_HEADER.pack(AUDIO_FRAME_VERSION, FORMAT_CODES[fmt], turn_id, seq) + audio
+
+
+def decode_audio_frame(data: bytes) -> AudioFrame:
+    version, code, turn_id, seq = AUDIO_FRAME_HEADER.unpack_from(data)
+    if version != AUDIO_FRAME_VERSION:
+        raise ValueError(f"unsupported audio frame version {version}")
+    return AudioFrame(turn_id, seq, FORMAT_NAMES[code], data[AUDIO_FRAME_HEADER.size:])
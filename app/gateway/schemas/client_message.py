@@ -0,0 +1,52 @@
+"""Messages a client sends on the gateway WebSocket (/ws).
+
+    {"sessionId": "...", "text": "..."}        start a turn in that session
+    {"type": "cancel", "sessionId": "..."?}     cancel one session's turn (or all)
+
+A malformed message raises ClientMessageError, which carries the sessionId when
+the message had a usable one so the error can be routed to that session.
+"""
+import json
+from typing import Literal
+
+from pydantic import BaseModel, Field, ValidationError
+
+
+class ClientMessageError(ValueError):
+    """The client message could not be parsed or validated."""
+
+    def __init__(self, message: str, session_id: str | None = None):
+        super().__init__(message)
+        self.session_id = session_id
+
+
+class ChatMessage(BaseModel):
+    sessionId: str = Field(min_length=1)
+    text: str
+
+
+class CancelMessage(BaseModel):
+    type: Literal["cancel"]
+    sessionId: str | None = None
+
+
+def parse_client_message(raw: str) -> ChatMessage | CancelMessage:
+    # 제어 문자 제거
+    clean = "".join(ch for ch in raw if ch >= " ").strip()
+    try:
+        msg = json.loads(clean)
+    except json.JSONDecodeError as e:
+        raise ClientMessageError(f"invalid JSON: {e}") from e
+    if not isinstance(msg, dict):
+        raise ClientMessageError("message must be a JSON object")
+
+    session_id = msg.get("sessionId")
+    if not isinstance(session_id, str) or not session_id:
+        session_id = None
+    model = CancelMessage if msg.get("type") == "cancel" else ChatMessage
+    try:
+        return model.model_validate(msg)
+    except ValidationError as e:
+        err = e.errors()[0]
+        field = ".".join(str(part) for part in err["loc"])
+        raise ClientMessageError(f"invalid message: {field}: {err['msg']}", session_id) from e
@@ -0,0 +1,137 @@
+import asyncio
+import itertools
+from dataclasses import asdict, dataclass
+
+# 클라이언트가 느려서 이벤트 큐가 찼을 때의 정책
+POLICY_PAUSE = "pause"  # put이 막히면서 LLM 읽기도 멈춘다
+POLICY_DROP_TOKENS = "drop_tokens"  # token 이벤트는 버리고(done에 전체 텍스트가 있음) 오디오는 기다린다
+POLICY_DISCONNECT = "disconnect"  # timeout 동안 못 넣으면 SlowConsumerError
+POLICIES = {POLICY_PAUSE, POLICY_DROP_TOKENS, POLICY_DISCONNECT}
+
+
+class SlowConsumerError(Exception):
+    """The client did not drain its events within the allowed time."""
+
+    pass
+
+
+def event_bytes(event: dict) -> int:
+    """이벤트가 큐에 잡고 있는 대략적인 payload 크기."""
+    payload = event.get("audio") or event.get("data") or event.get("text") or ""
+    return len(payload)
+
+
+@dataclass
+class ConnectionBuffer:
+    """WebSocket 연결 하나가 gateway 메모리에 쌓아 둔 이벤트 양.
+
+    이벤트 큐, coalescer, FairSender의 stream 큐를 거쳐 소켓으로 실제로 보낼 때까지 센다.
+    """
+
+    connection_id: int
+    buffered_bytes: int = 0
+    buffered_events: int = 0
+    peak_bytes: int = 0
+    dropped_tokens: int = 0
+
+    def add(self, n: int) -> None:
+        self.buffered_bytes += n
+        self.buffered_events += 1
+        self.peak_bytes = max(self.peak_bytes, self.buffered_bytes)
+
+    def remove(self, n: int) -> None:
+        self.buffered_bytes -= n
+        self.buffered_events -= 1
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class BufferRegistry:
+    """살아 있는 연결들의 ConnectionBuffer 모음 (/metrics용)."""
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._buffers: dict[int, ConnectionBuffer] = {}
+
+    def open(self) -> ConnectionBuffer:
+        buffer = ConnectionBuffer(connection_id=next(self._ids))
+        self._buffers[buffer.connection_id] = buffer
+        return buffer
+
+    def close(self, buffer: ConnectionBuffer) -> None:
+        self._buffers.pop(buffer.connection_id, None)
+
+    def to_dict(self) -> dict:
+        buffers = list(self._buffers.values())
+        return {
+            "connections": len(buffers),
+            "buffered_bytes": sum(b.buffered_bytes for b in buffers),
+            "dropped_tokens": sum(b.dropped_tokens for b in buffers),
+            "per_connection": [b.to_dict() for b in buffers],
+        }
+
+
+class _Failed:
+    """소비자에게 넘길 producer 쪽 예외 (큐에 이벤트 대신 들어간다)."""
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+class BoundedEventQueue:
+    """Orchestrator -> 소켓 사이의 이벤트 큐. 크기가 정해져 있고, 꽉 찼을 때 policy대로 동작한다."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        policy: str = POLICY_PAUSE,
+        timeout_s: float = 5.0,
+        buffer: ConnectionBuffer | None = None,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown slow consumer policy: {policy}")
+        self.policy = policy
+        self.timeout_s = timeout_s
+        self.buffer = buffer or ConnectionBuffer(connection_id=0)
+        self._q: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._failed = False
+
+    async def put(self, event: dict) -> None:
+        if self.policy == POLICY_DROP_TOKENS and event["type"] == "token" and self._q.full():
+            self.buffer.dropped_tokens += 1
+            return
+        if self.policy == POLICY_DISCONNECT:
+            try:
+                await asyncio.wait_for(self._q.put(event), self.timeout_s)
+            except TimeoutError:
+                exc = SlowConsumerError(f"client did not read events for {self.timeout_s:.1f}s")
+                self.fail(exc)
+                raise exc
+        else:
+            await self._q.put(event)
+        self.buffer.add(event_bytes(event))
+
+    async def get(self) -> dict:
+        event = await self._q.get()
+        if isinstance(event, _Failed):
+            raise event.exc
+        self.buffer.remove(event_bytes(event))
+        return event
+
+    def fail(self, exc: BaseException) -> None:
+        """producer가 실패했을 때 부른다. 다음 get()이 exc를 올린다 (처음 한 번만 반영)."""
+        if self._failed:
+            return
+        self._failed = True
+        # 쌓인 이벤트는 어차피 못 보내므로 바로 버려서 메모리를 돌려주고, 소비자를 깨운다
+        while not self._q.empty():
+            self.buffer.remove(event_bytes(self._q.get_nowait()))
+        self._q.put_nowait(_Failed(exc))
+
+    def clear(self) -> None:
+        """턴이 끝나거나 중단됐을 때 남은 이벤트를 계산에서 뺀다."""
+        while not self._q.empty():
+            event = self._q.get_nowait()
+            if not isinstance(event, _Failed):
+                self.buffer.remove(event_bytes(event))
@@ -0,0 +1,106 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from app.gateway.services.backpressure import ConnectionBuffer, event_bytes
+
+_END = object()
+
+
+async def coalesce_tokens(
+    events: AsyncIterator[dict],
+    window_s: float,
+    max_bytes: int,
+    buffer: ConnectionBuffer | None = None,
+) -> AsyncIterator[dict]:
+    """연속된 token 이벤트를 window_s(또는 max_bytes) 단위로 하나로 합친다.
+
+    턴의 첫 token은 TTFT를 건드리지 않도록 바로 내보낸다. token이 아닌 이벤트(audio_chunk, done 등)가
+    오면 모아 둔 token을 먼저 내보내고 이어서 그 이벤트를 보내므로 순서는 그대로다.
+    buffer를 주면 여기 붙잡혀 있는 이벤트(모으는 중인 token 포함)를 연결의 버퍼 사용량에 넣는다.
+    """
+    buffer = buffer or ConnectionBuffer(connection_id=0)
+    # 한 칸만 두어 소켓이 느리면 그대로 upstream(이벤트 큐)에 backpressure가 걸리게 한다
+    q: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+    async def pump():
+        try:
+            async for event in events:
+                buffer.add(event_bytes(event))
+                try:
+                    await q.put(event)
+                except asyncio.CancelledError:
+                    buffer.remove(event_bytes(event))
+                    raise
+            await q.put(_END)
+        except Exception as e:
+            await q.put(e)
+
+    pump_task = asyncio.create_task(pump())
+    loop = asyncio.get_running_loop()
+    pending: list[str] = []
+    pending_first: dict = {}  # 합친 이벤트는 첫 token의 다른 필드(sessionId 등)를 그대로 쓴다
+    pending_bytes = 0
+    deadline: float | None = None
+    first = True
+
+    def merged() -> dict:
+        nonlocal pending, pending_bytes, deadline
+        event = pending_first | {"text": "".join(pending)}
+        for text in pending:
+            buffer.remove(len(text))
+        pending, pending_bytes, deadline = [], 0, None
+        return event
+
+    try:
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                item = await asyncio.wait_for(q.get(), timeout)
+            except TimeoutError:
+                yield merged()
+                continue
+
+            if item is _END:
+                break
+            if isinstance(item, Exception):
+                if pending:
+                    yield merged()
+                raise item
+
+            if item.get("type") == "token":
+                if first:
+                    first = False
+                    buffer.remove(event_bytes(item))
+                    yield item
+                    continue
+                if not pending:
+                    pending_first = item
+                pending.append(item["text"])
+                pending_bytes += len(item["text"].encode("utf-8"))
+                if deadline is None:
+                    deadline = loop.time() + window_s
+                if pending_bytes >= max_bytes:
+                    yield merged()
+                continue
+
+            if pending:
+                yield merged()
+            buffer.remove(event_bytes(item))
+            yield item
+
+        if pending:
+            yield merged()
+    finally:
+        pump_task.cancel()
+        # upstream(턴 스트림)의 취소 처리(finalize_turn 등)가 끝나야 호출자가 DB 세션을 닫을 수 있다
+        await asyncio.gather(pump_task, return_exceptions=True)
+        # 못 내보낸 이벤트는 계산에서 뺀다
+        for text in pending:
+            buffer.remove(len(text))
+        while not q.empty():
+            item = q.get_nowait()
+            if isinstance(item, dict):
+                buffer.remove(event_bytes(item))
+        aclose = getattr(events, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -0,0 +1,89 @@
+import re
+from dataclasses import dataclass, field
+
+from app.gateway.schemas.message import Message
+
+# OpenAI chat 포맷에서 메시지 하나에 붙는 대략적인 오버헤드 (role, 구분자)
+MESSAGE_OVERHEAD_TOKENS = 4
+SUMMARY_LINE_CHARS = 160
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+def estimate_tokens(text: str) -> int:
+    """tokenizer 없이 쓰는 토큰 수 추정.
+
+    영문은 대략 4글자에 1토큰, 한글/CJK 등 비ASCII 문자는 글자당 1토큰으로 잡는다 (cl100k 기준으로 약간 넉넉함).
+    """
+    non_ascii = len(_NON_ASCII_RE.findall(text))
+    return (len(text) - non_ascii + 3) // 4 + non_ascii
+
+
+def message_tokens(message: Message) -> int:
+    return estimate_tokens(message.content) + MESSAGE_OVERHEAD_TOKENS
+
+
+@dataclass(frozen=True)
+class HistoryBudget:
+    """프롬프트에 넣을 히스토리(요약 포함)의 토큰 상한."""
+
+    max_tokens: int
+    summary_tokens: int = 200
+
+
+@dataclass
+class HistoryWindow:
+    messages: list[Message]  # LLM에 넘길 히스토리 (요약이 있으면 맨 앞에 system 메시지로)
+    kept: int  # 원래 히스토리에서 남긴 (최근) 메시지 수
+    dropped: list[Message] = field(default_factory=list)
+    summary: str | None = None  # 잘린 메시지까지 접어 넣은 rolling summary
+
+    @property
+    def tokens(self) -> int:
+        return sum(message_tokens(m) for m in self.messages)
+
+
+def _clip(text: str, limit: int = SUMMARY_LINE_CHARS) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1].rstrip() + "…"
+
+
+def fold_summary(summary: str | None, dropped: list[Message], max_tokens: int) -> str | None:
+    """잘려 나간 메시지를 한 줄씩 줄여 요약 뒤에 붙이고, 상한을 넘으면 오래된 줄부터 버린다."""
+    lines = summary.splitlines() if summary else []
+    lines += [f"{m.role}: {_clip(m.content)}" for m in dropped]
+    while lines and estimate_tokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+    return "\n".join(lines) or None
+
+
+def summary_message(summary: str) -> Message:
+    return Message(role="system", content=SUMMARY_PREFIX + summary)
+
+
+def fit_history(history: list[Message], summary: str | None, budget: HistoryBudget) -> HistoryWindow:
+    """오래된 메시지부터 잘라 (요약 + 히스토리)가 budget.max_tokens 안에 들어오게 한다.
+
+    잘린 메시지는 rolling summary에 접어 넣는다. 남은 히스토리는 항상 user 메시지로 시작한다.
+    """
+    costs = [message_tokens(m) for m in history]
+    total = sum(costs)
+    start = 0
+
+    def summary_cost(s: str | None) -> int:
+        return message_tokens(summary_message(s)) if s else 0
+
+    new_summary = summary
+    while start < len(history) and total + summary_cost(new_summary) > budget.max_tokens:
+        total -= costs[start]
+        start += 1
+        # 턴 중간(assistant)에서 시작하지 않도록 짝을 맞춰 자른다
+        while start < len(history) and history[start].role != "user":
+            total -= costs[start]
+            start += 1
+        new_summary = fold_summary(summary, history[:start], budget.summary_tokens)
+
+    kept = history[start:]
+    messages = ([summary_message(new_summary)] if new_summary else []) + kept
+    return HistoryWindow(messages=messages, kept=len(kept), dropped=history[:start], summary=new_summary)
@@ -0,0 +1,179 @@
+import asyncio
+import hashlib
+import json
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import asdict, dataclass
+
+from app.gateway.clients.llm import BaseLLM
+from app.gateway.schemas.message import Message
+
+# cache hit을 돌려줄 때 토큰 간격
+REPLAY_INSTANT = "instant"  # 한 번에 다 보낸다
+REPLAY_PACED = "paced"  # 첫 토큰은 바로, 이후는 녹화된 간격(max_gap_s로 자름)대로
+REPLAYS = {REPLAY_INSTANT, REPLAY_PACED}
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 정규화 (NFKC + 공백 정리). 대소문자/구두점은 답이 달라질 수 있으므로 유지."""
+    return _WS_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def response_key(
+    model: str,
+    system_prompt: str | None,
+    temperature: float,
+    history: list[Message],
+    user_text: str,
+) -> str:
+    raw = json.dumps(
+        [
+            model,
+            system_prompt or "",
+            temperature,
+            [[m.role, normalize_text(m.content)] for m in history],
+            normalize_text(user_text),
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    tokens: list[str]
+    gaps: list[float]  # 직전 토큰(첫 토큰은 요청 시작)부터의 간격, 초
+    size: int
+    expires_at: float
+
+
+@dataclass
+class LLMCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expired: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def to_dict(self) -> dict:
+        lookups = self.hits + self.misses
+        return asdict(self) | {"hit_rate": round(self.hits / lookups, 3) if lookups else None}
+
+
+class LLMResponseCache:
+    """완성된 LLM 응답(토큰 + 간격)을 담는 in-memory LRU. 항목 수/바이트/TTL로 상한이 정해진다."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self.size = 0
+        self._clock = clock
+        self._items: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._stats = LLMCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> CachedResponse | None:
+        entry = self._items.get(key)
+        if entry is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            self._stats.expired += 1
+            entry = None
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self._stats.hits += 1
+        return entry
+
+    def put(self, key: str, tokens: list[str], gaps: list[float]) -> None:
+        size = sum(len(t.encode("utf-8")) for t in tokens)
+        if size > self.max_bytes:
+            return
+        self._remove(key)
+        self._items[key] = CachedResponse(tokens, gaps, size, self._clock() + self.ttl_s)
+        self.size += size
+        self._stats.stores += 1
+        while self.size > self.max_bytes or len(self._items) > self.max_entries:
+            _, evicted = self._items.popitem(last=False)
+            self.size -= evicted.size
+            self._stats.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._items.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def stats(self) -> LLMCacheStats:
+        s = self._stats
+        s.entries = len(self._items)
+        s.bytes = self.size
+        return s
+
+
+class CachedLLM(BaseLLM):
+    """같은 (model, system_prompt, temperature, history, user_text)면 저장된 응답을 다시 흘려준다.
+
+    결과가 매번 같은 설정(temperature 0)에서만 감싸야 한다. 끝까지 받은 응답만 저장하므로
+    중간에 끊긴(barge-in) 스트림이나 에러가 난 스트림은 캐시에 남지 않는다.
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        cache: LLMResponseCache,
+        model: str,
+        system_prompt: str | None,
+        temperature: float,
+        replay: str = REPLAY_PACED,
+        max_gap_s: float = 0.2,
+    ):
+        if replay not in REPLAYS:
+            raise ValueError(f"unknown replay mode: {replay}")
+        self.llm = llm
+        self.cache = cache
+        self.model = model
+        self.system_prompt = system_prompt
+        self.temperature = temperature
+        self.replay = replay
+        self.max_gap_s = max_gap_s
+
+    async def stream(
+        self, user_text: str, history: list[Message]
+    ) -> AsyncIterator[str]:
+        key = response_key(self.model, self.system_prompt, self.temperature, history, user_text)
+        hit = self.cache.get(key)
+        if hit is not None:
+            for n, (token, gap) in enumerate(zip(hit.tokens, hit.gaps)):
+                if n and self.replay == REPLAY_PACED:
+                    await asyncio.sleep(min(gap, self.max_gap_s))
+                yield token
+            return
+
+        loop = asyncio.get_running_loop()
+        tokens: list[str] = []
+        gaps: list[float] = []
+        last = loop.time()
+        async for token in self.llm.stream(user_text, history):
+            now = loop.time()
+            tokens.append(token)
+            gaps.append(now - last)
+            last = now
+            yield token
+        if tokens:
+            self.cache.put(key, tokens, gaps)
@@ -0,0 +1,96 @@
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+
+from app.gateway.services.backpressure import ConnectionBuffer, event_bytes
+
+
+class FairSender:
+    """여러 턴(stream)의 이벤트를 소켓 하나로 보내는 단일 writer.
+
+    stream마다 작은 큐를 두고, 보낼 게 있는 stream을 돌아가며 한 이벤트씩 보낸다(round-robin).
+    오디오를 많이 만드는 턴이 있어도 다른 턴의 token이 그 뒤에 줄 서지 않는다.
+    stream 큐가 차면 put()이 막혀서 그 턴만 backpressure를 받는다.
+    buffer를 주면 put()부터 실제로 보낼 때까지의 이벤트를 연결의 버퍼 사용량에 넣는다.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[dict], Awaitable[None]],
+        per_stream: int = 8,
+        buffer: ConnectionBuffer | None = None,
+    ):
+        self._send = send
+        self._per_stream = per_stream
+        self.buffer = buffer or ConnectionBuffer(connection_id=0)
+        self._queues: dict[Hashable, asyncio.Queue[dict]] = {}
+        self._ring: deque[Hashable] = deque()  # 보낼 이벤트가 있는 stream (순서 = 보낼 차례)
+        self._in_ring: set[Hashable] = set()
+        self._finished: set[Hashable] = set()
+        self._ready = asyncio.Event()
+
+    def _queue(self, key: Hashable) -> asyncio.Queue[dict]:
+        q = self._queues.get(key)
+        if q is None:
+            q = self._queues[key] = asyncio.Queue(maxsize=self._per_stream)
+            self._finished.discard(key)
+        return q
+
+    def _schedule(self, key: Hashable) -> None:
+        if key not in self._in_ring:
+            self._in_ring.add(key)
+            self._ring.append(key)
+            self._ready.set()
+
+    async def put(self, key: Hashable, event: dict) -> None:
+        # 큐 자리를 기다리는 동안에도 이벤트는 gateway 메모리에 있다
+        self.buffer.add(event_bytes(event))
+        try:
+            await self._queue(key).put(event)
+        except BaseException:
+            self.buffer.remove(event_bytes(event))
+            raise
+        self._schedule(key)
+
+    def finish(self, key: Hashable) -> None:
+        """stream이 더 보낼 게 없음. 남은 이벤트를 다 보내면 큐를 치운다."""
+        q = self._queues.get(key)
+        if q is None:
+            return
+        if q.empty():
+            del self._queues[key]
+        else:
+            self._finished.add(key)
+
+    def discard(self, key: Hashable) -> None:
+        """취소된 stream의 아직 안 보낸 이벤트를 버린다."""
+        q = self._queues.pop(key, None)
+        self._finished.discard(key)
+        while q is not None and not q.empty():
+            self.buffer.remove(event_bytes(q.get_nowait()))
+
+    @property
+    def streams(self) -> int:
+        return len(self._queues)
+
+    async def run(self) -> None:
+        while True:
+            if not self._ring:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            key = self._ring.popleft()
+            self._in_ring.discard(key)
+            q = self._queues.get(key)
+            if q is None or q.empty():
+                continue
+            event = q.get_nowait()
+            if not q.empty():
+                self._schedule(key)
+            elif key in self._finished:
+                self._finished.discard(key)
+                del self._queues[key]
+            try:
+                await self._send(event)
+            finally:
+                self.buffer.remove(event_bytes(event))
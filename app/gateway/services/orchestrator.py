@@ -1,64 +1,126 @@
 import asyncio
 import base64
+from contextlib import nullcontext
 
 from app.gateway.clients.tts import TTSClient
 from app.gateway.clients.llm import BaseLLM
 from app.gateway.clients.cache import CacheClient
 from app.gateway.schemas.message import Message
-
-PUNCT = {".", "?", "!", "\n"}
+from app.gateway.services.backpressure import POLICY_PAUSE, BoundedEventQueue, ConnectionBuffer
+from app.gateway.services.history import HistoryBudget, fit_history
+from app.gateway.services.segmenter import PUNCT, Segmenter, SegmenterConfig  # noqa: F401 (PUNCT: 기존 import 경로 유지)
 
 
 class Orchestrator:
-    def __init__(self, cache_client: CacheClient, tts: TTSClient, llm: BaseLLM):
+    def __init__(
+        self,
+        cache_client: CacheClient,
+        tts: TTSClient,
+        llm: BaseLLM,
+        binary_audio: bool = False,
+        tts_depth: int = 1,
+        tts_slots: asyncio.Semaphore | None = None,
+        segmenter_config: SegmenterConfig | None = None,
+        event_queue_size: int = 64,
+        tts_text_queue_size: int = 16,
+        slow_policy: str = POLICY_PAUSE,
+        slow_timeout_s: float = 5.0,
+        buffer: ConnectionBuffer | None = None,
+        history_budget: HistoryBudget | None = None,
+    ):
         self.cache_client = cache_client
         self.llm = llm
         self.tts = tts
+        # True면 audio_chunk에 base64 "data" 대신 raw bytes "audio"를 담는다 (binary WebSocket 모드)
+        self.binary_audio = binary_audio
+        # 한 턴에서 동시에 합성 중(+ 순서 대기 중)인 segment 수 상한
+        self.tts_depth = max(1, tts_depth)
+        # 프로세스 전체에서 공유하는 동시 합성 슬롯 (턴 간 공정성용, None이면 제한 없음)
+        self.tts_slots = tts_slots
+        self.segmenter_config = segmenter_config or SegmenterConfig()
+        # 느린 클라이언트 대비: 큐 크기 상한과 꽉 찼을 때의 정책 (app.gateway.services.backpressure)
+        self.event_queue_size = event_queue_size
+        self.tts_text_queue_size = tts_text_queue_size
+        self.slow_policy = slow_policy
+        self.slow_timeout_s = slow_timeout_s
+        self.buffer = buffer
+        # 히스토리 토큰 상한 (None이면 CacheClient가 준 max_turns 그대로)
+        self.history_budget = history_budget
+
+    async def _fit_history(self, session_id: str, history: list[Message], summary: str | None) -> list[Message]:
+        """토큰 상한을 넘는 오래된 턴은 rolling summary로 접고, 저장된 히스토리에서도 지운다."""
+        window = fit_history(history, summary, self.history_budget)
+        if window.dropped:
+            await self.cache_client.compact_history(session_id, keep=window.kept, summary=window.summary)
+        return window.messages
 
     async def stream_events(self, session_id: str, user_text: str):
-        history = await self.cache_client.get_history(session_id)
+        if self.history_budget is None:
+            history = await self.cache_client.get_history(session_id)
+        else:
+            history, summary = await self.cache_client.get_history_and_summary(session_id)
+            history = await self._fit_history(session_id, history, summary)
         self.cache_client.append_user(session_id, user_text)
 
         user_msg = Message(role="user", content=user_text)
         llm_history = history + [user_msg]
 
-        event_q: asyncio.Queue[dict] = asyncio.Queue()
-        tts_text_q: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        event_q = BoundedEventQueue(
+            self.event_queue_size, self.slow_policy, self.slow_timeout_s, self.buffer
+        )
+        tts_text_q: asyncio.Queue[tuple[int, str]] = asyncio.Queue(maxsize=self.tts_text_queue_size)
 
         assistant_buf = []
 
         async def token_producer():
-            buf = ""
+            segmenter = Segmenter(self.segmenter_config)
             seq = 0
             async for tok in self.llm.stream(user_text, llm_history):
                 assistant_buf.append(tok)
                 await event_q.put({"type": "token", "text": tok})
 
-                buf += tok
-                if len(buf) >= 60 or any(p in buf for p in PUNCT):
+                for segment in segmenter.feed(tok):
                     seq += 1
-                    await tts_text_q.put((seq, buf.strip()))
-                    buf = ""
+                    await tts_text_q.put((seq, segment))
 
-            if buf.strip():
+            for segment in segmenter.flush():
                 seq += 1
-                await tts_text_q.put((seq, buf.strip()))
+                await tts_text_q.put((seq, segment))
 
             await tts_text_q.put((-1, ""))  # 종료 신호
 
-        async def tts_producer():
+        # 합성은 최대 tts_depth개까지 겹쳐 돌리고, 결과는 seq 순서대로 내보낸다 (reorder buffer)
+        turn_slots = asyncio.Semaphore(self.tts_depth)
+        in_order: asyncio.Queue[tuple[int, asyncio.Task] | None] = asyncio.Queue()
+        synth_tasks: list[asyncio.Task] = []
+
+        async def synthesize(chunk: str) -> bytes:
+            async with self.tts_slots or nullcontext():
+                return await self.tts.synthesize(chunk, fmt="wav")
+
+        async def tts_dispatcher():
             while True:
                 seq, chunk = await tts_text_q.get()
                 if seq == -1:
                     break
-                audio_bytes = await self.tts.synthesize(chunk, fmt="wav")
-                b64 = base64.b64encode(audio_bytes).decode("ascii")
-                await event_q.put({
-                    "type": "audio_chunk",
-                    "seq": seq,
-                    "format": "wav",
-                    "data": b64,
-                })
+                # 앞 segment가 내보내질 때까지 슬롯이 안 돌아오므로 한 턴이 tts_depth개를 넘게 잡지 않는다
+                await turn_slots.acquire()
+                task = asyncio.create_task(synthesize(chunk))
+                synth_tasks.append(task)
+                in_order.put_nowait((seq, task))
+            in_order.put_nowait(None)
+
+        async def tts_producer():
+            while (item := await in_order.get()) is not None:
+                seq, task = item
+                audio_bytes = await task
+                turn_slots.release()
+                event = {"type": "audio_chunk", "seq": seq, "format": "wav"}
+                if self.binary_audio:
+                    event["audio"] = audio_bytes
+                else:
+                    event["data"] = base64.b64encode(audio_bytes).decode("ascii")
+                await event_q.put(event)
 
             assistant_text = "".join(assistant_buf).strip() or None
             if assistant_text:
@@ -67,8 +129,9 @@ class Orchestrator:
 
             await event_q.put({"type": "done", "assistant_text": assistant_text})
 
-        tok_task = asyncio.create_task(token_producer())
-        tts_task = asyncio.create_task(tts_producer())
+        tok_task = _spawn(token_producer(), event_q)
+        dispatch_task = _spawn(tts_dispatcher(), event_q)
+        tts_task = _spawn(tts_producer(), event_q)
 
         try:
             while True:
@@ -78,4 +141,20 @@ class Orchestrator:
                     break
         finally:
             tok_task.cancel()
+            dispatch_task.cancel()
             tts_task.cancel()
+            for task in synth_tasks:
+                task.cancel()
+            event_q.clear()
+
+
+def _spawn(coro, event_q: BoundedEventQueue) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+
+    def done(t: asyncio.Task) -> None:
+        # LLM/TTS/segmenter 실패는 이벤트 큐로 넘겨서 stream_events가 다시 올리게 한다 (안 그러면 턴이 안 끝난다)
+        if not t.cancelled() and t.exception() is not None:
+            event_q.fail(t.exception())
+
+    task.add_done_callback(done)
+    return task
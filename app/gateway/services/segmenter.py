@@ -0,0 +1,140 @@
+import re
+from dataclasses import dataclass, fields, replace
+
+# 마침표 뒤에 공백이 와도 문장 끝으로 보지 않는 단어 (소문자, 마지막 "." 제외)
+DEFAULT_ABBREVIATIONS = frozenset({
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "approx",
+    "e.g", "i.e", "a.m", "p.m", "u.s", "vol", "fig", "inc", "ltd",
+})
+
+PUNCT = {".", "?", "!", "\n"}  # 문장 경계 ("."는 다음 글자까지 보고 판단)
+CLAUSE_END = {",", ";", ":"}
+_LOOKAHEAD = {"."} | CLAUSE_END  # 다음 글자를 봐야 경계인지 알 수 있는 글자
+
+# 경계가 될 수 있는 글자만 regex로 건너뛰며 찾는다 (첫 segment는 단어 수를 세야 해서 공백 포함)
+_CANDIDATES = re.compile(r"[.?!\n]")
+_FIRST_CANDIDATES = re.compile(r"[.?!,;:\s]")
+
+
+@dataclass(frozen=True)
+class SegmenterConfig:
+    """TTS segment 경계 설정.
+
+    첫 segment는 TTAF를 줄이려고 짧게 끊는다 (문장 끝, first_clause_min_chars 이상이면 쉼표류,
+    또는 first_max_words 단어). 이후 segment는 문장 끝에서만 끊되 min_chars보다 짧으면 다음 문장과
+    합친다. 어느 segment든 max_chars를 넘으면 마지막 공백(없으면 그 자리)에서 자른다.
+    """
+
+    max_chars: int = 60
+    min_chars: int = 0
+    first_max_words: int = 8
+    first_clause_min_chars: int = 12
+    abbreviations: frozenset[str] = DEFAULT_ABBREVIATIONS
+
+    def __post_init__(self):
+        # max_chars가 0이면 _hard_cut이 0을 돌려줘서 feed()가 진행하지 못하고 영원히 돈다
+        if self.max_chars < 1:
+            raise ValueError(f"max_chars must be >= 1, got {self.max_chars}")
+        for name in ("min_chars", "first_max_words", "first_clause_min_chars"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be >= 0, got {getattr(self, name)}")
+        if self.min_chars > self.max_chars:
+            raise ValueError(f"min_chars ({self.min_chars}) must be <= max_chars ({self.max_chars})")
+
+    def with_overrides(self, overrides: dict | None) -> "SegmenterConfig":
+        """캐릭터별 설정(dict)을 덮어쓴다. 모르는 키와 abbreviations는 무시한다.
+
+        범위를 벗어난 값이면 ValueError.
+        """
+        if not overrides:
+            return self
+        names = {f.name for f in fields(self)} - {"abbreviations"}
+        return replace(self, **{k: int(v) for k, v in overrides.items() if k in names})
+
+
+class Segmenter:
+    """LLM 토큰 스트림을 TTS segment로 나누는 상태 기반 segmenter (턴마다 하나).
+
+    feed()는 이전에 본 텍스트를 다시 훑지 않고 새로 들어온 부분만 본다.
+    "." 와 쉼표류는 다음 글자를 봐야 경계인지 알 수 있으므로(3.14, 1,000, e.g., 10:30) 버퍼 끝에 있으면
+    다음 토큰이 올 때까지 판단을 미룬다.
+    """
+
+    def __init__(self, config: SegmenterConfig | None = None):
+        self.config = config or SegmenterConfig()
+        self._buf = ""
+        self._scan = 0  # 아직 판단하지 않은 첫 위치
+        self._words = 0  # 현재 segment에서 끝난 단어 수
+        self._first = True
+
+    def feed(self, text: str) -> list[str]:
+        self._buf += text
+        out: list[str] = []
+        i = self._scan
+        while True:
+            pattern = _FIRST_CANDIDATES if self._first else _CANDIDATES
+            m = pattern.search(self._buf, i)
+            if m is None or m.start() >= self.config.max_chars:
+                if len(self._buf) < self.config.max_chars:
+                    i = len(self._buf)
+                    break
+                self._emit(self._hard_cut(), out)
+                i = 0
+                continue
+            i = m.start()
+            ch = self._buf[i]
+            if ch in _LOOKAHEAD and i + 1 == len(self._buf):
+                break  # 다음 글자가 와야 판단 가능
+            cut = self._boundary(i, ch)
+            if cut is None:
+                i += 1
+                continue
+            self._emit(cut, out)
+            i = 0
+        self._scan = i
+        return out
+
+    def flush(self) -> list[str]:
+        """스트림 종료 시 남은 텍스트를 내보낸다."""
+        out: list[str] = []
+        self._emit(len(self._buf), out)
+        self._scan = 0
+        return out
+
+    def _boundary(self, i: int, ch: str) -> int | None:
+        seg_len = i + 1
+        if ch in PUNCT:
+            if ch == "." and not self._is_sentence_end(i):
+                return None
+            if self._first or len(self._buf[:seg_len].strip()) >= self.config.min_chars:
+                return seg_len
+            return None
+        if not self._first:
+            return None
+        if ch in CLAUSE_END and self._buf[i + 1].isspace() and seg_len >= self.config.first_clause_min_chars:
+            return seg_len
+        if ch.isspace() and i > 0 and not self._buf[i - 1].isspace():
+            self._words += 1
+            if self._words >= self.config.first_max_words:
+                return i
+        return None
+
+    def _is_sentence_end(self, i: int) -> bool:
+        if not self._buf[i + 1].isspace():
+            return False  # 3.14, e.g, example.com
+        start = self._buf.rfind(" ", 0, i) + 1
+        word = self._buf[start:i].lstrip("(\"'").lower()
+        return word not in self.config.abbreviations
+
+    def _hard_cut(self) -> int:
+        limit = self.config.max_chars
+        space = self._buf.rfind(" ", 0, limit)
+        return space if space > 0 else limit
+
+    def _emit(self, cut: int, out: list[str]) -> None:
+        segment = self._buf[:cut].strip()
+        self._buf = self._buf[cut:]
+        self._words = 0
+        if segment:
+            out.append(segment)
+            self._first = False
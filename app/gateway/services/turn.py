@@ -1,5 +1,6 @@
+import asyncio
 import time
-from typing import AsyncGenerator, Callable
+from typing import AsyncGenerator, Protocol
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -7,12 +8,22 @@ from app.gateway.repositories.session_repo import get_session_with_character, up
 from app.gateway.repositories.turn_repo import create_turn, set_ttft, set_ttaf, finalize_turn
 from app.gateway.clients.cache import CacheClient
 from app.gateway.models.character import Character
+from app.gateway.services.backpressure import ConnectionBuffer, SlowConsumerError
 from app.gateway.services.orchestrator import Orchestrator
 from app.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
-OrchestratorFactory = Callable[[Character, CacheClient], Orchestrator]
+class OrchestratorFactory(Protocol):
+    """캐릭터 설정으로 턴 하나를 처리할 Orchestrator를 만든다 (dependencies.create_orchestrator_for_character)."""
+
+    def __call__(
+        self,
+        character: Character,
+        cache_client: CacheClient,
+        binary_audio: bool = False,
+        buffer: ConnectionBuffer | None = None,
+    ) -> Orchestrator: ...
 
 
 class TurnService:
@@ -25,6 +36,9 @@ class TurnService:
         db: AsyncSession,
         session_id: str,
         user_text: str,
+        binary_audio: bool = False,
+        buffer: ConnectionBuffer | None = None,
+        tag_events: bool = False,
     ) -> AsyncGenerator[dict, None]:
         """
         1. 세션에서 캐릭터 조회
@@ -47,7 +61,9 @@ class TurnService:
             raise ValueError(f"Session {session_id} has no character bound")
 
         await update_session_last_seen(db, session_id)
-        orchestrator = self._orchestrator_factory(character, self._cache_client)
+        orchestrator = self._orchestrator_factory(
+            character, self._cache_client, binary_audio=binary_audio, buffer=buffer
+        )
 
         turn_id = await create_turn(db, session_id, user_text)
         logger.info("turn_started", session_id=session_id, turn_id=turn_id, character_id=character.id)
@@ -58,16 +74,29 @@ class TurnService:
         ttft_written = False
         ttaf_written = False
         assistant_text = None
+        partial: list[str] = []  # 끊겼을 때 남길 부분 텍스트
+        finalized = False
 
         try:
             async for event in orchestrator.stream_events(session_id, user_text):
                 event_type = event.get("type")
 
+                if event_type == "token":
+                    partial.append(event["text"])
+
+                if tag_events:
+                    # 한 소켓에 여러 턴이 섞여 흐를 때 클라이언트가 구분할 수 있도록
+                    event["sessionId"] = session_id
+                    event["turnId"] = turn_id
+
                 if event_type == "token" and not ttft_written:
                     ttft_ms = int((time.perf_counter() - t0) * 1000)
                     await set_ttft(db, turn_id, ttft_ms)
                     ttft_written = True
 
+                if event_type == "audio_chunk":
+                    event["turnId"] = turn_id
+
                 if event_type == "audio_chunk" and not ttaf_written:
                     ttaf_ms = int((time.perf_counter() - t0) * 1000)
                     await set_ttaf(db, turn_id, ttaf_ms)
@@ -76,6 +105,7 @@ class TurnService:
                 if event_type == "done":
                     assistant_text = event.get("assistant_text")
                     await finalize_turn(db, turn_id, assistant_text)
+                    finalized = True
                     duration_ms = int((time.perf_counter() - t0) * 1000)
                     logger.info(
                         "turn_completed",
@@ -88,7 +118,27 @@ class TurnService:
 
                 yield event
 
+        except (asyncio.CancelledError, GeneratorExit):
+            # barge-in: 턴 task가 취소되거나 소비자가 스트림을 닫음. done 이후 정상 종료는 제외
+            if not finalized:
+                await finalize_turn(db, turn_id, "".join(partial).strip() or None, interrupted=True)
+                logger.info(
+                    "turn_interrupted",
+                    session_id=session_id,
+                    turn_id=turn_id,
+                    partial_chars=sum(len(t) for t in partial),
+                    duration_ms=int((time.perf_counter() - t0) * 1000),
+                )
+            raise
+        except SlowConsumerError as e:
+            # 느린 클라이언트에는 에러 이벤트도 못 보내므로 턴만 정리하고 연결 쪽에서 끊는다
+            await finalize_turn(db, turn_id, assistant_text)
+            logger.warning("turn_slow_consumer", session_id=session_id, turn_id=turn_id, error=str(e))
+            raise
         except Exception as e:
             await finalize_turn(db, turn_id, assistant_text)
             logger.error("turn_error", session_id=session_id, turn_id=turn_id, error=str(e))
-            yield {"type": "error", "message": str(e)}
+            error = {"type": "error", "message": str(e)}
+            if tag_events:
+                error |= {"sessionId": session_id, "turnId": turn_id}
+            yield error
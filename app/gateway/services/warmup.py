@@ -0,0 +1,117 @@
+import asyncio
+import time
+from contextlib import AbstractAsyncContextManager
+from typing import Callable, Coroutine
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.gateway.clients.tts import TTSClient
+from app.gateway.models.character import Character
+from app.gateway.repositories.character_repo import get_character, list_characters
+from app.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+TTSFactory = Callable[[str], TTSClient]  # voice -> client
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+def warm_phrases(character: Character, filler_phrases: list[str]) -> list[str]:
+    """캐릭터 하나에 대해 미리 합성할 문장: 인사말 + 공통 filler."""
+    phrases = [character.greeting] if character.greeting else []
+    return phrases + [p for p in filler_phrases if p not in phrases]
+
+
+def warm_group(character: Character) -> str:
+    """TTS warm store에서 이 캐릭터의 phrase를 묶는 group 이름."""
+    return f"character:{character.id}"
+
+
+class WarmupService:
+    """캐릭터별 인사말/filler를 TTS 쪽 warm store에 미리 합성해 두는 백그라운드 작업.
+
+    gateway 시작 시 최근 캐릭터 전체를, 캐릭터가 생성/수정되면 그 캐릭터만 다시 돌린다.
+    캐릭터마다 group을 붙여 보내므로, 인사말이나 voice가 바뀌면 예전 phrase는 TTS 쪽에서 고정이 풀린다.
+    모든 작업은 budget_s 안에서만 돌고, 요청 처리(readiness)를 막지 않도록 task로 띄운다.
+    """
+
+    def __init__(
+        self,
+        tts_factory: TTSFactory,
+        session_factory: SessionFactory,
+        filler_phrases: list[str],
+        budget_s: float,
+        concurrency: int = 4,
+        max_characters: int = 20,
+        fmt: str = "wav",
+    ):
+        self._tts_factory = tts_factory
+        self._session_factory = session_factory
+        self.filler_phrases = filler_phrases
+        self.budget_s = budget_s
+        self.max_characters = max_characters
+        self.fmt = fmt
+        self._sem = asyncio.Semaphore(concurrency)
+        self._tasks: set[asyncio.Task] = set()
+
+    async def _warm_character(self, character: Character, deadline: float) -> dict | None:
+        phrases = warm_phrases(character, self.filler_phrases)
+        async with self._sem:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                return None
+            try:
+                # phrase가 없어도 보낸다 (예전에 고정한 인사말을 풀어야 하므로)
+                result = await self._tts_factory(character.voice).warm(
+                    phrases, fmt=self.fmt, budget_ms=remaining_ms, group=warm_group(character)
+                )
+            except httpx.HTTPError as e:
+                logger.warning("tts_warmup_failed", character_id=character.id, voice=character.voice, error=str(e))
+                return None
+        logger.info(
+            "tts_warmup_character_done", character_id=character.id, voice=character.voice, phrases=len(phrases), **result
+        )
+        return result
+
+    async def warm_characters(self, characters: list[Character]) -> None:
+        # 캐릭터마다 요청 하나. 캐릭터끼리 겹치는 filler는 TTS 쪽에서 already_warm으로 처리된다
+        deadline = time.monotonic() + self.budget_s
+        try:
+            async with asyncio.timeout(self.budget_s):
+                await asyncio.gather(*(self._warm_character(character, deadline) for character in characters))
+        except TimeoutError:
+            logger.warning("tts_warmup_budget_exceeded", budget_s=self.budget_s)
+
+    async def warm_all(self) -> None:
+        async with self._session_factory() as db:
+            characters = await list_characters(db, self.max_characters)
+        await self.warm_characters(characters)
+
+    async def warm_character_id(self, character_id: int) -> None:
+        async with self._session_factory() as db:
+            character = await get_character(db, character_id)
+        if character is not None:
+            await self.warm_characters([character])
+
+    def _spawn(self, coro: Coroutine) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("tts_warmup_error", error=str(task.exception()))
+
+    def schedule_all(self) -> None:
+        self._spawn(self.warm_all())
+
+    def schedule_character(self, character_id: int) -> None:
+        self._spawn(self.warm_character_id(character_id))
+
+    async def aclose(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
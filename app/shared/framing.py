@@ -0,0 +1,67 @@
+"""Length-prefixed binary framing shared by the gateway and TTS service.
+
+Each frame is a fixed 9-byte big-endian header followed by the payload::
+
+    index: uint32 | status: uint8 | length: uint32 | payload[length]
+
+status 0 (OK) means the payload is audio and 1 (ERROR) means it is a UTF-8
+error message for that segment. 3 (FATAL) is an error that will fail the same
+way if retried (invalid request, non-retryable synthesizer error), like a 4xx
+on the HTTP path. On the streaming WebSocket channel a request may produce
+several OK frames and is terminated by an empty END frame (or an ERROR/FATAL
+frame).
+"""
+import struct
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+FRAME_HEADER = struct.Struct(">IBI")
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+STATUS_END = 2
+STATUS_FATAL = 3
+
+BATCH_MEDIA_TYPE = "application/x-tts-frames"
+
+
+@dataclass
+class Frame:
+    index: int
+    status: int
+    payload: bytes
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK
+
+
+def encode_frame(index: int, payload: bytes, status: int = STATUS_OK) -> bytes:
+    return FRAME_HEADER.pack(index, status, len(payload)) + payload
+
+
+def decode_frames(data: bytes) -> list[Frame]:
+    frames = []
+    offset = 0
+    while offset < len(data):
+        index, status, length = FRAME_HEADER.unpack_from(data, offset)
+        offset += FRAME_HEADER.size
+        frames.append(Frame(index, status, data[offset:offset + length]))
+        offset += length
+    return frames
+
+
+async def iter_frames(chunks: AsyncIterator[bytes]) -> AsyncIterator[Frame]:
+    """임의로 잘린 바이트 스트림에서 완성된 frame을 순서대로 꺼낸다."""
+    buf = bytearray()
+    async for chunk in chunks:
+        buf += chunk
+        while len(buf) >= FRAME_HEADER.size:
+            index, status, length = FRAME_HEADER.unpack_from(buf)
+            end = FRAME_HEADER.size + length
+            if len(buf) < end:
+                break
+            yield Frame(index, status, bytes(buf[FRAME_HEADER.size:end]))
+            del buf[:end]
+    if buf:
+        raise ValueError(f"truncated frame stream ({len(buf)} trailing bytes)")
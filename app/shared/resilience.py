@@ -0,0 +1,217 @@
+"""Circuit breaker and jittered retries shared by the LLM/TTS upstream clients.
+
+Retries only happen before the first byte of a response: once a stream has
+yielded anything, replaying it would duplicate audio/tokens, so later errors
+are raised as-is. Which errors are worth retrying (timeouts, 429, 5xx) is
+decided by ``retryable`` (by default the exception's own ``retryable``
+attribute, or the httpx error type/status); the same errors count as breaker
+failures, while e.g. a 401 counts as the upstream being reachable.
+"""
+import asyncio
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+import httpx
+
+from app.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """The upstream's breaker is open; the call was not attempted."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} circuit open (retry in {retry_after:.1f}s)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """다시 시도할 만한 실패인지. 예외에 retryable 속성이 있으면 그걸 따르고,
+    httpx 예외면 timeout/연결 실패/429/5xx만 해당한다."""
+    retryable = getattr(exc, "retryable", None)
+    if retryable is not None:
+        return bool(retryable)
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS
+    return isinstance(exc, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError))
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold번이면 열리고, reset_timeout_s 뒤 probe 하나로 닫힐지 정한다.
+
+    fast_fail=False면 상태만 기록하고 호출은 막지 않는다 (관찰 모드).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout_s: float = 10.0,
+        fast_fail: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.fast_fail = fast_fail
+        self.state = CLOSED
+        self.failures = 0  # 연속 실패
+        self.opened = 0  # 열린 횟수
+        self.rejected = 0  # 열려 있어서 막은 호출 수
+        self._clock = clock
+        self._opened_at = 0.0
+        self._probing = False
+        self._probe_at = 0.0
+
+    def allow(self) -> None:
+        """호출해도 되면 그냥 돌아오고, 아니면 CircuitOpenError."""
+        if self.state == CLOSED or not self.fast_fail:
+            return
+        if self.state == OPEN:
+            remaining = self._opened_at + self.reset_timeout_s - self._clock()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, remaining)
+            self.state = HALF_OPEN
+            self._probing = False
+        # half-open: 한 번에 probe 하나만 보낸다 (probe가 취소돼 결과가 안 오면 reset_timeout_s 뒤 다시 보낸다)
+        now = self._clock()
+        if self._probing and now - self._probe_at < self.reset_timeout_s:
+            self.rejected += 1
+            raise CircuitOpenError(self.name, self._probe_at + self.reset_timeout_s - now)
+        self._probing = True
+        self._probe_at = now
+
+    def record_success(self) -> None:
+        if self.state != CLOSED:
+            logger.info("circuit_closed", upstream=self.name)
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+            self.state = OPEN
+            self.opened += 1
+            self._opened_at = self._clock()
+            logger.warning("circuit_opened", upstream=self.name, failures=self.failures)
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "fast_fail": self.fast_fail,
+        }
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3  # 첫 시도 포함
+    base_delay_s: float = 0.2
+    max_delay_s: float = 2.0
+
+    def backoff(self, attempt: int, rng: random.Random | None = None) -> float:
+        """attempt번째 실패 뒤 기다릴 시간 (full jitter: 0 ~ base * 2^attempt)."""
+        cap = min(self.max_delay_s, self.base_delay_s * (2 ** attempt))
+        return (rng or random).uniform(0, cap)
+
+
+class Upstream:
+    """업스트림 하나(예: OpenAI chat, TTS 서비스)에 대한 breaker + 재시도 정책. 프로세스에서 공유한다."""
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        retry: RetryPolicy = RetryPolicy(),
+        retryable: Callable[[BaseException], bool] = is_retryable,
+        rng: random.Random | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.breaker = breaker
+        self.retry = retry
+        self.retryable = retryable
+        self.retries = 0
+        self._rng = rng
+        self._sleep = sleep
+
+    @property
+    def name(self) -> str:
+        return self.breaker.name
+
+    async def _failed(self, exc: BaseException, attempt: int) -> None:
+        """실패를 기록하고, 다시 시도할 거면 기다렸다 돌아온다. 아니면 예외를 그대로 올린다."""
+        if not self.retryable(exc):
+            # 업스트림이 응답은 한 것 (예: 401, 400) → breaker 입장에선 정상
+            self.breaker.record_success()
+            raise exc
+        self.breaker.record_failure()
+        if attempt + 1 >= self.retry.max_attempts:
+            raise exc
+        delay = self.retry.backoff(attempt, self._rng)
+        self.retries += 1
+        logger.info("upstream_retry", upstream=self.name, attempt=attempt + 1, delay_ms=int(delay * 1000), error=str(exc))
+        await self._sleep(delay)
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """응답을 한 번에 받는 요청. 실패하면 정책대로 다시 시도한다."""
+        attempt = 0
+        while True:
+            self.breaker.allow()
+            try:
+                result = await fn()
+            except Exception as e:
+                await self._failed(e, attempt)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+    async def stream(self, open_stream: Callable[[], AsyncIterator[T]]) -> AsyncIterator[T]:
+        """스트리밍 요청. 첫 항목이 오기 전의 실패만 다시 시도하고, 그 뒤의 실패는 그대로 올린다."""
+        attempt = 0
+        while True:
+            self.breaker.allow()
+            stream = open_stream()
+            try:
+                first = await anext(stream)
+            except StopAsyncIteration:
+                self.breaker.record_success()
+                return
+            except Exception as e:
+                await stream.aclose()
+                await self._failed(e, attempt)
+                attempt += 1
+                continue
+            break
+
+        self.breaker.record_success()
+        try:
+            yield first
+            async for item in stream:
+                yield item
+        except Exception as e:
+            if self.retryable(e):
+                self.breaker.record_failure()
+            raise
+        finally:
+            await stream.aclose()
+
+    def snapshot(self) -> dict:
+        return self.breaker.snapshot() | {"retries": self.retries}
@@ -0,0 +1,37 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """OpenAI 호환 stand-in 서버 설정. 지연은 (median, p99)로 정하는 lognormal 분포 (둘이 같으면 고정값)."""
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+
+    # /v1/chat/completions
+    STANDIN_TTFT_MEDIAN_MS: float = 350.0
+    STANDIN_TTFT_P99_MS: float = 1200.0
+    STANDIN_TOKEN_MEDIAN_MS: float = 25.0  # 토큰 사이 간격
+    STANDIN_TOKEN_P99_MS: float = 80.0
+    STANDIN_REPLY_TOKENS: int = 60  # max_tokens가 더 작으면 그만큼만
+
+    # /v1/audio/speech
+    STANDIN_TTS_TTFB_MEDIAN_MS: float = 250.0
+    STANDIN_TTS_TTFB_P99_MS: float = 900.0
+    STANDIN_TTS_MS_PER_CHAR: float = 60.0  # 생성할 오디오 길이 (무음)
+    STANDIN_TTS_BYTES_PER_S: int = 0  # 오디오 전송 속도 상한, 0이면 제한 없음
+    STANDIN_TTS_SAMPLE_RATE: int = 24000
+
+    # 장애 주입 (요청 단위 확률)
+    STANDIN_ERROR_RATE: float = 0.0  # 500
+    STANDIN_RATE_LIMIT_RATE: float = 0.0  # 429
+    STANDIN_STREAM_ABORT_RATE: float = 0.0  # 첫 바이트 이후 연결을 끊는다
+
+    # 처리량 상한 (넘으면 429)
+    STANDIN_MAX_CONCURRENCY: int = 0  # 0이면 제한 없음
+    STANDIN_MAX_RPS: float = 0.0
+
+    STANDIN_SEED: int | None = None  # 같은 seed면 같은 지연/장애 순서
+
+    LOG_JSON: bool = True
+
+
+settings = Settings()
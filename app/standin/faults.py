@@ -0,0 +1,94 @@
+import math
+import random
+import time
+from dataclasses import asdict, dataclass
+
+from app.standin.config import Settings
+
+# 표준정규분포의 99 분위수
+_Z99 = 2.3263
+
+
+@dataclass(frozen=True)
+class Latency:
+    """median/p99로 정하는 lognormal 지연 분포 (ms). p99 <= median이면 항상 median."""
+
+    median_ms: float
+    p99_ms: float
+
+    def sample(self, rng: random.Random) -> float:
+        """초 단위 표본."""
+        if self.median_ms <= 0:
+            return 0.0
+        if self.p99_ms <= self.median_ms:
+            return self.median_ms / 1000
+        sigma = math.log(self.p99_ms / self.median_ms) / _Z99
+        return rng.lognormvariate(math.log(self.median_ms), sigma) / 1000
+
+
+@dataclass
+class StandinStats:
+    requests: int = 0
+    ok: int = 0
+    errors: int = 0  # 주입한 500
+    rate_limited: int = 0  # 주입한 429 + 처리량 초과 429
+    aborted: int = 0
+    in_flight: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class Rejected(Exception):
+    def __init__(self, status_code: int, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class FaultInjector:
+    """요청마다 처리량 상한을 확인하고, 설정된 확률로 429/500/중간 끊김을 고른다."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.rng = random.Random(settings.STANDIN_SEED)
+        self.stats = StandinStats()
+        self._tokens = max(1.0, settings.STANDIN_MAX_RPS)
+        self._refilled = time.monotonic()
+
+    def _take_rps_token(self) -> bool:
+        rps = self.settings.STANDIN_MAX_RPS
+        if rps <= 0:
+            return True
+        now = time.monotonic()
+        self._tokens = min(max(1.0, rps), self._tokens + (now - self._refilled) * rps)
+        self._refilled = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def admit(self) -> bool:
+        """요청을 받아들이고 in_flight를 올린다 (거절하면 Rejected). 이 요청을 중간에 끊을지를 돌려준다."""
+        s = self.settings
+        self.stats.requests += 1
+        limit = s.STANDIN_MAX_CONCURRENCY
+        if (limit and self.stats.in_flight >= limit) or not self._take_rps_token():
+            self.stats.rate_limited += 1
+            raise Rejected(429, "Rate limit reached (stand-in throughput limit)", retry_after=1.0)
+        roll = self.rng.random()
+        if roll < s.STANDIN_RATE_LIMIT_RATE:
+            self.stats.rate_limited += 1
+            raise Rejected(429, "Rate limit reached (injected)", retry_after=1.0)
+        if roll < s.STANDIN_RATE_LIMIT_RATE + s.STANDIN_ERROR_RATE:
+            self.stats.errors += 1
+            raise Rejected(500, "The server had an error (injected)")
+        self.stats.in_flight += 1
+        return self.rng.random() < s.STANDIN_STREAM_ABORT_RATE
+
+    def release(self, aborted: bool = False) -> None:
+        self.stats.in_flight -= 1
+        if aborted:
+            self.stats.aborted += 1
+        else:
+            self.stats.ok += 1
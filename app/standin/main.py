@@ -0,0 +1,208 @@
+"""OpenAI 호환 stand-in 서버 (오프라인 지연 테스트용).
+
+/v1/chat/completions (SSE 스트리밍 포함)와 /v1/audio/speech를 흉내 내고, 설정된 분포대로 TTFT/토큰 간격/
+합성 지연을 넣는다. 장애(429, 500, 중간 끊김)와 처리량 상한도 주입할 수 있다.
+gateway와 TTS 서비스의 OPENAI_BASE_URL을 이 서버(예: http://localhost:8002/v1)로 두면 실제 클라이언트 코드가 그대로 붙는다.
+
+Usage: uvicorn app.standin.main:app --port 8002
+"""
+import asyncio
+import io
+import itertools
+import json
+import time
+import wave
+from collections.abc import AsyncIterator
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+
+from app.shared.logging import get_logger, setup_logging
+from app.standin.config import Settings, settings
+from app.standin.faults import FaultInjector, Latency, Rejected
+
+logger = get_logger(__name__)
+
+FILLER = (
+    "Sure, here is a short answer that keeps going for a little while so the client has "
+    "something realistic to stream, segment and synthesize before the reply comes to an end."
+).split()
+AUDIO_CHUNK_BYTES = 4800
+
+
+class StreamAborted(Exception):
+    """주입한 중간 끊김."""
+
+    pass
+
+
+class ChatRequest(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    model: str
+    messages: list[dict]
+    stream: bool = False
+    max_tokens: int | None = None
+
+
+class SpeechRequest(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    model: str = "tts-1"
+    input: str
+    voice: str = "alloy"
+    response_format: str = "mp3"
+
+
+def reply_tokens(messages: list[dict], limit: int) -> list[str]:
+    """마지막 user 메시지를 앞에 두고 filler로 채운 결정적인 응답 토큰 (단어 + 앞 공백)."""
+    last = next((m.get("content", "") for m in reversed(messages) if m.get("role") == "user"), "")
+    words = ["You", "said:"] + str(last).split()[:8] + FILLER
+    words = list(itertools.islice(itertools.cycle(words), max(1, limit)))
+    return [words[0]] + [" " + w for w in words[1:]]
+
+
+def silent_audio(text: str, fmt: str, s: Settings) -> bytes:
+    """텍스트 길이에 비례하는 무음. pcm이 아니면 wav로 준다 (mp3/opus 등도 wav로 대신한다)."""
+    samples = int(len(text) * s.STANDIN_TTS_MS_PER_CHAR / 1000 * s.STANDIN_TTS_SAMPLE_RATE)
+    pcm = b"\x00\x00" * samples
+    if fmt == "pcm":
+        return pcm
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(s.STANDIN_TTS_SAMPLE_RATE)
+        w.writeframes(pcm)
+    return buf.getvalue()
+
+
+def _error(exc: Rejected) -> JSONResponse:
+    logger.info("standin_rejected", status_code=exc.status_code, reason=str(exc))
+    headers = {"Retry-After": f"{exc.retry_after:g}"} if exc.retry_after is not None else None
+    kind = "rate_limit_exceeded" if exc.status_code == 429 else "server_error"
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"error": {"message": str(exc), "type": kind, "code": kind}},
+        headers=headers,
+    )
+
+
+def create_app(s: Settings = settings) -> FastAPI:
+    app = FastAPI(title="openai-standin")
+    faults = FaultInjector(s)
+    ttft = Latency(s.STANDIN_TTFT_MEDIAN_MS, s.STANDIN_TTFT_P99_MS)
+    token_gap = Latency(s.STANDIN_TOKEN_MEDIAN_MS, s.STANDIN_TOKEN_P99_MS)
+    tts_ttfb = Latency(s.STANDIN_TTS_TTFB_MEDIAN_MS, s.STANDIN_TTS_TTFB_P99_MS)
+    ids = itertools.count(1)
+    app.state.faults = faults
+
+    @app.middleware("http")
+    async def require_bearer(request: Request, call_next):
+        if request.url.path.startswith("/v1/") and not request.headers.get("authorization", "").startswith("Bearer "):
+            return JSONResponse(
+                status_code=401,
+                content={"error": {"message": "Missing bearer token", "type": "invalid_request_error", "code": "invalid_api_key"}},
+            )
+        return await call_next(request)
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    @app.get("/stats")
+    async def stats():
+        return faults.stats.to_dict()
+
+    async def released(body: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        aborted = False
+        try:
+            async for chunk in body:
+                yield chunk
+        except StreamAborted:
+            aborted = True
+            raise
+        finally:
+            faults.release(aborted=aborted)
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(req: ChatRequest):
+        try:
+            abort = faults.admit()
+        except Rejected as e:
+            return _error(e)
+
+        limit = min(s.STANDIN_REPLY_TOKENS, req.max_tokens or s.STANDIN_REPLY_TOKENS)
+        tokens = reply_tokens(req.messages, limit)
+        cid = f"chatcmpl-standin-{next(ids)}"
+        created = int(time.time())
+
+        if not req.stream:
+            try:
+                await asyncio.sleep(ttft.sample(faults.rng) + sum(token_gap.sample(faults.rng) for _ in tokens[1:]))
+            finally:
+                faults.release()
+            return {
+                "id": cid,
+                "object": "chat.completion",
+                "created": created,
+                "model": req.model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(tokens)},
+                    "finish_reason": "stop",
+                }],
+            }
+
+        def event(delta: dict, finish: str | None = None) -> bytes:
+            body = {
+                "id": cid,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": req.model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+            }
+            return b"data: " + json.dumps(body, separators=(",", ":")).encode() + b"\n\n"
+
+        async def body() -> AsyncIterator[bytes]:
+            await asyncio.sleep(ttft.sample(faults.rng))
+            yield event({"role": "assistant", "content": ""})
+            for n, token in enumerate(tokens):
+                if n:
+                    await asyncio.sleep(token_gap.sample(faults.rng))
+                if abort and n == len(tokens) // 2:
+                    raise StreamAborted("stream aborted (injected)")
+                yield event({"content": token})
+            yield event({}, "stop")
+            yield b"data: [DONE]\n\n"
+
+        return StreamingResponse(released(body()), media_type="text/event-stream")
+
+    @app.post("/v1/audio/speech")
+    async def speech(req: SpeechRequest):
+        try:
+            abort = faults.admit()
+        except Rejected as e:
+            return _error(e)
+
+        audio = silent_audio(req.input, req.response_format, s)
+
+        async def body() -> AsyncIterator[bytes]:
+            await asyncio.sleep(tts_ttfb.sample(faults.rng))
+            for n, start in enumerate(range(0, len(audio), AUDIO_CHUNK_BYTES)):
+                chunk = audio[start:start + AUDIO_CHUNK_BYTES]
+                if n and s.STANDIN_TTS_BYTES_PER_S > 0:
+                    await asyncio.sleep(len(chunk) / s.STANDIN_TTS_BYTES_PER_S)
+                if abort and n == 1:
+                    raise StreamAborted("stream aborted (injected)")
+                yield chunk
+
+        media_type = "audio/pcm" if req.response_format == "pcm" else "audio/wav"
+        return StreamingResponse(released(body()), media_type=media_type)
+
+    return app
+
+
+setup_logging(json_format=settings.LOG_JSON)
+app = create_app()
@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import Response
+import asyncio
 
-from app.tts.schemas.tts import TTSRequest
-from app.tts.dependencies import get_synthesizer
-from app.tts.services.synthesizer import (
-    BaseSynthesizer,
-    OpenAIFormat,
-    SynthesizeOptions,
-)
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import Response, StreamingResponse
+
+from app.shared.framing import BATCH_MEDIA_TYPE, STATUS_ERROR, encode_frame
+from app.shared.logging import get_logger
+from app.tts.config import settings
+from app.tts.schemas.tts import TTSBatchRequest, TTSRequest, TTSWarmRequest
+from app.tts.dependencies import get_synthesis_service
+from app.tts.services.admission import AdmissionRejected
+from app.tts.services.encoder import EncoderError
+from app.tts.services.synthesis import SynthesisService
+from app.tts.services.synthesizer import OpenAIFormat, SynthesizerError
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 
@@ -21,12 +27,109 @@ CONTENT_TYPES = {
 }
 
 
+def _cache_headers(key: str, tier: str | None = None) -> dict[str, str]:
+    # 같은 키는 항상 같은 오디오이므로 immutable로 내려준다
+    headers = {
+        "Cache-Control": f"public, max-age={settings.TTS_CACHE_MAX_AGE}, immutable",
+        "ETag": f'"{key}"',
+    }
+    if tier is not None:
+        headers["X-Cache"] = tier.upper()
+    return headers
+
+
 @router.post("/tts")
-def tts(
+async def tts(
+    req: TTSRequest,
+    service: SynthesisService = Depends(get_synthesis_service),
+    if_none_match: str | None = Header(default=None),
+):
+    req = service.negotiate(req)
+    media_type = CONTENT_TYPES.get(req.format, "audio/wav")
+    headers = {"X-Audio-Format": req.format.value}
+    if service.audio_cache is None:
+        audio, _tier = await service.synthesize(req)
+        return Response(content=audio, media_type=media_type, headers=headers)
+
+    key = service.key(req)
+    if if_none_match == f'"{key}"':
+        return Response(status_code=304, headers=headers | _cache_headers(key, "revalidated"))
+
+    audio, tier = await service.synthesize(req)
+    return Response(content=audio, media_type=media_type, headers=headers | _cache_headers(key, tier))
+
+
+@router.post("/tts/batch")
+async def tts_batch(
+    req: TTSBatchRequest,
+    service: SynthesisService = Depends(get_synthesis_service),
+):
+    """여러 segment를 동시에(최대 TTS_BATCH_CONCURRENCY) 합성하고 요청 순서대로 frame을 흘려보낸다.
+
+    응답 body는 app.shared.framing의 length-prefixed frame 스트림이다.
+    segment 하나가 실패해도 나머지는 계속 보내고, 실패한 자리는 error frame으로 채운다.
+    """
+    sem = asyncio.Semaphore(settings.TTS_BATCH_CONCURRENCY)
+
+    async def run(segment: TTSRequest) -> bytes:
+        async with sem:
+            audio, _tier = await service.synthesize(service.negotiate(segment))
+            return audio
+
+    tasks = [asyncio.create_task(run(segment)) for segment in req.segments]
+
+    async def body():
+        try:
+            for index, task in enumerate(tasks):
+                try:
+                    audio = await task
+                except (SynthesizerError, AdmissionRejected, EncoderError) as e:
+                    logger.warning("tts_batch_segment_failed", index=index, error=str(e))
+                    yield encode_frame(index, str(e).encode("utf-8"), status=STATUS_ERROR)
+                    continue
+                yield encode_frame(index, audio)
+        finally:
+            # 클라이언트가 끊으면 남은 합성은 취소한다
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(
+        body(),
+        media_type=BATCH_MEDIA_TYPE,
+        headers={"X-Batch-Segments": str(len(tasks))},
+    )
+
+
+@router.post("/tts/warm")
+async def tts_warm(
+    req: TTSWarmRequest,
+    service: SynthesisService = Depends(get_synthesis_service),
+):
+    """phrase들을 미리 합성해서 warm store에 고정한다. budget_ms가 지나면 남은 건 포기한다."""
+    phrases = [service.negotiate(phrase) for phrase in req.phrases]
+    return await service.warm(
+        phrases, budget_s=req.budget_ms / 1000, concurrency=settings.TTS_WARM_CONCURRENCY, group=req.group
+    )
+
+
+@router.post("/tts/stream")
+async def tts_stream(
     req: TTSRequest,
-    synthesizer: BaseSynthesizer = Depends(get_synthesizer),
+    service: SynthesisService = Depends(get_synthesis_service),
 ):
-    options = SynthesizeOptions(voice=req.voice, format=req.format)
-    audio = synthesizer.synthesize(req.text, options)
+    req = service.negotiate(req)
     media_type = CONTENT_TYPES.get(req.format, "audio/wav")
-    return Response(content=audio, media_type=media_type)
+    chunks = service.stream(req)
+    # 첫 청크까지는 여기서 받아서, 업스트림 에러/거절이 200 응답 전에 드러나도록 한다
+    first = await anext(chunks, b"")
+
+    async def body():
+        if first:
+            yield first
+        async for chunk in chunks:
+            yield chunk
+
+    headers = {"X-Audio-Format": req.format.value}
+    if service.audio_cache is not None:
+        headers |= _cache_headers(service.key(req))
+    return StreamingResponse(body(), media_type=media_type, headers=headers)
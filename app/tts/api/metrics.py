@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+
+from app.tts.dependencies import get_synthesis_service
+from app.tts.services.synthesis import SynthesisService
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def metrics(service: SynthesisService = Depends(get_synthesis_service)):
+    upstream = getattr(service.synthesizer, "upstream", None)  # OpenAISynthesizer만 있음
+    return {
+        "cache": service.audio_cache.stats().to_dict() if service.audio_cache else None,
+        "admission": service.admission.stats().to_dict() if service.admission else None,
+        "warm": service.warm_store.stats().to_dict() if service.warm_store else None,
+        "pipeline": service.stats(),
+        "upstream": upstream.snapshot() if upstream is not None else None,
+    }
@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+
+from app.shared.framing import STATUS_END, STATUS_ERROR, STATUS_FATAL, encode_frame
+from app.shared.logging import get_logger
+from app.tts.config import settings
+from app.tts.schemas.tts import TTSChannelRequest
+from app.tts.services.admission import AdmissionRejected
+from app.tts.services.synthesizer import SynthesizerError
+
+logger = get_logger(__name__)
+
+router = APIRouter()
+
+
+@router.websocket("/ws/tts")
+async def ws_tts(ws: WebSocket):
+    """게이트웨이와의 장기 연결 채널.
+
+    - 요청: text frame, TTSChannelRequest JSON ({"id", "text", "voice", "format"}) 또는
+      {"id", "cancel": true}
+    - 응답: app.shared.framing binary frame. index = 요청 id.
+      오디오가 만들어지는 대로 OK frame을 보내고 END(또는 ERROR/FATAL) frame으로 끝낸다.
+      다시 보내도 똑같이 실패할 요청(검증 실패, 재시도 불가 합성 오류)은 FATAL이다.
+    여러 요청이 한 연결 위에서 동시에 진행되며(최대 TTS_WS_MAX_INFLIGHT), frame은 id로 구분된다.
+    """
+    await ws.accept()
+    service = ws.app.state.synthesis
+
+    send_lock = asyncio.Lock()
+    inflight = asyncio.Semaphore(settings.TTS_WS_MAX_INFLIGHT)
+    tasks: dict[int, asyncio.Task] = {}
+
+    async def send(frame: bytes):
+        async with send_lock:
+            await ws.send_bytes(frame)
+
+    async def run(req: TTSChannelRequest):
+        try:
+            async with inflight:
+                async for chunk in service.stream(service.negotiate(req)):
+                    await send(encode_frame(req.id, chunk))
+            await send(encode_frame(req.id, b"", status=STATUS_END))
+        except AdmissionRejected as e:
+            await send(encode_frame(req.id, str(e).encode("utf-8"), status=STATUS_ERROR))
+        except SynthesizerError as e:
+            status = STATUS_ERROR if e.retryable else STATUS_FATAL
+            await send(encode_frame(req.id, str(e).encode("utf-8"), status=status))
+        except Exception as e:
+            # 인코딩/디스크 오류 등도 terminal frame은 꼭 보낸다 (안 보내면 게이트웨이 쪽 요청이 끝나지 않는다)
+            logger.error("tts_ws_request_failed", id=req.id, error=repr(e))
+            await send(encode_frame(req.id, b"internal error", status=STATUS_ERROR))
+        finally:
+            tasks.pop(req.id, None)
+
+    try:
+        while True:
+            raw = await ws.receive_text()
+            try:
+                msg = json.loads(raw)
+            except json.JSONDecodeError as e:
+                # 메시지 하나가 깨졌다고 연결(과 그 위의 다른 요청들)을 끊지 않는다
+                logger.warning("tts_ws_bad_message", error=str(e))
+                continue
+            if not isinstance(msg, dict):
+                logger.warning("tts_ws_bad_message", error="not a JSON object")
+                continue
+            if msg.get("cancel"):
+                task = tasks.pop(msg.get("id"), None)
+                if task is not None:
+                    task.cancel()
+                continue
+
+            try:
+                req = TTSChannelRequest.model_validate(msg)
+            except ValidationError as e:
+                logger.warning("tts_ws_bad_request", error=str(e))
+                if isinstance(msg.get("id"), int):
+                    await send(encode_frame(msg["id"], b"invalid request", status=STATUS_FATAL))
+                continue
+            tasks[req.id] = asyncio.create_task(run(req))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in tasks.values():
+            task.cancel()
@@ -11,10 +11,63 @@ class Settings(BaseSettings):
     # Provider selection: "dummy" | "openai"
     TTS_PROVIDER: str = "dummy"
 
+    # Execution mode for local (CPU-bound) synthesizers: "inline" | "process"
+    TTS_EXECUTOR: str = "inline"
+    TTS_PROCESS_WORKERS: int = 0  # 0이면 os.cpu_count()
+
+    # "lazy": 업스트림엔 PCM만 요청하고 포맷은 로컬 인코딩 | "upstream": 포맷마다 업스트림 합성
+    TTS_ENCODE_MODE: str = "lazy"
+    TTS_FFMPEG_PATH: str | None = None  # 비어 있으면 PATH에서 찾음 (없으면 압축 포맷은 upstream)
+
     # OpenAI TTS settings
     OPENAI_API_KEY: str | None = None
     OPENAI_TTS_MODEL: str = "tts-1"  # "tts-1" | "tts-1-hd"
     OPENAI_TTS_VOICE: str = "alloy"  # alloy, echo, fable, onyx, nova, shimmer
+    OPENAI_BASE_URL: str | None = None  # OpenAI 호환 서버 (예: 로컬 stand-in http://localhost:8002/v1)
+
+    # Upstream HTTP connection pool (lifespan 동안 하나만 생성)
+    TTS_HTTP_TIMEOUT: float = 30.0
+    TTS_HTTP_CONNECT_TIMEOUT: float = 5.0
+    TTS_HTTP_MAX_CONNECTIONS: int = 100
+    TTS_HTTP_MAX_KEEPALIVE: int = 20
+    TTS_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    TTS_HTTP2: bool = False  # requires `h2` (pip install "httpx[http2]")
+
+    # Upstream 장애 대응: 첫 바이트 전 실패(timeout/429/5xx)만 재시도, 연속 실패 시 breaker open
+    UPSTREAM_RETRY_MAX_ATTEMPTS: int = 3
+    UPSTREAM_RETRY_BASE_DELAY_MS: int = 200
+    UPSTREAM_RETRY_MAX_DELAY_MS: int = 2000
+    UPSTREAM_BREAKER_THRESHOLD: int = 5
+    UPSTREAM_BREAKER_RESET_MS: int = 10000
+    UPSTREAM_BREAKER_FAST_FAIL: bool = True  # False면 상태만 기록하고 호출은 막지 않는다
+
+    # Admission control (동시 합성 수 / 대기열)
+    TTS_MAX_CONCURRENCY: int = 32
+    TTS_MAX_QUEUE: int = 64
+    TTS_MAX_QUEUE_WAIT_MS: int = 2000
+
+    # Batch synthesis (/tts/batch)
+    TTS_BATCH_MAX_SEGMENTS: int = 32
+    TTS_BATCH_CONCURRENCY: int = 4
+
+    # Persistent WebSocket channel (/ws/tts)
+    TTS_WS_MAX_INFLIGHT: int = 16  # 커넥션당 동시 합성 수 (초과 요청은 대기)
+
+    # Audio cache (memory LRU -> disk tier)
+    TTS_CACHE_ENABLED: bool = True
+    TTS_CACHE_MEMORY_BYTES: int = 64 * 1024 * 1024
+    TTS_CACHE_DISK_DIR: str | None = None  # None이면 disk tier 비활성
+    TTS_CACHE_DISK_BYTES: int = 1024 * 1024 * 1024
+    TTS_CACHE_MAX_AGE: int = 60 * 60 * 24  # Cache-Control max-age (seconds)
+
+    # Warm phrase store (미리 합성해서 고정해 두는 인사말/filler)
+    TTS_WARM_STORE_BYTES: int = 16 * 1024 * 1024  # 0이면 비활성
+    TTS_WARM_PHRASES: list[str] = []  # 시작 시 미리 합성할 phrase (gateway는 /tts/warm으로 보냄)
+    TTS_WARM_VOICES: list[str] = ["alloy"]
+    TTS_WARM_FORMAT: str = "wav"
+    TTS_WARM_BUDGET_MS: int = 30000
+    TTS_WARM_CONCURRENCY: int = 2
+    TTS_WARM_MAX_PHRASES: int = 64  # /tts/warm 요청 하나에 담을 수 있는 phrase 수
 
     # Logging
     LOG_JSON: bool = True
@@ -1,14 +1,57 @@
+import httpx
+from fastapi import Request
+
+from app.shared.resilience import CircuitBreaker, RetryPolicy, Upstream
 from app.tts.config import settings
+from app.tts.schemas.tts import TTSRequest
+from app.tts.services.admission import AdmissionController
+from app.tts.services.cache import AudioCache
+from app.tts.services.encoder import AudioEncoder
+from app.tts.services.executor import ProcessPoolSynthesizer
+from app.tts.services.synthesis import SynthesisService
 from app.tts.services.synthesizer import (
     BaseSynthesizer,
     DummySynthesizer,
+    OpenAIFormat,
     OpenAISynthesizer,
     OpenAIVoice,
     SynthesizerOptions,
 )
+from app.tts.services.warm import WarmPhraseStore
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """Keep-alive connection pool shared by every upstream TTS request."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.TTS_HTTP_TIMEOUT, connect=settings.TTS_HTTP_CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=settings.TTS_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.TTS_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.TTS_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        http2=settings.TTS_HTTP2,
+    )
+
+
+def build_upstream() -> Upstream:
+    """Circuit breaker + pre-first-byte retries for the OpenAI speech endpoint."""
+    return Upstream(
+        CircuitBreaker(
+            "openai_tts",
+            failure_threshold=settings.UPSTREAM_BREAKER_THRESHOLD,
+            reset_timeout_s=settings.UPSTREAM_BREAKER_RESET_MS / 1000,
+            fast_fail=settings.UPSTREAM_BREAKER_FAST_FAIL,
+        ),
+        RetryPolicy(
+            max_attempts=settings.UPSTREAM_RETRY_MAX_ATTEMPTS,
+            base_delay_s=settings.UPSTREAM_RETRY_BASE_DELAY_MS / 1000,
+            max_delay_s=settings.UPSTREAM_RETRY_MAX_DELAY_MS / 1000,
+        ),
+    )
 
 
-def get_synthesizer() -> BaseSynthesizer:
+def build_synthesizer() -> BaseSynthesizer:
+    """Create the process-wide synthesizer (called once from lifespan)."""
     if settings.TTS_PROVIDER == "openai":
         if not settings.OPENAI_API_KEY:
             raise RuntimeError("OPENAI_API_KEY is required when TTS_PROVIDER=openai")
@@ -16,7 +59,67 @@ def get_synthesizer() -> BaseSynthesizer:
             api_key=settings.OPENAI_API_KEY,
             model=settings.OPENAI_TTS_MODEL,
             voice=OpenAIVoice(settings.OPENAI_TTS_VOICE),
+            client=build_http_client(),
+            base_url=settings.OPENAI_BASE_URL,
+            upstream=build_upstream(),
         )
-    return DummySynthesizer(
+    local = DummySynthesizer(
         options=SynthesizerOptions(sample_rate=settings.TTS_SAMPLE_RATE)
     )
+    if settings.TTS_EXECUTOR == "process":
+        return ProcessPoolSynthesizer(local, workers=settings.TTS_PROCESS_WORKERS or None)
+    return local
+
+
+def build_audio_cache() -> AudioCache | None:
+    if not settings.TTS_CACHE_ENABLED:
+        return None
+    return AudioCache(
+        memory_bytes=settings.TTS_CACHE_MEMORY_BYTES,
+        disk_dir=settings.TTS_CACHE_DISK_DIR,
+        disk_bytes=settings.TTS_CACHE_DISK_BYTES,
+    )
+
+
+def build_admission() -> AdmissionController:
+    return AdmissionController(
+        max_concurrency=settings.TTS_MAX_CONCURRENCY,
+        max_queue=settings.TTS_MAX_QUEUE,
+        max_wait_s=settings.TTS_MAX_QUEUE_WAIT_MS / 1000,
+    )
+
+
+def build_encoder() -> AudioEncoder | None:
+    if settings.TTS_ENCODE_MODE != "lazy":
+        return None
+    return AudioEncoder(sample_rate=settings.TTS_SAMPLE_RATE, ffmpeg_path=settings.TTS_FFMPEG_PATH)
+
+
+def build_warm_store() -> WarmPhraseStore | None:
+    if settings.TTS_WARM_STORE_BYTES <= 0:
+        return None
+    return WarmPhraseStore(max_bytes=settings.TTS_WARM_STORE_BYTES)
+
+
+def build_synthesis_service() -> SynthesisService:
+    """Create the process-wide synthesis pipeline (called once from lifespan)."""
+    return SynthesisService(
+        synthesizer=build_synthesizer(),
+        audio_cache=build_audio_cache(),
+        admission=build_admission(),
+        encoder=build_encoder(),
+        warm_store=build_warm_store(),
+    )
+
+
+def build_startup_warm_requests() -> list[TTSRequest]:
+    """TTS_WARM_PHRASES x TTS_WARM_VOICES 조합 (lifespan 시작 시 백그라운드로 합성)."""
+    return [
+        TTSRequest(text=text, voice=OpenAIVoice(voice), format=OpenAIFormat(settings.TTS_WARM_FORMAT))
+        for voice in settings.TTS_WARM_VOICES
+        for text in settings.TTS_WARM_PHRASES
+    ]
+
+
+def get_synthesis_service(request: Request) -> SynthesisService:
+    return request.app.state.synthesis
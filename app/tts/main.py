@@ -1,10 +1,18 @@
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from app.tts.api.http import router as http_router
 from app.tts.api.health import router as health_router
+from app.tts.api.metrics import router as metrics_router
+from app.tts.api.ws import router as ws_router
 from app.shared.logging import setup_logging, get_logger
 from app.tts.config import settings
+from app.tts.dependencies import build_startup_warm_requests, build_synthesis_service
+from app.tts.services.admission import AdmissionRejected
+from app.tts.services.encoder import EncoderError
+from app.tts.services.synthesizer import SynthesizerError
 
 setup_logging(json_format=settings.LOG_JSON)
 
@@ -12,12 +20,54 @@ logger = get_logger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI):
-    logger.info("tts_started", port=8001)
+async def lifespan(app: FastAPI):
+    app.state.synthesis = build_synthesis_service()
+    await app.state.synthesis.start()
+    # warm-up은 readiness를 막지 않도록 백그라운드에서 돌린다
+    warm_task = asyncio.create_task(
+        app.state.synthesis.warm(
+            build_startup_warm_requests(),
+            budget_s=settings.TTS_WARM_BUDGET_MS / 1000,
+            concurrency=settings.TTS_WARM_CONCURRENCY,
+        )
+    )
+    logger.info(
+        "tts_started", port=8001, provider=settings.TTS_PROVIDER, executor=settings.TTS_EXECUTOR
+    )
     yield
+    warm_task.cancel()
+    await asyncio.gather(warm_task, return_exceptions=True)
+    await app.state.synthesis.aclose()
     logger.info("tts_shutdown")
 
 
 app = FastAPI(title="tts-service", lifespan=lifespan)
+
+
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected_handler(_request: Request, exc: AdmissionRejected):
+    logger.warning("tts_rejected", reason=exc.reason, retry_after=exc.retry_after)
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc), "reason": exc.reason},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.exception_handler(SynthesizerError)
+async def synthesizer_error_handler(_request: Request, exc: SynthesizerError):
+    logger.warning("tts_synthesis_failed", error=str(exc), retryable=exc.retryable)
+    # 업스트림 쪽 실패: 다시 보내면 될 수 있는 건 503, 아니면 502
+    return JSONResponse(status_code=503 if exc.retryable else 502, content={"detail": str(exc)})
+
+
+@app.exception_handler(EncoderError)
+async def encoder_error_handler(_request: Request, exc: EncoderError):
+    logger.error("tts_encode_failed", error=str(exc))
+    return JSONResponse(status_code=500, content={"detail": str(exc)})
+
+
 app.include_router(http_router)
-app.include_router(health_router)
\ No newline at end of file
+app.include_router(health_router)
+app.include_router(metrics_router)
+app.include_router(ws_router)
\ No newline at end of file
@@ -1,3 +1,3 @@
-from app.tts.schemas.tts import TTSRequest
+from app.tts.schemas.tts import TTSBatchRequest, TTSChannelRequest, TTSRequest, TTSWarmRequest
 
-__all__ = ["TTSRequest"]
+__all__ = ["TTSBatchRequest", "TTSChannelRequest", "TTSRequest", "TTSWarmRequest"]
@@ -8,3 +8,22 @@ class TTSRequest(BaseModel):
     text: str = Field(..., min_length=1, max_length=settings.TTS_MAX_TEXT_LEN)
     voice: OpenAIVoice = OpenAIVoice.ALLOY
     format: OpenAIFormat = OpenAIFormat.WAV
+    # 받을 수 있는 포맷 목록. 주어지면 서버가 그중 가장 작은 포맷을 골라 format을 덮어쓴다.
+    accept_formats: list[OpenAIFormat] | None = None
+
+
+class TTSBatchRequest(BaseModel):
+    segments: list[TTSRequest] = Field(..., min_length=1, max_length=settings.TTS_BATCH_MAX_SEGMENTS)
+
+
+class TTSWarmRequest(BaseModel):
+    phrases: list[TTSRequest] = Field(..., max_length=settings.TTS_WARM_MAX_PHRASES)
+    budget_ms: int = Field(default=settings.TTS_WARM_BUDGET_MS, gt=0)
+    # 같은 group으로 다시 보내면 이번 목록에 없는 phrase는 고정을 푼다 (빈 목록이면 전부)
+    group: str | None = Field(default=None, max_length=128)
+
+
+class TTSChannelRequest(TTSRequest):
+    """/ws/tts 채널 요청. id는 응답 frame의 index로 그대로 돌아간다."""
+
+    id: int = Field(..., ge=0)
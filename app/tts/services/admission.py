@@ -0,0 +1,96 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+
+
+class AdmissionRejected(Exception):
+    """The service is at capacity; the caller should retry after `retry_after` seconds."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"TTS overloaded ({reason})")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass
+class AdmissionStats:
+    in_flight: int = 0
+    queue_depth: int = 0
+    max_concurrency: int = 0
+    max_queue: int = 0
+    admitted: int = 0
+    rejected_queue_full: int = 0
+    rejected_queue_timeout: int = 0
+    avg_service_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class AdmissionController:
+    """동시 합성 수 제한 + 상한 있는 대기열 + 최대 대기 시간.
+
+    슬롯이 없으면 대기열에서 기다리고, 대기열이 꽉 찼거나 max_wait 안에 슬롯을 못 얻으면
+    AdmissionRejected로 바로 거절한다. 모두가 같이 타임아웃 나는 대신 일부를 빨리 돌려보낸다.
+    """
+
+    EWMA_ALPHA = 0.2
+
+    def __init__(self, max_concurrency: int, max_queue: int, max_wait_s: float):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait_s = max_wait_s
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._in_flight = 0
+        self._waiting = 0
+        self._admitted = 0
+        self._rejected_full = 0
+        self._rejected_timeout = 0
+        self._avg_service_s = 0.0
+
+    def _retry_after(self) -> int:
+        # 지금 대기열이 다 빠지는 데 걸릴 대략적인 시간
+        backlog = (self._waiting + 1) / self.max_concurrency
+        return max(1, math.ceil(self._avg_service_s * backlog))
+
+    @asynccontextmanager
+    async def slot(self):
+        if self._sem.locked():
+            if self._waiting >= self.max_queue:
+                self._rejected_full += 1
+                raise AdmissionRejected("queue_full", self._retry_after())
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(self._sem.acquire(), timeout=self.max_wait_s)
+            except TimeoutError:
+                self._rejected_timeout += 1
+                raise AdmissionRejected("queue_timeout", self._retry_after()) from None
+            finally:
+                self._waiting -= 1
+        else:
+            await self._sem.acquire()
+
+        self._in_flight += 1
+        self._admitted += 1
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._sem.release()
+            elapsed = time.perf_counter() - t0
+            self._avg_service_s += self.EWMA_ALPHA * (elapsed - self._avg_service_s)
+
+    def stats(self) -> AdmissionStats:
+        return AdmissionStats(
+            in_flight=self._in_flight,
+            queue_depth=self._waiting,
+            max_concurrency=self.max_concurrency,
+            max_queue=self.max_queue,
+            admitted=self._admitted,
+            rejected_queue_full=self._rejected_full,
+            rejected_queue_timeout=self._rejected_timeout,
+            avg_service_ms=round(self._avg_service_s * 1000, 1),
+        )
@@ -0,0 +1,197 @@
+import asyncio
+import hashlib
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from app.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFKC + 공백 정리). 대소문자/구두점은 억양에 영향을 주므로 유지."""
+    return _WS_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def cache_key(text: str, voice: str, fmt: str, model: str, sample_rate: int) -> str:
+    raw = "\x1f".join([normalize_text(text), voice, fmt, model, str(sample_rate)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_evictions: int = 0
+    disk_evictions: int = 0
+    memory_bytes: int = 0
+    memory_entries: int = 0
+    disk_bytes: int = 0
+    disk_entries: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class MemoryLRU:
+    """바이트 크기로 상한이 정해진 in-memory LRU."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._items: OrderedDict[str, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> bytes | None:
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        self._items[key] = value
+        self.size += len(value)
+        while self.size > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+
+class DiskTier:
+    """키마다 segment 파일 하나. 총 크기가 넘치면 가장 오래 안 쓴 파일부터 지운다.
+
+    인덱스는 시작 시 디렉터리를 스캔해서 복구하므로 재시작 후에도 유지된다.
+    """
+
+    SUFFIX = ".seg"
+
+    def __init__(self, directory: str | Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()  # to_thread에서 동시에 불린다
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{self.SUFFIX}"
+
+    def _load_index(self) -> None:
+        entries = []
+        for path in self.directory.glob(f"*/*{self.SUFFIX}"):
+            st = path.stat()
+            entries.append((st.st_mtime, path.stem, st.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self.size += size
+        self._evict()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            if key not in self._index:
+                return None
+            path = self._path(key)
+            try:
+                # hit은 어차피 bytes로 memory tier에 올라가고 응답으로 나가므로 한 번에 읽는다
+                value = path.read_bytes()
+                os.utime(path)  # 재시작 후 LRU 순서 복구용
+            except OSError:
+                self._drop(key)
+                return None
+            if not value:  # 잘린 파일
+                self._drop(key)
+                return None
+            self._index.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: bytes) -> None:
+        if not value or len(value) > self.max_bytes:
+            return
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(value)
+        os.replace(tmp, path)
+
+        with self._lock:
+            self.size -= self._index.pop(key, 0)
+            self._index[key] = len(value)
+            self.size += len(value)
+            self._evict()
+
+    def _drop(self, key: str) -> None:
+        self.size -= self._index.pop(key, 0)
+        self._path(key).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes and self._index:
+            key = next(iter(self._index))
+            self._drop(key)
+            self.evictions += 1
+
+
+class AudioCache:
+    """Content-addressed TTS 오디오 캐시: memory LRU -> disk tier."""
+
+    def __init__(self, memory_bytes: int, disk_dir: str | None = None, disk_bytes: int = 0):
+        self.memory = MemoryLRU(memory_bytes)
+        self.disk = DiskTier(disk_dir, disk_bytes) if disk_dir and disk_bytes > 0 else None
+        self._stats = CacheStats()
+
+    async def get(self, key: str) -> tuple[bytes | None, str]:
+        """(audio, tier) 반환. tier는 "memory" | "disk" | "miss"."""
+        value = self.memory.get(key)
+        if value is not None:
+            self._stats.memory_hits += 1
+            return value, "memory"
+
+        if self.disk is not None:
+            value = await asyncio.to_thread(self.disk.get, key)
+            if value is not None:
+                self._stats.disk_hits += 1
+                self.memory.put(key, value)
+                return value, "disk"
+
+        self._stats.misses += 1
+        return None, "miss"
+
+    async def put(self, key: str, value: bytes) -> None:
+        self.memory.put(key, value)
+        if self.disk is not None:
+            try:
+                await asyncio.to_thread(self.disk.put, key, value)
+            except OSError as e:
+                logger.warning("tts_cache_disk_write_failed", error=str(e))
+
+    def stats(self) -> CacheStats:
+        s = self._stats
+        s.memory_evictions = self.memory.evictions
+        s.memory_bytes = self.memory.size
+        s.memory_entries = len(self.memory)
+        if self.disk is not None:
+            s.disk_evictions = self.disk.evictions
+            s.disk_bytes = self.disk.size
+            s.disk_entries = len(self.disk)
+        return s
@@ -0,0 +1,85 @@
+import asyncio
+import shutil
+
+from app.shared.logging import get_logger
+from app.tts.services.synthesizer import OpenAIFormat, wav_header
+
+logger = get_logger(__name__)
+
+# 같은 길이의 음성을 기준으로 대략적인 전송 크기가 작은 순서
+BANDWIDTH_ORDER = [
+    OpenAIFormat.OPUS,
+    OpenAIFormat.AAC,
+    OpenAIFormat.MP3,
+    OpenAIFormat.FLAC,
+    OpenAIFormat.PCM,
+    OpenAIFormat.WAV,
+]
+
+# ffmpeg -f <muxer> -c:a <codec>
+_FFMPEG_TARGETS = {
+    OpenAIFormat.OPUS: ("ogg", "libopus"),
+    OpenAIFormat.AAC: ("adts", "aac"),
+    OpenAIFormat.MP3: ("mp3", "libmp3lame"),
+    OpenAIFormat.FLAC: ("flac", "flac"),
+}
+
+
+class EncoderError(Exception):
+    """Local encoding of canonical PCM failed."""
+
+    pass
+
+
+class AudioEncoder:
+    """Canonical PCM16 mono를 요청 포맷으로 바꾸는 로컬 인코딩 단계.
+
+    wav/pcm은 헤더만 붙이거나 그대로 돌려주므로 항상 가능하다.
+    압축 포맷은 ffmpeg가 있을 때만 지원하고, 없으면 can_encode()가 False라서
+    SynthesisService가 해당 포맷은 업스트림 합성으로 처리한다.
+    """
+
+    def __init__(self, sample_rate: int, ffmpeg_path: str | None = None):
+        self.sample_rate = sample_rate
+        self.ffmpeg_path = ffmpeg_path or shutil.which("ffmpeg")
+
+    def can_encode(self, fmt: OpenAIFormat) -> bool:
+        if fmt in (OpenAIFormat.PCM, OpenAIFormat.WAV):
+            return True
+        return self.ffmpeg_path is not None and fmt in _FFMPEG_TARGETS
+
+    def supported_formats(self) -> list[OpenAIFormat]:
+        return [fmt for fmt in BANDWIDTH_ORDER if self.can_encode(fmt)]
+
+    def negotiate(self, accepted: list[OpenAIFormat]) -> OpenAIFormat | None:
+        """클라이언트가 받을 수 있는 포맷 중 로컬에서 만들 수 있는 가장 작은 포맷."""
+        for fmt in BANDWIDTH_ORDER:
+            if fmt in accepted and self.can_encode(fmt):
+                return fmt
+        return None
+
+    async def encode(self, pcm: bytes, fmt: OpenAIFormat) -> bytes:
+        if fmt == OpenAIFormat.PCM:
+            return pcm
+        if fmt == OpenAIFormat.WAV:
+            return wav_header(1, 2, self.sample_rate, len(pcm)) + pcm
+        if not self.can_encode(fmt):
+            raise EncoderError(f"no local encoder for {fmt.value}")
+        return await self._ffmpeg(pcm, fmt)
+
+    async def _ffmpeg(self, pcm: bytes, fmt: OpenAIFormat) -> bytes:
+        muxer, codec = _FFMPEG_TARGETS[fmt]
+        proc = await asyncio.create_subprocess_exec(
+            self.ffmpeg_path,
+            "-hide_banner", "-loglevel", "error",
+            "-f", "s16le", "-ar", str(self.sample_rate), "-ac", "1", "-i", "pipe:0",
+            "-c:a", codec, "-f", muxer, "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        out, err = await proc.communicate(pcm)
+        if proc.returncode != 0:
+            logger.error("tts_encode_error", format=fmt.value, stderr=err.decode(errors="replace")[-500:])
+            raise EncoderError(f"ffmpeg failed to encode {fmt.value}")
+        return out
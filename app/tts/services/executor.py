@@ -0,0 +1,115 @@
+import asyncio
+import multiprocessing
+import os
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from app.shared.logging import get_logger
+from app.tts.services.synthesizer import (
+    WAV_HEADER_SIZE,
+    LocalSynthesizer,
+    OpenAIFormat,
+    SynthesizeOptions,
+)
+
+logger = get_logger(__name__)
+
+# 워커 프로세스 전역 상태 (initializer에서 채운다)
+_worker_synth: LocalSynthesizer | None = None
+_worker_buffers: dict[str, SharedMemory] = {}
+
+
+def _init_worker(synth: LocalSynthesizer) -> None:
+    global _worker_synth
+    _worker_synth = synth
+
+
+def _attach(name: str) -> SharedMemory:
+    shm = _worker_buffers.get(name)
+    if shm is None:
+        # spawn 워커는 부모의 resource tracker를 같이 쓰므로 unlink는 부모 쪽 한 번이면 된다
+        shm = SharedMemory(name=name)
+        _worker_buffers[name] = shm
+    return shm
+
+
+def _warm_up(slot: str) -> int:
+    # 톤 테이블 등 lazy 초기화를 미리 끝내고, 공유 버퍼도 붙여 둔다
+    return _render_into(slot, "warm up")
+
+
+def _render_into(slot: str, text: str) -> int:
+    """공유 버퍼 slot에 결과를 직접 쓰고 길이만 돌려준다 (큰 bytes를 pickle 하지 않음)."""
+    shm = _attach(slot)
+    return _worker_synth.render_into(text, shm.buf)
+
+
+class ProcessPoolSynthesizer(LocalSynthesizer):
+    """LocalSynthesizer를 코어 수만큼의 워커 프로세스에서 돌린다.
+
+    결과는 미리 잡아 둔 공유 메모리 slot(max_output_bytes 크기)으로 돌려받는다.
+    slot 수 = 워커 수 x 2 라서 워커가 쉬지 않으면서도 동시에 쓰는 slot이 겹치지 않는다.
+    """
+
+    def __init__(self, local: LocalSynthesizer, workers: int | None = None):
+        self.local = local
+        self.model = local.model
+        self.workers = workers or os.cpu_count() or 1
+        self._slot_size = local.max_output_bytes
+        self._buffers = [SharedMemory(create=True, size=self._slot_size) for _ in range(self.workers * 2)]
+        self._free: asyncio.Queue[SharedMemory] = asyncio.Queue()
+        for shm in self._buffers:
+            self._free.put_nowait(shm)
+        # fork는 이벤트 루프/스레드 상태까지 복제하므로 spawn을 쓴다
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(local,),
+        )
+
+    @property
+    def max_output_bytes(self) -> int:
+        return self._slot_size
+
+    def render(self, text: str) -> bytes:
+        return self.local.render(text)
+
+    async def warm_up(self) -> None:
+        """워커를 전부 띄우고 각 slot을 한 번씩 써 본다 (첫 요청이 프로세스 spawn을 기다리지 않게)."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(self._pool, _warm_up, shm.name) for shm in self._buffers)
+        )
+        logger.info("tts_process_pool_ready", workers=self.workers, slot_bytes=self._slot_size)
+
+    async def synthesize(self, text: str, options: SynthesizeOptions | None = None) -> bytes:
+        shm = await self._free.get()
+        loop = asyncio.get_running_loop()
+        fut = loop.run_in_executor(self._pool, _render_into, shm.name, text)
+        try:
+            n = await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            # 워커가 아직 slot에 쓰는 중일 수 있으니, 끝난 뒤에 반납한다
+            fut.add_done_callback(lambda _: self._free.put_nowait(shm))
+            raise
+        except BaseException:
+            self._free.put_nowait(shm)
+            raise
+        start = WAV_HEADER_SIZE if options is not None and options.format == OpenAIFormat.PCM else 0
+        try:
+            return bytes(shm.buf[start:n])
+        finally:
+            self._free.put_nowait(shm)
+
+    async def stream(
+        self, text: str, options: SynthesizeOptions | None = None
+    ) -> AsyncIterator[bytes]:
+        yield await self.synthesize(text, options)
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self._pool.shutdown, wait=True, cancel_futures=True)
+        for shm in self._buffers:
+            shm.close()
+            shm.unlink()
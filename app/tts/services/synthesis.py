@@ -0,0 +1,211 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
+
+from app.shared.logging import get_logger
+from app.tts.config import settings
+from app.tts.schemas.tts import TTSRequest
+from app.tts.services.admission import AdmissionController, AdmissionRejected
+from app.tts.services.cache import AudioCache, cache_key
+from app.tts.services.encoder import BANDWIDTH_ORDER, AudioEncoder, EncoderError
+from app.tts.services.synthesizer import (
+    BaseSynthesizer,
+    OpenAIFormat,
+    SynthesizeOptions,
+    SynthesizerError,
+)
+from app.tts.services.warm import WarmPhraseStore
+
+logger = get_logger(__name__)
+
+
+class SynthesisService:
+    """요청 하나를 처리하는 경로: 캐시 -> admission -> synthesizer (-> encoder).
+
+    HTTP/WebSocket 엔드포인트는 모두 이걸 거친다. 캐시 hit은 admission 슬롯을 쓰지 않는다.
+
+    encoder가 있으면(lazy 모드) 업스트림에는 항상 canonical PCM만 요청하고 캐시에 남겨 둔다.
+    같은 문장을 다른 포맷으로 요청하면 PCM을 로컬에서 인코딩만 하고, 결과는 포맷별 키로 캐시한다.
+
+    warm_store가 있으면 캐시보다 먼저 본다. warm()으로 미리 합성한 인사말/filler가 여기 고정된다.
+    """
+
+    def __init__(
+        self,
+        synthesizer: BaseSynthesizer,
+        audio_cache: AudioCache | None = None,
+        admission: AdmissionController | None = None,
+        encoder: AudioEncoder | None = None,
+        warm_store: WarmPhraseStore | None = None,
+    ):
+        self.synthesizer = synthesizer
+        self.audio_cache = audio_cache
+        self.admission = admission
+        self.encoder = encoder
+        self.warm_store = warm_store
+        self.upstream_calls = 0
+        self.local_encodes: dict[str, int] = {}
+
+    async def start(self) -> None:
+        await self.synthesizer.warm_up()
+
+    async def aclose(self) -> None:
+        await self.synthesizer.aclose()
+
+    def key(self, req: TTSRequest, fmt: OpenAIFormat | None = None) -> str:
+        fmt = fmt or req.format
+        return cache_key(
+            req.text, req.voice.value, fmt.value, self.synthesizer.model, settings.TTS_SAMPLE_RATE
+        )
+
+    def negotiate(self, req: TTSRequest) -> TTSRequest:
+        """accept_formats가 있으면 그중 가장 작은(대역폭 기준) 포맷으로 요청을 고정한다."""
+        if not req.accept_formats:
+            return req
+        chosen = self.encoder.negotiate(req.accept_formats) if self.encoder else None
+        if chosen is None:
+            chosen = next(fmt for fmt in BANDWIDTH_ORDER if fmt in req.accept_formats)
+        return req.model_copy(update={"format": chosen, "accept_formats": None})
+
+    def _encodes_locally(self, req: TTSRequest) -> bool:
+        return self.encoder is not None and self.encoder.can_encode(req.format)
+
+    def stats(self) -> dict:
+        return {
+            "encode_mode": "lazy" if self.encoder is not None else "upstream",
+            "local_formats": [f.value for f in self.encoder.supported_formats()] if self.encoder else [],
+            "upstream_calls": self.upstream_calls,
+            "local_encodes": dict(self.local_encodes),
+        }
+
+    async def _cached(self, key: str) -> tuple[bytes | None, str]:
+        if self.warm_store is not None:
+            audio = self.warm_store.get(key)
+            if audio is not None:
+                return audio, "warm"
+        if self.audio_cache is None:
+            return None, "miss"
+        return await self.audio_cache.get(key)
+
+    async def _store(self, key: str, audio: bytes) -> None:
+        if self.audio_cache is not None:
+            await self.audio_cache.put(key, audio)
+
+    def _slot(self) -> AbstractAsyncContextManager:
+        return self.admission.slot() if self.admission is not None else nullcontext()
+
+    async def _upstream(self, req: TTSRequest, fmt: OpenAIFormat) -> bytes:
+        options = SynthesizeOptions(voice=req.voice, format=fmt)
+        async with self._slot():
+            audio = await self.synthesizer.synthesize(req.text, options)
+        self.upstream_calls += 1
+        return audio
+
+    async def _canonical_pcm(self, req: TTSRequest) -> tuple[bytes, str]:
+        """canonical PCM을 캐시에서 찾거나 한 번만 합성한다."""
+        pcm_key = self.key(req, OpenAIFormat.PCM)
+        pcm, tier = await self._cached(pcm_key)
+        if pcm is not None:
+            return pcm, tier
+        pcm = await self._upstream(req, OpenAIFormat.PCM)
+        await self._store(pcm_key, pcm)
+        return pcm, "miss"
+
+    async def _encode(self, req: TTSRequest, pcm: bytes) -> bytes:
+        audio = await self.encoder.encode(pcm, req.format)
+        self.local_encodes[req.format.value] = self.local_encodes.get(req.format.value, 0) + 1
+        return audio
+
+    async def synthesize(self, req: TTSRequest) -> tuple[bytes, str]:
+        """캐시를 먼저 보고, 없으면 합성해서 채운다. (audio, tier) 반환."""
+        key = self.key(req)
+        audio, tier = await self._cached(key)
+        if audio is not None:
+            return audio, tier
+
+        if not self._encodes_locally(req):
+            audio = await self._upstream(req, req.format)
+            await self._store(key, audio)
+            return audio, "miss"
+
+        pcm, pcm_tier = await self._canonical_pcm(req)
+        if req.format == OpenAIFormat.PCM:
+            return pcm, pcm_tier
+        audio = await self._encode(req, pcm)
+        await self._store(key, audio)
+        # PCM이 이미 있었다면 업스트림 호출 없이 인코딩만 한 것
+        return audio, "miss" if pcm_tier == "miss" else "encoded"
+
+    async def stream(self, req: TTSRequest) -> AsyncIterator[bytes]:
+        """캐시 hit이면 한 번에, miss면 합성되는 대로 청크를 흘리고 끝나면 캐시에 넣는다.
+
+        lazy 모드에서 canonical PCM이 이미 있으면 인코딩 결과를 한 번에 보낸다.
+        PCM이 없으면 첫 바이트 지연을 위해 요청 포맷 그대로 업스트림에서 스트리밍한다.
+        """
+        key = self.key(req)
+        audio, _tier = await self._cached(key)
+        if audio is not None:
+            yield audio
+            return
+
+        if self._encodes_locally(req):
+            pcm, _tier = await self._cached(self.key(req, OpenAIFormat.PCM))
+            if pcm is not None:
+                audio = await self._encode(req, pcm)
+                await self._store(key, audio)
+                yield audio
+                return
+
+        options = SynthesizeOptions(voice=req.voice, format=req.format)
+        received = []
+        async with self._slot():
+            async for chunk in self.synthesizer.stream(req.text, options):
+                received.append(chunk)
+                yield chunk
+        self.upstream_calls += 1
+        # 끝까지 받은 경우에만 캐시에 넣는다 (중간에 끊긴 스트림은 저장 X)
+        await self._store(key, b"".join(received))
+
+    async def warm(
+        self, reqs: list[TTSRequest], budget_s: float, concurrency: int = 2, group: str | None = None
+    ) -> dict:
+        """phrase들을 미리 합성해서 warm_store에 고정한다.
+
+        budget_s 안에 끝나지 않은 phrase는 취소하고 timed_out으로 센다.
+        live 요청과 같은 admission 슬롯을 쓰므로 concurrency는 작게 둔다.
+        group이 있으면 그 group의 phrase 목록을 reqs로 바꾼다 (빠진 phrase는 먼저 고정을 푼다).
+        """
+        result = {"warmed": 0, "already_warm": 0, "failed": 0, "timed_out": 0, "released": 0}
+        if group is not None and self.warm_store is not None:
+            result["released"] = self.warm_store.retain(group, {self.key(req) for req in reqs})
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(req: TTSRequest) -> None:
+            key = self.key(req)
+            if self.warm_store is not None and self.warm_store.claim(key, group):
+                result["already_warm"] += 1
+                return
+            async with sem:
+                try:
+                    audio, _tier = await self.synthesize(req)
+                except (SynthesizerError, AdmissionRejected, EncoderError) as e:
+                    logger.warning("tts_warm_failed", text=req.text[:40], error=str(e))
+                    result["failed"] += 1
+                    return
+            if self.warm_store is None or self.warm_store.put(key, audio, group):
+                result["warmed"] += 1
+            else:
+                result["failed"] += 1
+
+        tasks = [asyncio.create_task(one(req)) for req in reqs]
+        if not tasks:
+            return result
+        try:
+            _done, pending = await asyncio.wait(tasks, timeout=budget_s)
+        finally:
+            for task in tasks:
+                task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        result["timed_out"] = len(pending)
+        logger.info("tts_warm_done", **result)
+        return result
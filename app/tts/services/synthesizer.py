@@ -1,15 +1,17 @@
-import io
+import asyncio
 import math
 import struct
 import time
-import wave
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 import httpx
 
 from app.shared.logging import get_logger
+from app.shared.resilience import RETRYABLE_STATUS, CircuitOpenError, Upstream
 
 logger = get_logger(__name__)
 
@@ -41,9 +43,14 @@ class SynthesizeOptions:
 
 
 class SynthesizerError(Exception):
-    """Base exception for synthesizer errors."""
+    """Base exception for synthesizer errors.
 
-    pass
+    retryable: 다시 보내면 성공할 수 있는 실패인지 (timeout, 네트워크, 429, 5xx).
+    """
+
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
 
 
 @dataclass
@@ -54,96 +61,316 @@ class SynthesizerOptions:
     min_ms: int = 180
     max_ms: int = 1600
     volume: float = 0.25
+    stream_block_ms: int = 100
 
 
 class BaseSynthesizer(ABC):
+    model: str
+
+    @abstractmethod
+    async def synthesize(self, text: str, options: SynthesizeOptions | None = None) -> bytes:
+        pass
+
+    @abstractmethod
+    def stream(
+        self, text: str, options: SynthesizeOptions | None = None
+    ) -> AsyncIterator[bytes]:
+        """Stream audio chunks as they are synthesized."""
+        pass
+
+    async def warm_up(self) -> None:
+        """Prepare resources before serving traffic (called once at startup)."""
+        pass
+
+    async def aclose(self) -> None:
+        """Release resources held by the synthesizer (connection pools etc.)."""
+        pass
+
+
+class LocalSynthesizer(BaseSynthesizer):
+    """CPU에서 직접 오디오를 만드는 엔진 (네트워크 I/O 없음).
+
+    render()/render_into()는 동기 함수라서 ProcessPoolSynthesizer로 감싸 워커 프로세스에서
+    돌릴 수 있다. 인스턴스는 워커로 pickle 되어 넘어가므로 가벼운 설정값만 들고 있어야 한다.
+    render 결과는 PCM16 WAV이고, format=pcm 요청에는 헤더를 떼고 돌려준다.
+    """
+
+    @property
+    @abstractmethod
+    def max_output_bytes(self) -> int:
+        """Upper bound of a single render() result (used to pre-size shared buffers)."""
+        pass
+
     @abstractmethod
-    def synthesize(self, text: str, options: SynthesizeOptions | None = None) -> bytes:
+    def render(self, text: str) -> bytes:
         pass
 
+    def render_into(self, text: str, out: memoryview) -> int:
+        """Render directly into `out` and return the number of bytes written."""
+        audio = self.render(text)
+        out[:len(audio)] = audio
+        return len(audio)
+
+    async def synthesize(self, text: str, options: SynthesizeOptions | None = None) -> bytes:
+        audio = self.render(text)
+        if options is not None and options.format == OpenAIFormat.PCM:
+            return audio[WAV_HEADER_SIZE:]
+        return audio
+
+
+WAV_HEADER_SIZE = 44
+
+
+@lru_cache(maxsize=32)
+def _tone_period(sample_rate: int, tone_hz: int, volume: float) -> bytes:
+    """사인파 한 주기(샘플 단위로 정확히 반복되는 구간)를 PCM16 LE로 미리 계산한다.
+
+    sample_rate / gcd(sample_rate, tone_hz) 샘플마다 파형이 정확히 반복되므로
+    이 구간만 계산해 두고 이어 붙이면 전체 클립과 동일한 바이트가 나온다.
+    """
+    period = sample_rate // math.gcd(sample_rate, tone_hz)
+    samples = []
+    for i in range(period):
+        sample = volume * math.sin(2 * math.pi * tone_hz * (i / sample_rate))
+        samples.append(int(max(-1.0, min(1.0, sample)) * 32767))
+    return struct.pack(f"<{period}h", *samples)
+
+
+def wav_header(n_channels: int, sampwidth: int, framerate: int, data_size: int) -> bytes:
+    """wave 모듈이 쓰는 것과 같은 44바이트 PCM RIFF 헤더."""
+    block_align = n_channels * sampwidth
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # WAVE_FORMAT_PCM
+        n_channels,
+        framerate,
+        framerate * block_align,
+        block_align,
+        sampwidth * 8,
+        b"data",
+        data_size,
+    )
+
+
+def _fill_tone(out: bytearray | memoryview, offset: int, size: int, period: bytes, phase: int = 0) -> None:
+    """out[offset:offset + size]를 period[phase:]부터 이어지는 반복으로 채운다 (복사 횟수 O(log n))."""
+    if size <= 0:
+        return
+    view = memoryview(out)
+    if phase:
+        period = period[phase:] + period[:phase]
+    first = min(len(period), size)
+    view[offset:offset + first] = period[:first]
+    filled = first
+    while filled < size:
+        n = min(filled, size - filled)
+        view[offset + filled:offset + filled + n] = view[offset:offset + n]
+        filled += n
+
+
 # 테스트용 더미 구현
-class DummySynthesizer(BaseSynthesizer):
+class DummySynthesizer(LocalSynthesizer):
+    N_CHANNELS = 1
+    SAMPWIDTH = 2  # 16-bit
+
+    model = "dummy"
+
     def __init__(self, options: SynthesizerOptions | None = None):
         self.options = options or SynthesizerOptions()
 
-    def synthesize(self, text: str, options: SynthesizeOptions | None = None) -> bytes:
+    def _data_size(self, text: str) -> int:
         opt = self.options
         # 텍스트 길이에 따라 음성 길이를 대충 맞춰서 "chunk가 따라오는 느낌"을 준다
         dur_ms = max(opt.min_ms, min(opt.max_ms, len(text) * opt.ms_per_char))
         duration_sec = dur_ms / 1000.0
+        n_frames = int(duration_sec * opt.sample_rate)
+        return n_frames * self.N_CHANNELS * self.SAMPWIDTH
 
-        n_channels = 1
-        sampwidth = 2  # 16-bit
-        framerate = opt.sample_rate
-        n_frames = int(duration_sec * framerate)
+    @property
+    def max_output_bytes(self) -> int:
+        opt = self.options
+        n_frames = int(max(opt.min_ms, opt.max_ms) / 1000.0 * opt.sample_rate)
+        return WAV_HEADER_SIZE + n_frames * self.N_CHANNELS * self.SAMPWIDTH
+
+    def render(self, text: str) -> bytes:
+        """WAV 전체를 동기적으로 생성한다 (CPU 전용, I/O 없음)."""
+        # 헤더 + PCM 전체 크기만큼 한 번에 잡아두고 채운다
+        out = bytearray(WAV_HEADER_SIZE + self._data_size(text))
+        self.render_into(text, memoryview(out))
+        return bytes(out)
 
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(n_channels)
-            wf.setsampwidth(sampwidth)
-            wf.setframerate(framerate)
+    def render_into(self, text: str, out: memoryview) -> int:
+        opt = self.options
+        data_size = self._data_size(text)
+        out[:WAV_HEADER_SIZE] = wav_header(self.N_CHANNELS, self.SAMPWIDTH, opt.sample_rate, data_size)
+        _fill_tone(out, WAV_HEADER_SIZE, data_size, _tone_period(opt.sample_rate, opt.tone_hz, opt.volume))
+        return WAV_HEADER_SIZE + data_size
 
-            # 간단한 사인파 톤 생성(PCM16)
-            for i in range(n_frames):
-                t = i / framerate
-                sample = opt.volume * math.sin(2 * math.pi * opt.tone_hz * t)
-                pcm = int(max(-1.0, min(1.0, sample)) * 32767)
-                wf.writeframes(struct.pack("<h", pcm))
+    async def stream(
+        self, text: str, options: SynthesizeOptions | None = None
+    ) -> AsyncIterator[bytes]:
+        opt = self.options
+        data_size = self._data_size(text)
+        period = _tone_period(opt.sample_rate, opt.tone_hz, opt.volume)
+        frame_bytes = self.N_CHANNELS * self.SAMPWIDTH
+        block_size = max(1, opt.sample_rate * opt.stream_block_ms // 1000) * frame_bytes
 
-        return buf.getvalue()
+        # 헤더를 먼저 보내고 PCM은 frame block 단위로 이어서 보낸다
+        if options is None or options.format != OpenAIFormat.PCM:
+            yield wav_header(self.N_CHANNELS, self.SAMPWIDTH, opt.sample_rate, data_size)
+        for start in range(0, data_size, block_size):
+            size = min(block_size, data_size - start)
+            block = bytearray(size)
+            _fill_tone(block, 0, size, period, phase=start % len(period))
+            yield bytes(block)
+            await asyncio.sleep(0)
 
 
 class OpenAISynthesizer(BaseSynthesizer):
     OPENAI_TTS_URL = "https://api.openai.com/v1/audio/speech"
 
-    def __init__(self, api_key: str, model: str = "tts-1", voice: OpenAIVoice = OpenAIVoice.ALLOY):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "tts-1",
+        voice: OpenAIVoice = OpenAIVoice.ALLOY,
+        client: httpx.AsyncClient | None = None,
+        base_url: str | None = None,
+        upstream: Upstream | None = None,
+    ):
         if not api_key:
             raise ValueError("OpenAI API key is required")
         self.api_key = api_key
+        # OpenAI 호환 서버(로컬 stand-in 등)를 쓸 때만 바꾼다
+        self.speech_url = f"{base_url.rstrip('/')}/audio/speech" if base_url else self.OPENAI_TTS_URL
         self.model = model
         self.default_voice = voice
+        # 커넥션 풀은 인스턴스 수명 동안 재사용한다 (요청마다 TLS 핸드셰이크 X)
+        self._client = client or httpx.AsyncClient(timeout=30.0)
+        # circuit breaker + 첫 바이트 전 재시도 (app.shared.resilience)
+        self.upstream = upstream
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _payload(self, text: str, opts: SynthesizeOptions) -> dict:
+        return {
+            "model": self.model,
+            "input": text,
+            "voice": opts.voice.value,
+            "response_format": opts.format.value,
+        }
 
-    def synthesize(self, text: str, options: SynthesizeOptions | None = None) -> bytes:
+    @staticmethod
+    def _status_error(e: httpx.HTTPStatusError) -> SynthesizerError:
+        logger.error("tts_error", provider="openai", status_code=e.response.status_code)
+        if e.response.status_code == 401:
+            return SynthesizerError("Invalid OpenAI API key")
+        elif e.response.status_code == 429:
+            return SynthesizerError("OpenAI rate limit exceeded", retryable=True)
+        return SynthesizerError(
+            f"OpenAI API error: {e.response.status_code}",
+            retryable=e.response.status_code in RETRYABLE_STATUS,
+        )
+
+    async def synthesize(self, text: str, options: SynthesizeOptions | None = None) -> bytes:
         opts = options or SynthesizeOptions(voice=self.default_voice)
+        if self.upstream is None:
+            return await self._synthesize_once(text, opts)
+        try:
+            return await self.upstream.call(lambda: self._synthesize_once(text, opts))
+        except CircuitOpenError as e:
+            raise SynthesizerError(f"OpenAI unavailable: {e}") from e
+
+    async def _synthesize_once(self, text: str, opts: SynthesizeOptions) -> bytes:
         t0 = time.perf_counter()
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(
-                    self.OPENAI_TTS_URL,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "input": text,
-                        "voice": opts.voice.value,
-                        "response_format": opts.format.value,
-                    },
-                )
+            response = await self._client.post(
+                self.speech_url,
+                headers=self._headers(),
+                json=self._payload(text, opts),
+            )
+            response.raise_for_status()
+            duration_ms = int((time.perf_counter() - t0) * 1000)
+            logger.info(
+                "tts_synthesized",
+                provider="openai",
+                voice=opts.voice.value,
+                text_len=len(text),
+                audio_bytes=len(response.content),
+                duration_ms=duration_ms,
+            )
+            return response.content
+        except httpx.HTTPStatusError as e:
+            raise self._status_error(e) from e
+        except httpx.TimeoutException as e:
+            logger.error("tts_error", provider="openai", error="timeout")
+            raise SynthesizerError("OpenAI API timeout", retryable=True) from e
+        except httpx.RequestError as e:
+            logger.error("tts_error", provider="openai", error=str(e))
+            raise SynthesizerError(f"Network error: {e}", retryable=True) from e
+
+    async def stream(
+        self, text: str, options: SynthesizeOptions | None = None
+    ) -> AsyncIterator[bytes]:
+        opts = options or SynthesizeOptions(voice=self.default_voice)
+        if self.upstream is None:
+            async for chunk in self._stream_once(text, opts):
+                yield chunk
+            return
+        try:
+            async for chunk in self.upstream.stream(lambda: self._stream_once(text, opts)):
+                yield chunk
+        except CircuitOpenError as e:
+            raise SynthesizerError(f"OpenAI unavailable: {e}") from e
+
+    async def _stream_once(self, text: str, opts: SynthesizeOptions) -> AsyncIterator[bytes]:
+        t0 = time.perf_counter()
+        ttfb_ms = None
+        audio_bytes = 0
+
+        try:
+            async with self._client.stream(
+                "POST",
+                self.speech_url,
+                headers=self._headers(),
+                json=self._payload(text, opts),
+            ) as response:
+                if response.is_error:
+                    await response.aread()
                 response.raise_for_status()
-                duration_ms = int((time.perf_counter() - t0) * 1000)
-                logger.info(
-                    "tts_synthesized",
-                    provider="openai",
-                    voice=opts.voice.value,
-                    text_len=len(text),
-                    audio_bytes=len(response.content),
-                    duration_ms=duration_ms,
-                )
-                return response.content
+                async for chunk in response.aiter_bytes():
+                    if ttfb_ms is None:
+                        ttfb_ms = int((time.perf_counter() - t0) * 1000)
+                    audio_bytes += len(chunk)
+                    yield chunk
         except httpx.HTTPStatusError as e:
-            logger.error("tts_error", provider="openai", status_code=e.response.status_code)
-            if e.response.status_code == 401:
-                raise SynthesizerError("Invalid OpenAI API key") from e
-            elif e.response.status_code == 429:
-                raise SynthesizerError("OpenAI rate limit exceeded") from e
-            else:
-                raise SynthesizerError(f"OpenAI API error: {e.response.status_code}") from e
+            raise self._status_error(e) from e
         except httpx.TimeoutException as e:
             logger.error("tts_error", provider="openai", error="timeout")
-            raise SynthesizerError("OpenAI API timeout") from e
+            raise SynthesizerError("OpenAI API timeout", retryable=True) from e
         except httpx.RequestError as e:
             logger.error("tts_error", provider="openai", error=str(e))
-            raise SynthesizerError(f"Network error: {e}") from e
+            raise SynthesizerError(f"Network error: {e}", retryable=True) from e
+
+        logger.info(
+            "tts_streamed",
+            provider="openai",
+            voice=opts.voice.value,
+            text_len=len(text),
+            audio_bytes=audio_bytes,
+            ttfb_ms=ttfb_ms,
+            duration_ms=int((time.perf_counter() - t0) * 1000),
+        )
@@ -0,0 +1,90 @@
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class WarmStats:
+    hits: int = 0
+    entries: int = 0
+    bytes: int = 0
+    rejected: int = 0  # 용량 초과로 고정하지 못한 phrase 수
+    released: int = 0  # 어느 group에서도 안 쓰게 돼서 고정을 푼 phrase 수
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class WarmPhraseStore:
+    """미리 합성해 둔 인사말/filler 오디오를 고정(pin)해 두는 저장소.
+
+    AudioCache와 달리 LRU로 밀려나지 않는다. 용량(max_bytes)이 차면 새 phrase를 받지 않을 뿐이다.
+    phrase는 group(예: gateway의 캐릭터) 단위로 고정하고, retain()으로 group의 phrase 목록을 바꾸면
+    더 이상 어느 group에도 속하지 않는 phrase는 풀어 준다. group 없이 넣은 phrase(시작 시 설정)는 계속 남는다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items: dict[str, bytes] = {}
+        self._static: set[str] = set()
+        self._owners: dict[str, set[str]] = {}  # key -> 이 phrase를 쓰는 group들
+        self._groups: dict[str, set[str]] = {}  # group -> key들
+        self._stats = WarmStats()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def get(self, key: str) -> bytes | None:
+        value = self._items.get(key)
+        if value is not None:
+            self._stats.hits += 1
+        return value
+
+    def put(self, key: str, value: bytes, group: str | None = None) -> bool:
+        old = self._items.get(key)
+        grow = len(value) - (len(old) if old is not None else 0)
+        if self.size + grow > self.max_bytes:
+            self._stats.rejected += 1
+            return False
+        self._items[key] = value
+        self.size += grow
+        self.claim(key, group)
+        return True
+
+    def claim(self, key: str, group: str | None = None) -> bool:
+        """이미 고정된 phrase를 group에도 묶는다 (group이 None이면 영구 고정). 없는 key면 False."""
+        if key not in self._items:
+            return False
+        if group is None:
+            self._static.add(key)
+        else:
+            self._owners.setdefault(key, set()).add(group)
+            self._groups.setdefault(group, set()).add(key)
+        return True
+
+    def retain(self, group: str, keys: set[str]) -> int:
+        """group에서 keys에 없는 phrase를 빼고, 아무도 안 쓰게 된 phrase는 지운다. 지운 수를 돌려준다."""
+        old = self._groups.pop(group, set())
+        if old & keys:
+            self._groups[group] = old & keys
+        released = 0
+        for key in old - keys:
+            owners = self._owners.get(key, set())
+            owners.discard(group)
+            if owners:
+                continue
+            self._owners.pop(key, None)
+            if key in self._static:
+                continue
+            self.size -= len(self._items.pop(key))
+            released += 1
+        self._stats.released += released
+        return released
+
+    def stats(self) -> WarmStats:
+        s = self._stats
+        s.entries = len(self._items)
+        s.bytes = self.size
+        return s
@@ -0,0 +1,220 @@
+"""CacheClient Redis 왕복 벤치마크 (기존 명령별 await vs MULTI/EXEC 파이프라인).
+
+로컬 RESP stand-in 서버(리스트/문자열 명령과 MULTI/EXEC만 구현)에 실제 redis.asyncio 클라이언트로 붙고,
+서버가 읽기 한 번마다 --rtt-ms만큼 기다렸다 답하게 해서 네트워크 왕복을 흉내 낸다.
+한 턴(get_history_and_summary → flush_last_turn_to_cache)마다 왕복 수와 걸린 시간을 비교한다.
+
+Usage: python -m benchmarks.bench_cache [--turns 200] [--rtt-ms 0.5]
+"""
+import argparse
+import asyncio
+import time
+
+from redis.asyncio import Redis
+
+from app.gateway.clients.cache import CacheClient
+from app.gateway.schemas.message import Message
+
+
+class RespStandin:
+    """명령 배치(읽기 한 번)마다 rtt만큼 늦게 답하는 최소 RESP 서버. 배치 수를 왕복 수로 센다.
+
+    HELLO 3을 받으면 그 연결에서는 null을 RESP3 형식으로 보낸다 (최근 redis-py 기본값).
+    """
+
+    def __init__(self, rtt_s: float):
+        self.rtt_s = rtt_s
+        self.round_trips = 0
+        self.commands = 0
+        self._data: dict[bytes, bytes | list[bytes]] = {}
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    def reset(self) -> None:
+        self.round_trips = 0
+        self.commands = 0
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        buf = b""
+        queued: list[list[bytes]] | None = None
+        null = b"$-1\r\n"
+        try:
+            while data := await reader.read(65536):
+                buf += data
+                commands, buf = parse_commands(buf)
+                if not commands:
+                    continue
+                self.round_trips += 1
+                out = []
+                for cmd in commands:
+                    self.commands += 1
+                    name = cmd[0].upper()
+                    if name == b"HELLO":
+                        proto = cmd[1] if len(cmd) > 1 else b"2"
+                        null = b"_\r\n" if proto == b"3" else b"$-1\r\n"
+                        out.append(b"%1\r\n+proto\r\n:" + proto + b"\r\n")
+                    elif name == b"MULTI":
+                        queued = []
+                        out.append(b"+OK\r\n")
+                    elif name == b"EXEC":
+                        results = [self._execute(c, null) for c in queued or []]
+                        queued = None
+                        out.append(b"*%d\r\n" % len(results) + b"".join(results))
+                    elif queued is not None:
+                        queued.append(cmd)
+                        out.append(b"+QUEUED\r\n")
+                    else:
+                        out.append(self._execute(cmd, null))
+                if self.rtt_s:
+                    await asyncio.sleep(self.rtt_s)
+                writer.write(b"".join(out))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def _execute(self, cmd: list[bytes], null: bytes) -> bytes:
+        name, args = cmd[0].upper(), cmd[1:]
+        if name == b"LPUSH":
+            items = self._data.setdefault(args[0], [])
+            for value in args[1:]:
+                items.insert(0, value)
+            return b":%d\r\n" % len(items)
+        if name == b"LRANGE":
+            items = self._data.get(args[0], [])
+            return array(items[slice_of(items, int(args[1]), int(args[2]))])
+        if name == b"LTRIM":
+            items = self._data.get(args[0], [])
+            items[:] = items[slice_of(items, int(args[1]), int(args[2]))]
+            return b"+OK\r\n"
+        if name == b"GET":
+            value = self._data.get(args[0])
+            return null if value is None else bulk(value)
+        if name == b"SET":
+            self._data[args[0]] = args[1]
+            return b"+OK\r\n"
+        if name == b"DEL":
+            return b":%d\r\n" % sum(self._data.pop(k, None) is not None for k in args)
+        if name == b"EXPIRE":
+            # 만료는 흉내 내지 않는다 (벤치마크 동안에는 안 지난다)
+            return b":%d\r\n" % (args[0] in self._data)
+        if name == b"PING":
+            return b"+PONG\r\n"
+        # CLIENT SETINFO 같은 연결 설정 명령
+        return b"+OK\r\n"
+
+
+def parse_commands(buf: bytes) -> tuple[list[list[bytes]], bytes]:
+    """buf에서 완전한 RESP 배열 명령들을 꺼내고 남은 바이트를 돌려준다."""
+    commands, pos = [], 0
+    while True:
+        cmd, end = parse_array(buf, pos)
+        if cmd is None:
+            return commands, buf[pos:]
+        commands.append(cmd)
+        pos = end
+
+
+def parse_array(buf: bytes, pos: int) -> tuple[list[bytes] | None, int]:
+    line_end = buf.find(b"\r\n", pos)
+    if line_end < 0:
+        return None, pos
+    count, i, out = int(buf[pos + 1:line_end]), line_end + 2, []
+    for _ in range(count):
+        line_end = buf.find(b"\r\n", i)
+        if line_end < 0:
+            return None, pos
+        size = int(buf[i + 1:line_end])
+        start = line_end + 2
+        if len(buf) < start + size + 2:
+            return None, pos
+        out.append(buf[start:start + size])
+        i = start + size + 2
+    return out, i
+
+
+def slice_of(items: list, start: int, stop: int) -> slice:
+    n = len(items)
+    start = max(0, start + n if start < 0 else start)
+    stop = stop + n if stop < 0 else stop
+    return slice(start, stop + 1)
+
+
+def bulk(value: bytes) -> bytes:
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def array(items: list[bytes]) -> bytes:
+    return b"*%d\r\n" % len(items) + b"".join(bulk(x) for x in items)
+
+
+class LegacyCacheClient(CacheClient):
+    """변경 전 CacheClient: 명령마다 따로 await 한다."""
+
+    async def flush_last_turn_to_cache(self, session_id: str, user_text: str, assistant_text: str):
+        key = self._key(session_id)
+        user_msg = Message(role="user", content=user_text).model_dump_json()
+        asst_msg = Message(role="assistant", content=assistant_text).model_dump_json()
+        await self._cache.lpush(key, asst_msg)
+        await self._cache.lpush(key, user_msg)
+        await self._cache.ltrim(key, 0, self._max_turns * 2 - 1)
+        await self._cache.expire(key, self._ttl)
+        await self._cache.expire(self._summary_key(session_id), self._ttl)
+
+    async def get_history(self, session_id: str) -> list[Message]:
+        raw = await self._cache.lrange(self._key(session_id), 0, -1)
+        return [Message.model_validate_json(x) for x in reversed(raw)]
+
+    async def get_history_and_summary(self, session_id: str) -> tuple[list[Message], str | None]:
+        history = await self.get_history(session_id)
+        raw = await self._cache.get(self._summary_key(session_id))
+        return history, raw.decode("utf-8") if raw is not None else None
+
+
+async def turn(client: CacheClient, session_id: str, n: int) -> list[Message]:
+    # Orchestrator.stream_events가 한 턴에 부르는 순서 그대로 (history_budget이 켜진 경우)
+    history, _ = await client.get_history_and_summary(session_id)
+    await client.flush_last_turn_to_cache(session_id, f"question {n}", f"answer {n} " * 20)
+    return history
+
+
+async def measure(name: str, cls: type[CacheClient], server: RespStandin, port: int, turns: int) -> list[Message]:
+    redis = Redis(host="127.0.0.1", port=port)
+    client = cls(redis, max_turns=10)
+    await redis.ping()  # 연결 설정 왕복은 빼고 센다
+    server.reset()
+    t0 = time.perf_counter()
+    for n in range(turns):
+        history = await turn(client, name, n)
+    elapsed = time.perf_counter() - t0
+    await redis.aclose()
+    print(f"{name:<10} {server.round_trips / turns:>8.1f} {server.commands / turns:>9.1f} {elapsed / turns * 1e3:>8.2f}")
+    return history
+
+
+async def run(args) -> None:
+    server = RespStandin(args.rtt_ms / 1000)
+    port = await server.start()
+    print(f"{args.turns} turns, rtt {args.rtt_ms}ms per round trip")
+    print(f"{'impl':<10} {'rt/turn':>8} {'cmds/turn':>9} {'ms/turn':>8}")
+    legacy = await measure("legacy", LegacyCacheClient, server, port, args.turns)
+    pipelined = await measure("pipelined", CacheClient, server, port, args.turns)
+    assert [m.content for m in legacy] == [m.content for m in pipelined]
+    await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""DummySynthesizer 처리량 벤치마크 (기존 루프 구현 vs 테이블 기반 구현).
+
+Usage: python -m benchmarks.bench_dummy_synthesizer [--seconds 2.0]
+"""
+import argparse
+import io
+import math
+import struct
+import time
+import wave
+
+from app.tts.services.synthesizer import DummySynthesizer, SynthesizerOptions
+
+TEXTS = {
+    "short": "Hi.",
+    "sentence": "Hello there, it is nice to meet you today.",
+    "max": "x" * 100,  # max_ms(1.6s)에 걸리는 길이
+}
+
+
+def legacy_synthesize(text: str, opt: SynthesizerOptions) -> bytes:
+    dur_ms = max(opt.min_ms, min(opt.max_ms, len(text) * opt.ms_per_char))
+    framerate = opt.sample_rate
+    n_frames = int(dur_ms / 1000.0 * framerate)
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(framerate)
+        for i in range(n_frames):
+            t = i / framerate
+            sample = opt.volume * math.sin(2 * math.pi * opt.tone_hz * t)
+            pcm = int(max(-1.0, min(1.0, sample)) * 32767)
+            wf.writeframes(struct.pack("<h", pcm))
+    return buf.getvalue()
+
+
+def requests_per_sec(fn, text: str, seconds: float) -> float:
+    fn(text)  # warm-up (톤 테이블 생성 포함)
+    n = 0
+    t0 = time.perf_counter()
+    deadline = t0 + seconds
+    while time.perf_counter() < deadline:
+        fn(text)
+        n += 1
+    return n / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    opt = SynthesizerOptions()
+    synth = DummySynthesizer(opt)
+
+    print(f"{'case':<10} {'before req/s':>14} {'after req/s':>14} {'speedup':>9}")
+    for name, text in TEXTS.items():
+        assert synth.render(text) == legacy_synthesize(text, opt)
+        before = requests_per_sec(lambda t: legacy_synthesize(t, opt), text, args.seconds)
+        after = requests_per_sec(synth.render, text, args.seconds)
+        print(f"{name:<10} {before:>14.1f} {after:>14.1f} {after / before:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Orchestrator segmenter 벤치마크 (기존 any(p in buf) 스캔 vs 상태 기반 Segmenter).
+
+토큰 하나당 처리 시간과, 첫 segment가 나오기까지 필요한 토큰 수(TTAF 대리 지표)를 비교한다.
+
+Usage: python -m benchmarks.bench_segmenter [--repeat 200]
+"""
+import argparse
+import time
+
+from app.gateway.services.segmenter import PUNCT, Segmenter
+
+RESPONSE = (
+    "Sure thing, let me walk you through it step by step because there are a few parts to it. "
+    "First, the value of pi is about 3.14, which you probably remember from school. "
+    "Dr. Kim mentioned that most textbooks, e.g. the standard ones, round it that way. "
+) * 8
+
+
+def tokens(text: str) -> list[str]:
+    # LLM 토큰과 비슷하게 단어 + 뒤 공백 단위로 자른다
+    out, word = [], ""
+    for ch in text:
+        word += ch
+        if ch == " ":
+            out.append(word)
+            word = ""
+    return out + ([word] if word else [])
+
+
+def legacy(toks: list[str]) -> tuple[list[str], int]:
+    out, buf, first_at = [], "", -1
+    for n, tok in enumerate(toks):
+        buf += tok
+        if len(buf) >= 60 or any(p in buf for p in PUNCT):
+            out.append(buf.strip())
+            buf = ""
+            if first_at < 0:
+                first_at = n + 1
+    if buf.strip():
+        out.append(buf.strip())
+    return out, first_at
+
+
+def stateful(toks: list[str]) -> tuple[list[str], int]:
+    segmenter = Segmenter()
+    out, first_at = [], -1
+    for n, tok in enumerate(toks):
+        out += segmenter.feed(tok)
+        if out and first_at < 0:
+            first_at = n + 1
+    return out + segmenter.flush(), first_at
+
+
+def us_per_token(fn, toks: list[str], repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(toks)
+    return (time.perf_counter() - t0) / (repeat * len(toks)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    toks = tokens(RESPONSE)
+    print(f"{'impl':<10} {'us/token':>9} {'segments':>9} {'first after':>12}")
+    for name, fn in (("legacy", legacy), ("stateful", stateful)):
+        segments, first_at = fn(toks)
+        print(f"{name:<10} {us_per_token(fn, toks, args.repeat):>9.2f} {len(segments):>9} {first_at:>8} tok")
+
+
+if __name__ == "__main__":
+    main()
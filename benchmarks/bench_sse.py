@@ -0,0 +1,106 @@
+"""OpenAI SSE 파싱 벤치마크 (기존 aiter_lines + json.loads 루프 vs bytes 기반 SSEParser).
+
+녹화한 것과 같은 모양의 chat.completion.chunk 스트림(role 청크, content 청크들, finish 청크, [DONE])을
+TCP 읽기처럼 임의 크기로 잘라 넣고 토큰 하나당 처리 시간을 비교한다.
+
+Usage: python -m benchmarks.bench_sse [--repeat 200] [--read-size 1400]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import httpx
+
+from app.gateway.clients.sse import iter_sse_content
+
+WORDS = "Sure thing, let me walk you through it step by step because there are a few parts to it .".split()
+
+
+def recorded_stream(n_tokens: int) -> bytes:
+    base = {"id": "chatcmpl-9xYz", "object": "chat.completion.chunk", "created": 1718000000,
+            "model": "gpt-4o-mini-2024-07-18", "system_fingerprint": "fp_0ba0d124f1"}
+
+    def event(delta: dict, finish: str | None = None) -> str:
+        body = base | {"choices": [{"index": 0, "delta": delta, "logprobs": None, "finish_reason": finish}]}
+        return "data: " + json.dumps(body, separators=(",", ":")) + "\n\n"
+
+    out = [event({"role": "assistant", "content": "", "refusal": None})]
+    out += [event({"content": " " + WORDS[i % len(WORDS)]}) for i in range(n_tokens)]
+    out += [event({}, "stop"), "data: [DONE]\n\n"]
+    return "".join(out).encode()
+
+
+def split_reads(body: bytes, read_size: int, seed: int = 0) -> list[bytes]:
+    rnd = random.Random(seed)
+    parts, i = [], 0
+    while i < len(body):
+        n = rnd.randint(read_size // 2, read_size)
+        parts.append(body[i:i + n])
+        i += n
+    return parts
+
+
+def response_for(parts: list[bytes]) -> httpx.Response:
+    # 실제 스트리밍 응답처럼 read 단위 청크가 그대로 흘러가게 한다
+    async def body():
+        for part in parts:
+            yield part
+
+    return httpx.Response(200, content=body())
+
+
+async def legacy(parts: list[bytes]) -> list[str]:
+    # 변경 전 OpenAILLM.stream 루프 그대로
+    response = response_for(parts)
+    out = []
+    async for line in response.aiter_lines():
+        if line.startswith("data: "):
+            data = line[6:]
+            if data == "[DONE]":
+                break
+            try:
+                import json
+
+                chunk = json.loads(data)
+                delta = chunk["choices"][0].get("delta", {})
+                content = delta.get("content")
+                if content:
+                    out.append(content)
+            except (json.JSONDecodeError, KeyError, IndexError):
+                continue
+    return out
+
+
+async def sse(parts: list[bytes]) -> list[str]:
+    return [t async for t in iter_sse_content(response_for(parts).aiter_bytes())]
+
+
+async def us_per_token(fn, parts: list[bytes], n_tokens: int, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        await fn(parts)
+    return (time.perf_counter() - t0) / (repeat * n_tokens) * 1e6
+
+
+async def run(args) -> None:
+    body = recorded_stream(args.tokens)
+    parts = split_reads(body, args.read_size)
+    assert await legacy(parts) == await sse(parts)
+    print(f"{len(body)} bytes, {args.tokens} tokens, {len(parts)} reads")
+    print(f"{'impl':<8} {'us/token':>9}")
+    for name, fn in (("legacy", legacy), ("sse", sse)):
+        print(f"{name:<8} {await us_per_token(fn, parts, args.tokens, args.repeat):>9.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--tokens", type=int, default=300)
+    parser.add_argument("--read-size", type=int, default=1400)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,7 @@ show_help() {
     echo "  gateway       Run Gateway service (port 8000)"
     echo "  tts           Run TTS service (port 8001)"
     echo "  all           Run both Gateway and TTS services"
+    echo "  standin       Run local OpenAI-compatible stand-in (port 8002)"
     echo "  web           Run Web frontend (port 3000)"
     echo "  help          Show this help message"
 }
@@ -75,6 +76,11 @@ run_tts() {
     uvicorn app.tts.main:app --reload --port 8001
 }
 
+run_standin() {
+    echo "Starting OpenAI stand-in on port 8002 (set OPENAI_BASE_URL=http://localhost:8002/v1)..."
+    uvicorn app.standin.main:app --port 8002
+}
+
 run_all() {
     echo "Starting Gateway (8000) and TTS (8001) services..."
     uvicorn app.tts.main:app --reload --port 8001 &
@@ -119,6 +125,9 @@ case "${1:-help}" in
     tts)
         run_tts
         ;;
+    standin)
+        run_standin
+        ;;
     all)
         run_all
         ;;
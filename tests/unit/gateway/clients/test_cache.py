@@ -0,0 +1,153 @@
+from app.gateway.clients.cache import CacheClient
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._queued: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._queued.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        self._redis.round_trips += 1
+        if self._redis.down:
+            raise ConnectionError("redis down")
+        return [getattr(self._redis, "_" + name)(*args, **kwargs) for name, args, kwargs in self._queued]
+
+
+class FakeRedis:
+    """파이프라인 execute 한 번 = 왕복 한 번으로 세는 인메모리 Redis."""
+
+    def __init__(self):
+        self.data: dict[str, object] = {}
+        self.ttl: dict[str, int] = {}
+        self.round_trips = 0
+        self.down = False
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        self.round_trips += 1
+        if self.down:
+            raise ConnectionError("redis down")
+        return self._get(key)
+
+    def _lpush(self, key, *values):
+        items = self.data.setdefault(key, [])
+        for v in values:
+            items.insert(0, v.encode())
+        return len(items)
+
+    def _lrange(self, key, start, stop):
+        items = self.data.get(key, [])
+        return items[start:] if stop == -1 else items[start:stop + 1]
+
+    def _ltrim(self, key, start, stop):
+        self.data[key] = self._lrange(key, start, stop)
+
+    def _expire(self, key, ttl):
+        if key in self.data:
+            self.ttl[key] = ttl
+            return 1
+        return 0
+
+    def _get(self, key):
+        return self.data.get(key)
+
+    def _set(self, key, value, ex=None):
+        self.data[key] = value.encode()
+        self.ttl[key] = ex
+
+    def _delete(self, key):
+        self.data.pop(key, None)
+
+
+class TestCacheClientRoundTrips:
+    """여러 명령이 필요한 작업이 왕복 한 번으로 끝나는지 테스트"""
+
+    async def test_flush_is_one_round_trip(self):
+        redis = FakeRedis()
+        client = CacheClient(redis, max_turns=1, ttl_seconds=60)
+
+        await client.flush_last_turn_to_cache("s", "q1", "a1")
+        await client.flush_last_turn_to_cache("s", "q2", "a2")
+
+        assert redis.round_trips == 2
+        history = await client.get_history("s")
+        # lpush(key, a, u)는 lpush(a) 뒤 lpush(u)와 같은 리스트를 만들고, max_turns=1이라 마지막 턴만 남는다
+        assert redis.data["session:s:history"][0].endswith(b'"q2"}')
+        assert sorted(m.content for m in history) == ["a2", "q2"]
+        assert redis.ttl["session:s:history"] == 60
+
+    async def test_get_history_fetches_summary_and_touches_ttl(self):
+        redis = FakeRedis()
+        client = CacheClient(redis, ttl_seconds=60)
+        await client.flush_last_turn_to_cache("s", "q", "a")
+        await client.compact_history("s", keep=2, summary="earlier: greetings")
+        redis.ttl.clear()
+        redis.round_trips = 0
+
+        history, summary = await client.get_history_and_summary("s")
+
+        assert redis.round_trips == 1
+        assert sorted(m.content for m in history) == ["a", "q"]
+        assert summary == "earlier: greetings"
+        assert redis.ttl == {"session:s:history": 60, "session:s:summary": 60}
+
+    async def test_summary_removed_elsewhere_is_not_served_from_local_copy(self):
+        redis = FakeRedis()
+        client = CacheClient(redis)
+        await client.flush_last_turn_to_cache("s", "q", "a")
+        await client.compact_history("s", keep=2, summary="old")
+
+        # 다른 gateway 프로세스가 compact 했거나 summary가 만료됐다
+        del redis.data["session:s:summary"]
+
+        _, summary = await client.get_history_and_summary("s")
+        assert summary is None
+
+    async def test_local_summary_used_when_redis_down(self):
+        redis = FakeRedis()
+        client = CacheClient(redis)
+        await client.compact_history("s", keep=0, summary="earlier")
+        redis.down = True
+
+        _, summary = await client.get_history_and_summary("s")
+        assert summary == "earlier"
+
+    async def test_compact_is_one_round_trip(self):
+        redis = FakeRedis()
+        client = CacheClient(redis)
+        for n in range(3):
+            await client.flush_last_turn_to_cache("s", f"q{n}", f"a{n}")
+        redis.round_trips = 0
+
+        await client.compact_history("s", keep=0, summary=None)
+
+        assert redis.round_trips == 1
+        assert "session:s:history" not in redis.data
+        assert "session:s:summary" not in redis.data
+
+    async def test_falls_back_to_local_when_redis_down(self):
+        redis = FakeRedis()
+        client = CacheClient(redis)
+        client.append_user("s", "hi")
+        redis.down = True
+
+        await client.flush_last_turn_to_cache("s", "hi", "hello")
+        history, summary = await client.get_history_and_summary("s")
+
+        assert [m.content for m in history] == ["hi"]
+        assert summary is None
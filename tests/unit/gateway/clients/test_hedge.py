@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from app.gateway.clients.hedge import HedgeBudget, HedgedLLM, HedgePolicy
+from app.gateway.clients.llm import BaseLLM, LLMError
+
+
+class ScriptedLLM(BaseLLM):
+    """호출 순서대로 (첫 토큰 지연, 토큰들 | 예외)를 돌려주는 LLM."""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.calls = 0
+        self.closed: list[int] = []
+
+    async def stream(self, user_text, history):
+        n = self.calls
+        self.calls += 1
+        delay, result = self.script[n]
+        try:
+            await asyncio.sleep(delay)
+            if isinstance(result, Exception):
+                raise result
+            for tok in result:
+                yield tok
+        finally:
+            self.closed.append(n)
+
+
+def make_policy(delay_s=0.02, ratio=1.0, burst=1.0, **kwargs) -> HedgePolicy:
+    return HedgePolicy(delay_s=delay_s, budget=HedgeBudget(ratio=ratio, burst=burst), **kwargs)
+
+
+async def collect(llm) -> list[str]:
+    return [t async for t in llm.stream("hi", [])]
+
+
+class TestHedgedLLM:
+    """첫 토큰 지연 시 hedge 요청 테스트"""
+
+    async def test_fast_primary_not_hedged(self):
+        inner = ScriptedLLM((0, ["a", "b"]))
+        policy = make_policy()
+        assert await collect(HedgedLLM(inner, policy)) == ["a", "b"]
+        assert inner.calls == 1
+        assert policy.stats.hedged == 0
+
+    async def test_slow_primary_loses_to_hedge(self):
+        inner = ScriptedLLM((1.0, ["slow"]), (0, ["fast", "!"]))
+        policy = make_policy()
+        assert await collect(HedgedLLM(inner, policy)) == ["fast", "!"]
+        assert inner.calls == 2
+        assert sorted(inner.closed) == [0, 1]  # 진 쪽도 닫혔다
+        assert (policy.stats.hedged, policy.stats.hedge_wins) == (1, 1)
+        assert policy.stats.to_dict()["win_rate"] == 1.0
+
+    async def test_primary_can_still_win(self):
+        inner = ScriptedLLM((0.04, ["p"]), (1.0, ["h"]))
+        policy = make_policy()
+        assert await collect(HedgedLLM(inner, policy)) == ["p"]
+        assert (policy.stats.hedged, policy.stats.hedge_wins) == (1, 0)
+
+    async def test_budget_caps_hedges(self):
+        inner = ScriptedLLM((0.04, ["a"]), (1.0, ["x"]), (0.04, ["b"]))
+        policy = make_policy(ratio=0.0, burst=1.0)
+        llm = HedgedLLM(inner, policy)
+        await collect(llm)
+        await collect(llm)
+        assert policy.stats.hedged == 1
+        assert policy.stats.budget_denied == 1
+        assert inner.calls == 3
+
+    async def test_hedge_covers_failed_primary(self):
+        inner = ScriptedLLM((0.05, LLMError("boom")), (0, ["ok"]))
+        assert await collect(HedgedLLM(inner, make_policy())) == ["ok"]
+
+    async def test_all_attempts_fail(self):
+        inner = ScriptedLLM((0.05, LLMError("first")), (0.05, LLMError("second")))
+        with pytest.raises(LLMError, match="first"):
+            await collect(HedgedLLM(inner, make_policy()))
+
+    async def test_consumer_close_cancels_both(self):
+        inner = ScriptedLLM((1.0, ["a"]), (1.0, ["b"]))
+        stream = HedgedLLM(inner, make_policy()).stream("hi", [])
+        task = asyncio.create_task(anext(stream))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await stream.aclose()
+        assert sorted(inner.closed) == [0, 1]
+
+
+    async def test_records_primary_ttft(self):
+        policy = make_policy(delay_s=0.05)
+        await collect(HedgedLLM(ScriptedLLM((0.01, ["a"])), policy))
+        await collect(HedgedLLM(ScriptedLLM((0.08, ["p"]), (1.0, ["h"])), policy))
+
+        (fast, slow) = policy._ttft
+        assert fast < 0.05 <= 0.08 <= slow
+
+    async def test_losing_primary_records_its_elapsed_time(self):
+        # hedge가 이겨도 표본은 primary가 그때까지 기다린 시간(hedge 지연 이상)이다
+        policy = make_policy(delay_s=0.05)
+        await collect(HedgedLLM(ScriptedLLM((1.0, ["slow"]), (0.01, ["fast"])), policy))
+
+        (sample,) = policy._ttft
+        assert sample >= 0.05 + 0.01
+
+    async def test_failed_primary_records_nothing(self):
+        policy = make_policy()
+        await collect(HedgedLLM(ScriptedLLM((0.03, LLMError("boom")), (0.05, ["ok"])), policy))
+        assert len(policy._ttft) == 0
+
+
+class TestHedgePolicy:
+    def test_percentile_delay_after_warmup(self):
+        policy = make_policy(delay_s=1.0, percentile=90, min_samples=10, min_delay_s=0.05)
+        for i in range(9):
+            policy.record_ttft(0.1 * (i + 1))
+        assert policy.hedge_delay() == 1.0
+        policy.record_ttft(0.01)
+        assert policy.hedge_delay() == pytest.approx(0.8)
+
+    def test_budget_refills_by_ratio(self):
+        budget = HedgeBudget(ratio=0.5, burst=1.0)
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
@@ -0,0 +1,83 @@
+import httpx
+import pytest
+
+from app.gateway.clients.http_pool import MeteredTransport
+from app.gateway.clients.llm import LLMError, OpenAILLM
+
+
+def sse(*chunks: str) -> bytes:
+    lines = [
+        'data: {"choices": [{"delta": {"content": "%s"}}]}' % c for c in chunks
+    ]
+    return ("\n\n".join(lines + ["data: [DONE]"]) + "\n\n").encode()
+
+
+def make_client(handler) -> tuple[httpx.AsyncClient, MeteredTransport]:
+    transport = MeteredTransport(httpx.MockTransport(handler), max_connections=10)
+    return httpx.AsyncClient(transport=transport), transport
+
+
+class TestMeteredTransport:
+    """공유 LLM 커넥션 풀 사용량 계측 테스트"""
+
+    async def test_in_flight_until_body_closed(self):
+        client, transport = make_client(lambda request: httpx.Response(200, content=b"abc"))
+
+        async with client.stream("GET", "http://llm/") as response:
+            assert transport.in_flight == 1
+            assert await response.aread() == b"abc"
+        assert transport.in_flight == 0
+        assert transport.peak_in_flight == 1
+        assert transport.requests == 1
+        await client.aclose()
+
+    async def test_error_counted_and_released(self):
+        def handler(request):
+            raise httpx.ConnectError("down")
+
+        client, transport = make_client(handler)
+        with pytest.raises(httpx.ConnectError):
+            await client.get("http://llm/")
+        assert transport.errors == 1
+        assert transport.in_flight == 0
+        await client.aclose()
+
+    def test_stats_without_httpcore_pool(self):
+        transport = MeteredTransport(httpx.MockTransport(lambda r: httpx.Response(200)), max_connections=4)
+        stats = transport.stats()
+        assert stats["connections"] == 0
+        assert stats["utilization"] == 0.0
+        assert stats["max_connections"] == 4
+
+
+class TestOpenAILLMSharedClient:
+    """OpenAILLM이 주입된 공유 클라이언트를 쓰고 닫지 않는지 테스트"""
+
+    async def test_instances_share_client(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=sse("Hel", "lo"))
+
+        client, transport = make_client(handler)
+        llms = [OpenAILLM(api_key="sk-test", model=m, client=client) for m in ("a", "b")]
+
+        for llm in llms:
+            assert [t async for t in llm.stream("hi", [])] == ["Hel", "lo"]
+
+        assert len(requests) == 2
+        assert transport.requests == 2
+        assert transport.in_flight == 0
+        assert not client.is_closed
+        await client.aclose()
+
+    async def test_status_error_releases_connection(self):
+        client, transport = make_client(lambda request: httpx.Response(429))
+        llm = OpenAILLM(api_key="sk-test", client=client)
+
+        with pytest.raises(LLMError, match="rate limit"):
+            async for _ in llm.stream("hi", []):
+                pass
+        assert transport.in_flight == 0
+        await client.aclose()
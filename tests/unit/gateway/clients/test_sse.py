@@ -0,0 +1,65 @@
+import json
+
+from app.gateway.clients.sse import DONE, SSEParser, delta_content, iter_sse_content
+
+
+def chunk(content: str | None = None, **delta) -> str:
+    if content is not None:
+        delta["content"] = content
+    return "data: " + json.dumps({"choices": [{"index": 0, "delta": delta}]}) + "\n\n"
+
+
+async def agen(parts: list[bytes]):
+    for part in parts:
+        yield part
+
+
+class TestSSEParser:
+    """SSE 이벤트 경계 처리 테스트"""
+
+    def test_event_split_across_chunks(self):
+        parser = SSEParser()
+        raw = b'data: {"a": 1}\n\ndata: {"b": 2}\n\n'
+        events = []
+        for i in range(len(raw)):
+            events += parser.feed(raw[i:i + 1])
+        assert events == [b'{"a": 1}', b'{"b": 2}']
+
+    def test_multiline_data_joined(self):
+        parser = SSEParser()
+        assert parser.feed(b"data: line1\ndata:line2\n\n") == [b"line1\nline2"]
+
+    def test_crlf_comments_and_other_fields(self):
+        parser = SSEParser()
+        raw = b": keep-alive\r\nevent: message\r\nid: 3\r\ndata: x\r\n\r\n"
+        assert parser.feed(raw) == [b"x"]
+
+    def test_flush_without_trailing_blank_line(self):
+        parser = SSEParser()
+        assert parser.feed(b"data: [DONE]") == []
+        assert parser.flush() == [DONE]
+
+
+class TestDeltaContent:
+    def test_extracts_content(self):
+        assert delta_content(chunk("hi")[6:-2].encode()) == "hi"
+
+    def test_role_and_finish_chunks_skipped(self):
+        assert delta_content(chunk(role="assistant")[6:-2].encode()) is None
+        assert delta_content(b'{"choices": [{"delta": {}, "finish_reason": "stop"}]}') is None
+
+    def test_malformed_chunk_ignored(self):
+        assert delta_content(b'{"content": ') is None
+        assert delta_content(b'{"choices": [], "content": 1}') is None
+
+
+class TestIterSSEContent:
+    async def test_yields_until_done(self):
+        body = (chunk(role="assistant") + chunk("Hel") + chunk("lo 한") + chunk("글") + "data: [DONE]\n\n" + chunk("after")).encode()
+        # 한글 글자 중간에서 잘라도 이벤트 단위로 디코딩하므로 깨지지 않는다
+        parts = [body[i:i + 7] for i in range(0, len(body), 7)]
+        assert [t async for t in iter_sse_content(agen(parts))] == ["Hel", "lo 한", "글"]
+
+    async def test_stream_ends_without_done(self):
+        body = chunk("a").encode() + b'data: {"choices": [{"delta": {"content": "b"}}]}'
+        assert [t async for t in iter_sse_content(agen([body]))] == ["a", "b"]
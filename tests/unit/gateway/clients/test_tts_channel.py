@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+import pytest
+from websockets.asyncio.server import serve
+
+from app.gateway.clients.tts import TTSChannel, TTSChannelError
+from app.shared.framing import STATUS_END, STATUS_ERROR, STATUS_FATAL, encode_frame
+
+
+@pytest.fixture
+async def fake_tts_server():
+    """/ws/tts 프로토콜을 흉내 내는 서버. 요청마다 텍스트를 두 청크로 쪼개 역순 지연으로 돌려준다."""
+    received = []
+
+    async def handler(ws):
+        async def reply(msg):
+            if msg["text"] == "fail":
+                await ws.send(encode_frame(msg["id"], b"boom", status=STATUS_ERROR))
+                return
+            if msg["text"] == "invalid":
+                await ws.send(encode_frame(msg["id"], b"invalid request", status=STATUS_FATAL))
+                return
+            # 먼저 온 요청이 늦게 끝나도록 해서 멀티플렉싱을 확인한다
+            await asyncio.sleep(0.05 if msg["id"] == 0 else 0)
+            data = msg["text"].encode()
+            await ws.send(encode_frame(msg["id"], data[:2]))
+            await ws.send(encode_frame(msg["id"], data[2:]))
+            await ws.send(encode_frame(msg["id"], b"", status=STATUS_END))
+
+        async for raw in ws:
+            msg = json.loads(raw)
+            received.append(msg)
+            asyncio.create_task(reply(msg))
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        yield f"ws://127.0.0.1:{port}", received
+
+
+class TestTTSChannel:
+    """TTSChannel 멀티플렉싱 테스트"""
+
+    async def test_concurrent_requests_share_one_connection(self, fake_tts_server):
+        url, received = fake_tts_server
+        channel = TTSChannel(url)
+
+        results = await asyncio.gather(
+            channel.synthesize("first", voice="alloy"),
+            channel.synthesize("second", voice="echo"),
+        )
+
+        assert results == [b"first", b"second"]
+        assert [m["id"] for m in received] == [0, 1]
+        assert received[1]["voice"] == "echo"
+        await channel.aclose()
+
+    async def test_stream_yields_chunks_as_they_arrive(self, fake_tts_server):
+        url, _ = fake_tts_server
+        channel = TTSChannel(url)
+
+        chunks = [c async for c in channel.stream("hello", voice="alloy")]
+
+        assert chunks == [b"he", b"llo"]
+        await channel.aclose()
+
+    async def test_error_frame_raises(self, fake_tts_server):
+        url, _ = fake_tts_server
+        channel = TTSChannel(url)
+
+        with pytest.raises(TTSChannelError, match="boom") as exc_info:
+            await channel.synthesize("fail", voice="alloy")
+        assert exc_info.value.retryable
+        await channel.aclose()
+
+    async def test_fatal_frame_is_not_retryable(self, fake_tts_server):
+        url, _ = fake_tts_server
+        channel = TTSChannel(url)
+
+        with pytest.raises(TTSChannelError, match="invalid request") as exc_info:
+            await channel.synthesize("invalid", voice="alloy")
+        assert not exc_info.value.retryable
+        await channel.aclose()
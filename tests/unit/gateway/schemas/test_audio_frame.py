@@ -0,0 +1,22 @@
+import pytest
+
+from app.gateway.schemas.audio_frame import AUDIO_FRAME_HEADER, decode_audio_frame, encode_audio_frame
+
+
+class TestAudioFrame:
+    """binary audio frame 테스트"""
+
+    def test_roundtrip(self):
+        data = encode_audio_frame(turn_id=42, seq=3, fmt="wav", audio=b"RIFF....")
+        frame = decode_audio_frame(data)
+
+        assert (frame.turn_id, frame.seq, frame.format, frame.audio) == (42, 3, "wav", b"RIFF....")
+
+    def test_header_is_fixed_size(self):
+        assert len(encode_audio_frame(1, 1, "pcm", b"")) == AUDIO_FRAME_HEADER.size == 10
+
+    def test_rejects_unknown_version(self):
+        data = bytearray(encode_audio_frame(1, 1, "wav", b"x"))
+        data[0] = 9
+        with pytest.raises(ValueError):
+            decode_audio_frame(bytes(data))
@@ -0,0 +1,38 @@
+import pytest
+
+from app.gateway.schemas.client_message import (
+    CancelMessage,
+    ChatMessage,
+    ClientMessageError,
+    parse_client_message,
+)
+
+
+class TestParseClientMessage:
+    """/ws 클라이언트 메시지 파싱 테스트"""
+
+    def test_chat_message(self):
+        # JSON 문자열 안의 raw 제어 문자(여기선 탭)는 지우고 파싱한다
+        msg = parse_client_message('{"sessionId": "s1", "text": "hi\t"}\n')
+        assert msg == ChatMessage(sessionId="s1", text="hi")
+
+    def test_cancel_message(self):
+        assert parse_client_message('{"type": "cancel"}') == CancelMessage(type="cancel")
+        assert parse_client_message('{"type": "cancel", "sessionId": "s1"}').sessionId == "s1"
+
+    @pytest.mark.parametrize("raw", ["{not json", "[1, 2]", '"text"'])
+    def test_unparseable_has_no_session(self, raw):
+        with pytest.raises(ClientMessageError) as exc_info:
+            parse_client_message(raw)
+        assert exc_info.value.session_id is None
+
+    def test_missing_text_keeps_session(self):
+        with pytest.raises(ClientMessageError, match="text") as exc_info:
+            parse_client_message('{"sessionId": "s1"}')
+        assert exc_info.value.session_id == "s1"
+
+    @pytest.mark.parametrize("raw", ['{"text": "hi"}', '{"sessionId": "", "text": "hi"}', '{"sessionId": 3, "text": "hi"}'])
+    def test_missing_or_bad_session(self, raw):
+        with pytest.raises(ClientMessageError, match="sessionId") as exc_info:
+            parse_client_message(raw)
+        assert exc_info.value.session_id is None
@@ -0,0 +1,134 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.gateway.services.backpressure import (
+    POLICY_DISCONNECT,
+    POLICY_DROP_TOKENS,
+    BoundedEventQueue,
+    BufferRegistry,
+    ConnectionBuffer,
+    SlowConsumerError,
+)
+from app.gateway.services.orchestrator import Orchestrator
+
+
+def tok(text):
+    return {"type": "token", "text": text}
+
+
+class TestBoundedEventQueue:
+    """BoundedEventQueue 테스트"""
+
+    async def test_pause_blocks_when_full(self):
+        q = BoundedEventQueue(maxsize=1)
+        await q.put(tok("a"))
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(q.put(tok("b")), 0.05)
+
+    async def test_drop_tokens_keeps_audio(self):
+        buffer = ConnectionBuffer(connection_id=1)
+        q = BoundedEventQueue(maxsize=1, policy=POLICY_DROP_TOKENS, buffer=buffer)
+        await q.put(tok("a"))
+        await q.put(tok("b"))  # 버려짐
+        assert buffer.dropped_tokens == 1
+
+        audio = asyncio.create_task(q.put({"type": "audio_chunk", "audio": b"x" * 10}))
+        await asyncio.sleep(0)
+        assert not audio.done()  # 오디오는 자리가 날 때까지 기다린다
+        assert await q.get() == tok("a")
+        await audio
+        assert buffer.buffered_bytes == 10
+
+    async def test_disconnect_raises_and_frees_buffer(self):
+        buffer = ConnectionBuffer(connection_id=1)
+        q = BoundedEventQueue(maxsize=1, policy=POLICY_DISCONNECT, timeout_s=0.02, buffer=buffer)
+        await q.put({"type": "audio_chunk", "audio": b"x" * 100})
+        with pytest.raises(SlowConsumerError):
+            await q.put(tok("b"))
+        assert buffer.buffered_bytes == 0
+        with pytest.raises(SlowConsumerError):
+            await q.get()
+
+    async def test_fail_drops_events_and_raises_once(self):
+        buffer = ConnectionBuffer(connection_id=1)
+        q = BoundedEventQueue(maxsize=2, buffer=buffer)
+        await q.put(tok("a"))
+        q.fail(RuntimeError("llm down"))
+        q.fail(RuntimeError("ignored"))
+        assert buffer.buffered_bytes == 0
+        with pytest.raises(RuntimeError, match="llm down"):
+            await q.get()
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            BoundedEventQueue(maxsize=1, policy="explode")
+
+    def test_registry_tracks_open_connections(self):
+        registry = BufferRegistry()
+        a = registry.open()
+        registry.open()
+        a.add(5)
+        assert registry.to_dict()["connections"] == 2
+        assert registry.to_dict()["buffered_bytes"] == 5
+        registry.close(a)
+        assert registry.to_dict()["connections"] == 1
+
+
+class TestOrchestratorBackpressure:
+    """느린 소비자에 대한 Orchestrator 동작 테스트"""
+
+    @pytest.fixture
+    def mock_cache_client(self):
+        cache = MagicMock()
+        cache.get_history = AsyncMock(return_value=[])
+        cache.flush_last_turn_to_cache = AsyncMock()
+        return cache
+
+    @pytest.fixture
+    def counting_llm(self):
+        llm = MagicMock()
+        llm.read = 0
+
+        async def stream(user_text, history):
+            for _ in range(100):
+                llm.read += 1
+                yield "a"
+
+        llm.stream = stream
+        return llm
+
+    async def test_pause_stops_reading_llm(self, mock_cache_client, counting_llm):
+        orchestrator = Orchestrator(
+            cache_client=mock_cache_client,
+            tts=MagicMock(synthesize=AsyncMock(return_value=b"audio")),
+            llm=counting_llm,
+            event_queue_size=4,
+        )
+        events = orchestrator.stream_events("s1", "hi")
+        await anext(events)
+        await asyncio.sleep(0.05)  # 소비자가 멈춘 상태
+
+        assert counting_llm.read < 10
+        await events.aclose()
+
+    async def test_disconnect_policy_raises_to_consumer(self, mock_cache_client, counting_llm):
+        buffer = ConnectionBuffer(connection_id=1)
+        orchestrator = Orchestrator(
+            cache_client=mock_cache_client,
+            tts=MagicMock(synthesize=AsyncMock(return_value=b"audio")),
+            llm=counting_llm,
+            event_queue_size=4,
+            slow_policy=POLICY_DISCONNECT,
+            slow_timeout_s=0.02,
+            buffer=buffer,
+        )
+        events = orchestrator.stream_events("s1", "hi")
+        await anext(events)
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(SlowConsumerError):
+            async for _ in events:
+                pass
+        assert buffer.buffered_bytes == 0
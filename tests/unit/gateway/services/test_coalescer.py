@@ -0,0 +1,158 @@
+import asyncio
+from contextlib import aclosing, asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.gateway.services.backpressure import ConnectionBuffer
+from app.gateway.services.coalescer import coalesce_tokens
+from app.gateway.services.turn import TurnService
+
+
+async def scripted(*items):
+    """(delay, event) 목록을 순서대로 흘리는 이벤트 스트림."""
+    for delay, event in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield event
+
+
+def tok(text):
+    return {"type": "token", "text": text}
+
+
+class TestCoalesceTokens:
+    """coalesce_tokens() 테스트"""
+
+    async def test_first_token_is_not_delayed(self):
+        events = coalesce_tokens(scripted((0, tok("H")), (0.2, tok("i"))), window_s=0.05, max_bytes=100)
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        first = await anext(events)
+        assert first == tok("H")
+        assert loop.time() - t0 < 0.05
+        await events.aclose()
+
+    async def test_merges_within_window_and_keeps_order(self):
+        source = scripted(
+            (0, tok("H")), (0, tok("e")), (0, tok("l")), (0, tok("lo")),
+            (0, {"type": "audio_chunk", "seq": 1}),
+            (0, tok("!")),
+            (0, {"type": "done"}),
+        )
+        out = [e async for e in coalesce_tokens(source, window_s=1.0, max_bytes=100)]
+        assert out == [
+            tok("H"),
+            tok("ello"),
+            {"type": "audio_chunk", "seq": 1},
+            tok("!"),
+            {"type": "done"},
+        ]
+
+    async def test_window_expiry_flushes(self):
+        source = scripted((0, tok("a")), (0, tok("b")), (0.1, tok("c")), (0, {"type": "done"}))
+        out = [e async for e in coalesce_tokens(source, window_s=0.02, max_bytes=100)]
+        assert out == [tok("a"), tok("b"), tok("c"), {"type": "done"}]
+
+    async def test_max_bytes_flushes(self):
+        source = scripted(*[(0, tok("ab")) for _ in range(5)])
+        out = [e async for e in coalesce_tokens(source, window_s=1.0, max_bytes=4)]
+        assert out == [tok("ab"), tok("abab"), tok("abab")]
+
+    async def test_held_tokens_count_toward_connection_buffer(self):
+        buffer = ConnectionBuffer(connection_id=1)
+        source = scripted((0, tok("H")), (0, tok("el")), (0, tok("lo")), (0.2, {"type": "done"}))
+        events = coalesce_tokens(source, window_s=1.0, max_bytes=100, buffer=buffer)
+
+        assert await anext(events) == tok("H")
+        merged = asyncio.create_task(anext(events))
+        await asyncio.sleep(0.1)
+        # 합치려고 붙잡고 있는 token도 gateway 메모리에 있다
+        assert buffer.buffered_bytes == 4
+        assert await merged == tok("ello")
+        assert buffer.buffered_bytes == 0
+        assert [e async for e in events] == [{"type": "done"}]
+        assert (buffer.buffered_bytes, buffer.buffered_events) == (0, 0)
+
+    async def test_close_releases_held_tokens(self):
+        buffer = ConnectionBuffer(connection_id=1)
+        source = scripted((0, tok("H")), (0, tok("el")), (1.0, {"type": "done"}))
+        events = coalesce_tokens(source, window_s=1.0, max_bytes=100, buffer=buffer)
+
+        await anext(events)
+        pending = asyncio.create_task(anext(events))
+        await asyncio.sleep(0.05)
+        pending.cancel()
+        await asyncio.gather(pending, return_exceptions=True)
+        await events.aclose()
+
+        assert (buffer.buffered_bytes, buffer.buffered_events) == (0, 0)
+
+    async def test_source_error_is_raised_after_pending(self):
+        async def failing():
+            yield tok("a")
+            yield tok("b")
+            raise RuntimeError("boom")
+
+        out = []
+        with pytest.raises(RuntimeError):
+            async for event in coalesce_tokens(failing(), window_s=1.0, max_bytes=100):
+                out.append(event)
+        assert out == [tok("a"), tok("b")]
+
+    async def test_merged_token_keeps_tags(self):
+        tagged = [{"type": "token", "text": t, "sessionId": "s1", "turnId": 3} for t in ("a", "b", "c")]
+        source = scripted(*[(0, e) for e in tagged])
+        out = [e async for e in coalesce_tokens(source, window_s=1.0, max_bytes=100)]
+        assert out[1] == {"type": "token", "text": "bc", "sessionId": "s1", "turnId": 3}
+
+    async def test_barge_in_waits_for_turn_finalize(self):
+        """ws._run_turn처럼 DB context 안에서 코얼레싱된 턴을 취소하면, context가 닫히기 전에 finalize가 끝나야 한다"""
+        log = []
+        orchestrator = MagicMock()
+
+        async def slow_stream_events(session_id, user_text):
+            yield tok("Hel")
+            yield tok("lo")
+            await asyncio.sleep(10)
+            yield {"type": "done", "assistant_text": "Hello"}
+
+        orchestrator.stream_events = slow_stream_events
+        turn_service = TurnService(orchestrator_factory=MagicMock(return_value=orchestrator), cache_client=MagicMock())
+
+        async def finalize(db, turn_id, text, interrupted=False):
+            await asyncio.sleep(0.01)
+            log.append(("finalized", text, interrupted))
+
+        @asynccontextmanager
+        async def db_context():
+            try:
+                yield AsyncMock()
+            finally:
+                log.append("db_context_closed")
+
+        received = []
+
+        async def run_turn():
+            async with db_context() as db:
+                events = coalesce_tokens(
+                    turn_service.process_message(db, "s1", "Hi"), window_s=0.02, max_bytes=1024
+                )
+                async with aclosing(events):
+                    async for event in events:
+                        received.append(event)
+
+        with (
+            patch("app.gateway.services.turn.get_session_with_character", return_value=(MagicMock(), MagicMock())),
+            patch("app.gateway.services.turn.update_session_last_seen", AsyncMock()),
+            patch("app.gateway.services.turn.create_turn", AsyncMock(return_value=1)),
+            patch("app.gateway.services.turn.set_ttft", AsyncMock()),
+            patch("app.gateway.services.turn.finalize_turn", finalize),
+        ):
+            task = asyncio.create_task(run_turn())
+            while len(received) < 2:
+                await asyncio.sleep(0.005)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert log == [("finalized", "Hello", True), "db_context_closed"]
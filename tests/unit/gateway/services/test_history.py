@@ -0,0 +1,104 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from app.gateway.schemas.message import Message
+from app.gateway.services.history import (
+    SUMMARY_PREFIX,
+    HistoryBudget,
+    estimate_tokens,
+    fit_history,
+    fold_summary,
+    message_tokens,
+)
+from app.gateway.services.orchestrator import Orchestrator
+
+
+def turns(n: int, size: int = 200) -> list[Message]:
+    out = []
+    for i in range(n):
+        out.append(Message(role="user", content=f"question {i} " + "q" * size))
+        out.append(Message(role="assistant", content=f"answer {i} " + "a" * size))
+    return out
+
+
+class TestEstimateTokens:
+    def test_ascii_and_non_ascii(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("안녕하세요") == 5
+
+
+class TestFitHistory:
+    """토큰 상한 / rolling summary 테스트"""
+
+    def test_under_budget_untouched(self):
+        history = turns(2, size=10)
+        window = fit_history(history, None, HistoryBudget(max_tokens=1000))
+        assert window.messages == history
+        assert window.dropped == []
+        assert window.summary is None
+
+    def test_drops_oldest_whole_turns(self):
+        history = turns(6)
+        budget = HistoryBudget(max_tokens=300, summary_tokens=80)
+        window = fit_history(history, None, budget)
+
+        assert window.tokens <= budget.max_tokens
+        assert window.kept % 2 == 0
+        assert window.messages[1].role == "user"
+        assert window.messages[1:] == history[-window.kept:]
+        assert window.dropped == history[:-window.kept]
+
+    def test_summary_prepended_and_bounded(self):
+        history = turns(6)
+        window = fit_history(history, None, HistoryBudget(max_tokens=300, summary_tokens=80))
+
+        head = window.messages[0]
+        assert head.role == "system"
+        assert head.content.startswith(SUMMARY_PREFIX)
+        assert estimate_tokens(window.summary) <= 80
+        # 상한 때문에 가장 최근에 잘린 메시지가 요약에 남는다
+        assert window.summary.splitlines()[-1].startswith(f"assistant: answer {6 - window.kept // 2 - 1}")
+
+    def test_existing_summary_rolls_forward(self):
+        history = turns(4)
+        window = fit_history(history, "user: hello", HistoryBudget(max_tokens=250, summary_tokens=500))
+        assert window.summary.startswith("user: hello\nuser: question 0")
+
+    def test_bounded_whatever_the_length(self):
+        budget = HistoryBudget(max_tokens=400, summary_tokens=100)
+        for n in (1, 10, 50):
+            window = fit_history(turns(n), None, budget)
+            assert sum(message_tokens(m) for m in window.messages) <= budget.max_tokens
+
+    def test_fold_summary_clips_long_lines(self):
+        summary = fold_summary(None, [Message(role="user", content="x" * 1000)], max_tokens=1000)
+        assert len(summary) < 200
+
+
+class TestOrchestratorHistoryBudget:
+    async def test_compacts_stored_history(self):
+        history = turns(6)
+        cache = MagicMock()
+        cache.get_history_and_summary = AsyncMock(return_value=(history, None))
+        cache.compact_history = AsyncMock()
+        cache.flush_last_turn_to_cache = AsyncMock()
+        tts = MagicMock()
+        tts.synthesize = AsyncMock(return_value=b"a")
+        seen = []
+
+        class LLM:
+            async def stream(self, user_text, llm_history):
+                seen.extend(llm_history)
+                yield "ok"
+
+        orch = Orchestrator(
+            cache_client=cache, tts=tts, llm=LLM(),
+            history_budget=HistoryBudget(max_tokens=300, summary_tokens=80),
+        )
+        events = [e async for e in orch.stream_events("s1", "next")]
+
+        assert events[-1]["type"] == "done"
+        kept = cache.compact_history.call_args.kwargs["keep"]
+        assert 0 < kept < len(history)
+        assert seen[0].role == "system"
+        assert seen[-1] == Message(role="user", content="next")
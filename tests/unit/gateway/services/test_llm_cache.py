@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from app.gateway.clients.llm import BaseLLM
+from app.gateway.schemas.message import Message
+from app.gateway.services.llm_cache import (
+    REPLAY_INSTANT,
+    REPLAY_PACED,
+    CachedLLM,
+    LLMResponseCache,
+    response_key,
+)
+
+
+class CountingLLM(BaseLLM):
+    def __init__(self, tokens: list[str], gap: float = 0.0):
+        self.tokens = tokens
+        self.gap = gap
+        self.calls = 0
+
+    async def stream(self, user_text, history):
+        self.calls += 1
+        for tok in self.tokens:
+            await asyncio.sleep(self.gap)
+            yield tok
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cached(llm, cache=None, **kwargs) -> CachedLLM:
+    cache = cache or LLMResponseCache(max_entries=10, max_bytes=1024, ttl_s=60)
+    return CachedLLM(llm, cache, model="m", system_prompt="sys", temperature=0.0, **kwargs)
+
+
+async def collect(llm, text="hi", history=None) -> list[str]:
+    return [t async for t in llm.stream(text, history or [])]
+
+
+class TestResponseKey:
+    def test_whitespace_normalized(self):
+        assert response_key("m", "s", 0.0, [], "who  are you?\n") == response_key("m", "s", 0.0, [], "who are you?")
+
+    def test_history_and_settings_in_key(self):
+        base = response_key("m", "s", 0.0, [], "hi")
+        history = [Message(role="user", content="hi"), Message(role="assistant", content="hello")]
+        assert response_key("m", "s", 0.0, history, "hi") != base
+        assert response_key("m2", "s", 0.0, [], "hi") != base
+        assert response_key("m", "other", 0.0, [], "hi") != base
+        assert response_key("m", "s", 0.5, [], "hi") != base
+
+
+class TestLLMResponseCache:
+    """TTL / 크기 상한 테스트"""
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = LLMResponseCache(max_entries=10, max_bytes=1024, ttl_s=5, clock=clock)
+        cache.put("k", ["a"], [0.0])
+        assert cache.get("k") is not None
+        clock.now = 5.0
+        assert cache.get("k") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.expired, stats.entries) == (1, 1, 1, 0)
+
+    def test_lru_eviction_by_entries_and_bytes(self):
+        cache = LLMResponseCache(max_entries=2, max_bytes=6, ttl_s=60)
+        cache.put("a", ["aa"], [0.0])
+        cache.put("b", ["bb"], [0.0])
+        cache.get("a")  # a가 최근에 쓰였으므로 b가 밀려난다
+        cache.put("c", ["cc"], [0.0])
+        assert cache.get("b") is None and cache.get("a") is not None
+        cache.put("d", ["dddd"], [0.0])  # 바이트 상한
+        assert cache.size <= 6
+        assert cache.stats().evictions == 2
+
+    def test_hit_rate(self):
+        cache = LLMResponseCache(max_entries=2, max_bytes=64, ttl_s=60)
+        assert cache.stats().to_dict()["hit_rate"] is None
+        cache.put("a", ["x"], [0.0])
+        cache.get("a")
+        cache.get("b")
+        assert cache.stats().to_dict()["hit_rate"] == 0.5
+
+
+class TestCachedLLM:
+    async def test_second_call_replays_without_upstream(self):
+        inner = CountingLLM(["Hel", "lo"])
+        llm = make_cached(inner, replay=REPLAY_INSTANT)
+        assert await collect(llm) == ["Hel", "lo"]
+        assert await collect(llm, " hi ") == ["Hel", "lo"]
+        assert inner.calls == 1
+
+    async def test_different_history_misses(self):
+        inner = CountingLLM(["x"])
+        llm = make_cached(inner)
+        await collect(llm)
+        await collect(llm, history=[Message(role="user", content="before")])
+        assert inner.calls == 2
+
+    async def test_paced_replay_follows_recorded_gaps(self):
+        inner = CountingLLM(["a", "b", "c"], gap=0.03)
+        llm = make_cached(inner, replay=REPLAY_PACED, max_gap_s=0.02)
+        await collect(llm)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await collect(llm) == ["a", "b", "c"]
+        elapsed = loop.time() - start
+        # 첫 토큰은 바로, 나머지 두 간격은 max_gap_s로 잘린다
+        assert 0.04 <= elapsed < 0.09
+
+    async def test_partial_stream_not_stored(self):
+        inner = CountingLLM(["a", "b"])
+        cache = LLMResponseCache(max_entries=10, max_bytes=1024, ttl_s=60)
+        llm = make_cached(inner, cache)
+
+        stream = llm.stream("hi", [])
+        assert await anext(stream) == "a"
+        await stream.aclose()
+        assert len(cache) == 0
+
+    def test_unknown_replay_mode(self):
+        with pytest.raises(ValueError):
+            make_cached(CountingLLM([]), replay="slow")
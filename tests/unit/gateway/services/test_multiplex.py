@@ -0,0 +1,101 @@
+import asyncio
+
+from app.gateway.services.backpressure import ConnectionBuffer
+from app.gateway.services.multiplex import FairSender
+
+
+class TestFairSender:
+    """FairSender 테스트"""
+
+    async def run_until_sent(self, sender, sent, n):
+        writer = asyncio.create_task(sender.run())
+        while len(sent) < n:
+            await asyncio.sleep(0)
+        writer.cancel()
+
+    async def test_round_robin_between_streams(self):
+        sent = []
+
+        async def send(event):
+            sent.append(event["id"])
+
+        sender = FairSender(send, per_stream=8)
+        for i in range(4):
+            await sender.put("a", {"id": f"a{i}"})
+        for i in range(2):
+            await sender.put("b", {"id": f"b{i}"})
+
+        await self.run_until_sent(sender, sent, 6)
+        assert sent == ["a0", "b0", "a1", "b1", "a2", "a3"]
+
+    async def test_order_within_stream_is_kept(self):
+        sent = []
+
+        async def send(event):
+            sent.append(event)
+
+        sender = FairSender(send, per_stream=2)
+        writer = asyncio.create_task(sender.run())
+        for i in range(10):
+            await sender.put("a", {"seq": i})  # per_stream=2라서 중간중간 막힌다
+        while len(sent) < 10:
+            await asyncio.sleep(0)
+        writer.cancel()
+        assert [e["seq"] for e in sent] == list(range(10))
+
+    async def test_discard_drops_unsent_events(self):
+        sent = []
+
+        async def send(event):
+            sent.append(event["id"])
+
+        sender = FairSender(send)
+        await sender.put("a", {"id": "a0"})
+        await sender.put("b", {"id": "b0"})
+        sender.discard("a")
+
+        await self.run_until_sent(sender, sent, 1)
+        await asyncio.sleep(0)
+        assert sent == ["b0"]
+
+    async def test_finished_stream_is_removed_after_drain(self):
+        async def send(event):
+            pass
+
+        sender = FairSender(send)
+        await sender.put("a", {"id": "a0"})
+        sender.finish("a")
+        assert sender.streams == 1
+
+        writer = asyncio.create_task(sender.run())
+        await asyncio.sleep(0)
+        writer.cancel()
+        assert sender.streams == 0
+
+    async def test_buffer_counts_events_until_sent(self):
+        release = asyncio.Event()
+        sent = []
+
+        async def send(event):
+            await release.wait()  # 느린 소켓
+            sent.append(event)
+
+        buffer = ConnectionBuffer(connection_id=1)
+        sender = FairSender(send, buffer=buffer)
+        writer = asyncio.create_task(sender.run())
+        await sender.put("a", {"type": "token", "text": "hello"})
+        await sender.put("a", {"type": "audio_chunk", "data": "xxxx"})
+        await sender.put("b", {"type": "token", "text": "hi"})
+        await asyncio.sleep(0)
+
+        # writer가 첫 이벤트를 보내는 중이어도(큐에서는 빠졌어도) 아직 센다
+        assert (buffer.buffered_bytes, buffer.buffered_events) == (11, 3)
+
+        sender.discard("a")
+        assert (buffer.buffered_bytes, buffer.buffered_events) == (7, 2)
+        release.set()
+        while len(sent) < 2:
+            await asyncio.sleep(0)
+        writer.cancel()
+        assert (buffer.buffered_bytes, buffer.buffered_events) == (0, 0)
+        assert buffer.peak_bytes == 11
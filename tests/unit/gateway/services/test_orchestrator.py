@@ -1,8 +1,10 @@
+import asyncio
 import base64
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.gateway.clients.llm import LLMError
 from app.gateway.services.orchestrator import Orchestrator, PUNCT
 
 
@@ -78,6 +80,20 @@ class TestOrchestrator:
             decoded = base64.b64decode(audio_event["data"])
             assert decoded == b"fake_audio_bytes"
 
+    async def test_binary_audio_carries_raw_bytes(self, mock_cache_client, mock_tts_client, mock_llm):
+        """binary_audio 모드에서는 base64 없이 raw bytes를 담는지 확인"""
+        orchestrator = Orchestrator(
+            cache_client=mock_cache_client,
+            tts=mock_tts_client,
+            llm=mock_llm,
+            binary_audio=True,
+        )
+        events = [e async for e in orchestrator.stream_events("session-1", "Hi")]
+
+        audio_events = [e for e in events if e["type"] == "audio_chunk"]
+        assert audio_events[0]["audio"] == b"fake_audio_bytes"
+        assert "data" not in audio_events[0]
+
     async def test_cache_operations_called(self, orchestrator, mock_cache_client):
         """캐시 연산이 올바르게 호출되는지 확인"""
         events = []
@@ -134,6 +150,58 @@ class TestOrchestrator:
         assert received_history[2] == {"role": "user", "text": "New question"}
 
 
+class TestOrchestratorErrors:
+    """producer 쪽 실패가 stream_events 소비자에게 올라오는지 테스트 (안 올라오면 턴이 안 끝난다)"""
+
+    @pytest.fixture
+    def mock_cache_client(self):
+        cache = MagicMock()
+        cache.get_history = AsyncMock(return_value=[])
+        cache.flush_last_turn_to_cache = AsyncMock()
+        return cache
+
+    async def drain(self, orchestrator) -> list[dict]:
+        events = []
+        async with asyncio.timeout(2):
+            async for event in orchestrator.stream_events("session-1", "Hi"):
+                events.append(event)
+        return events
+
+    async def test_failing_llm_raises(self, mock_cache_client):
+        llm = MagicMock()
+
+        async def failing_stream(user_text, history):
+            yield "Hel"
+            raise LLMError("upstream reset")
+
+        llm.stream = failing_stream
+        orchestrator = Orchestrator(
+            cache_client=mock_cache_client,
+            tts=MagicMock(synthesize=AsyncMock(return_value=b"audio")),
+            llm=llm,
+        )
+
+        with pytest.raises(LLMError, match="upstream reset"):
+            await self.drain(orchestrator)
+
+    async def test_failing_tts_raises(self, mock_cache_client):
+        llm = MagicMock()
+
+        async def stream(user_text, history):
+            yield "Hello there."
+
+        llm.stream = stream
+        orchestrator = Orchestrator(
+            cache_client=mock_cache_client,
+            tts=MagicMock(synthesize=AsyncMock(side_effect=RuntimeError("tts down"))),
+            llm=llm,
+        )
+
+        with pytest.raises(RuntimeError, match="tts down"):
+            await self.drain(orchestrator)
+        mock_cache_client.flush_last_turn_to_cache.assert_not_called()
+
+
 class TestChunkingLogic:
     """토큰 청킹 로직 테스트 (60자 또는 구두점 기준)"""
 
@@ -226,3 +294,86 @@ class TestPunctConstant:
         assert "?" in PUNCT
         assert "!" in PUNCT
         assert "\n" in PUNCT
+
+
+class TestTTSPipeline:
+    """TTS 합성 pipeline (동시 합성 + 순서 보장) 테스트"""
+
+    @pytest.fixture
+    def mock_cache_client(self):
+        cache = MagicMock()
+        cache.get_history = AsyncMock(return_value=[])
+        cache.append_user = MagicMock()
+        cache.append_assistant = MagicMock()
+        cache.flush_last_turn_to_cache = AsyncMock()
+        return cache
+
+    @pytest.fixture
+    def mock_llm(self):
+        llm = MagicMock()
+
+        async def stream(user_text, history):
+            for char in "A. B. C. D.":
+                yield char
+
+        llm.stream = stream
+        return llm
+
+    def slow_tts(self, inflight):
+        # 먼저 들어온 segment일수록 늦게 끝나도록 만들어 순서 뒤집힘을 유도
+        delays = {"A.": 0.08, "B.": 0.04, "C.": 0.02, "D.": 0.01}
+
+        async def synthesize(text, fmt):
+            inflight.append(1)
+            inflight[0] = max(inflight[0], len(inflight) - 1)
+            await asyncio.sleep(delays[text])
+            inflight.pop()
+            return text.encode()
+
+        tts = MagicMock()
+        tts.synthesize = synthesize
+        return tts
+
+    async def test_audio_emitted_in_seq_order(self, mock_cache_client, mock_llm):
+        inflight = [0]
+        orchestrator = Orchestrator(
+            cache_client=mock_cache_client,
+            tts=self.slow_tts(inflight),
+            llm=mock_llm,
+            binary_audio=True,
+            tts_depth=4,
+        )
+        events = [e async for e in orchestrator.stream_events("s1", "test")]
+
+        audio = [e for e in events if e["type"] == "audio_chunk"]
+        assert [e["seq"] for e in audio] == [1, 2, 3, 4]
+        assert [e["audio"] for e in audio] == [b"A.", b"B.", b"C.", b"D."]
+        assert inflight[0] > 1  # 실제로 겹쳐서 합성됨
+
+    async def test_depth_caps_inflight_per_turn(self, mock_cache_client, mock_llm):
+        inflight = [0]
+        orchestrator = Orchestrator(
+            cache_client=mock_cache_client,
+            tts=self.slow_tts(inflight),
+            llm=mock_llm,
+            tts_depth=2,
+        )
+        async for _ in orchestrator.stream_events("s1", "test"):
+            pass
+
+        assert inflight[0] <= 2
+
+    async def test_shared_slots_cap_inflight_across_turns(self, mock_cache_client, mock_llm):
+        inflight = [0]
+        slots = asyncio.Semaphore(1)
+        orchestrator = Orchestrator(
+            cache_client=mock_cache_client,
+            tts=self.slow_tts(inflight),
+            llm=mock_llm,
+            tts_depth=4,
+            tts_slots=slots,
+        )
+        async for _ in orchestrator.stream_events("s1", "test"):
+            pass
+
+        assert inflight[0] == 1
@@ -0,0 +1,79 @@
+import pytest
+
+from app.gateway.services.segmenter import Segmenter, SegmenterConfig
+
+
+def segment(text: str, step: int = 1, config: SegmenterConfig | None = None) -> list[str]:
+    """text를 step 글자씩 토큰처럼 흘려 넣고 나온 segment 목록."""
+    segmenter = Segmenter(config)
+    out = []
+    for i in range(0, len(text), step):
+        out += segmenter.feed(text[i:i + step])
+    return out + segmenter.flush()
+
+
+class TestSegmenter:
+    """Segmenter 테스트"""
+
+    @pytest.mark.parametrize("step", [1, 3, 100])
+    def test_sentence_boundaries(self, step):
+        assert segment("Hello there. How are you? Fine!", step) == ["Hello there.", "How are you?", "Fine!"]
+
+    def test_decimals_are_not_boundaries(self):
+        assert segment("Pi is 3.14 roughly. Yes.") == ["Pi is 3.14 roughly.", "Yes."]
+
+    def test_abbreviations_are_not_boundaries(self):
+        assert segment("Ask Dr. Kim. Then go, e.g. home.", config=SegmenterConfig(first_max_words=20)) == [
+            "Ask Dr. Kim.",
+            "Then go, e.g. home.",
+        ]
+
+    def test_thousands_separator_is_not_a_clause(self):
+        assert segment("It costs about 1,000 dollars today.", config=SegmenterConfig(first_clause_min_chars=1)) == [
+            "It costs about 1,000 dollars today."
+        ]
+
+    def test_short_first_segment_on_clause(self):
+        text = "Sure thing my friend, the answer is long, and keeps going."
+        assert segment(text) == ["Sure thing my friend,", "the answer is long, and keeps going."]
+
+    def test_short_first_segment_on_word_count(self):
+        text = "one two three four five six"
+        assert segment(text, config=SegmenterConfig(first_max_words=3)) == ["one two three", "four five six"]
+
+    def test_later_segments_merge_below_min_chars(self):
+        text = "Hi. A. B. C. This one is long."
+        assert segment(text, config=SegmenterConfig(min_chars=10)) == ["Hi.", "A. B. C. This one is long."]
+
+    def test_max_chars_cuts_at_last_space(self):
+        text = "word " * 20
+        out = segment(text, config=SegmenterConfig(first_max_words=100, max_chars=22))
+        assert all(len(s) <= 22 for s in out)
+        assert " ".join(out) == text.strip()
+
+    def test_character_overrides(self):
+        config = SegmenterConfig().with_overrides({"max_chars": "40", "unknown": 1})
+        assert config.max_chars == 40
+        assert SegmenterConfig().with_overrides(None) == SegmenterConfig()
+
+    @pytest.mark.parametrize("overrides", [
+        {"max_chars": 0},
+        {"max_chars": -5},
+        {"min_chars": -1},
+        {"first_max_words": -1},
+        {"first_clause_min_chars": -1},
+        {"max_chars": 20, "min_chars": 30},
+    ])
+    def test_rejects_out_of_range_overrides(self, overrides):
+        with pytest.raises(ValueError):
+            SegmenterConfig().with_overrides(overrides)
+
+    @pytest.mark.parametrize("tokens", [["Note", ";"], ["Well, here is the thing", ":"]])
+    def test_clause_end_at_buffer_end_waits_for_next_token(self, tokens):
+        segmenter = Segmenter()
+        out = []
+        for token in tokens:
+            out += segmenter.feed(token)
+        assert out == []
+        out += segmenter.feed(" and then some more words here.")
+        assert " ".join(out + segmenter.flush()) == "".join(tokens) + " and then some more words here."
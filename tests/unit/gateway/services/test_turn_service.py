@@ -1,8 +1,14 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
+from app.gateway.clients.llm import OpenAILLM
+from app.gateway.clients.tts import TTSClient
+from app.gateway.services.orchestrator import Orchestrator
 from app.gateway.services.turn import TurnService
+from app.shared.resilience import CircuitBreaker, RetryPolicy, Upstream
 
 
 def create_turn_service(mock_orchestrator):
@@ -79,6 +85,33 @@ class TestTurnService:
         assert events[2]["type"] == "audio_chunk"
         assert events[3]["type"] == "done"
 
+    @patch("app.gateway.services.turn.update_session_last_seen")
+    @patch("app.gateway.services.turn.create_turn")
+    @patch("app.gateway.services.turn.set_ttft")
+    @patch("app.gateway.services.turn.set_ttaf")
+    @patch("app.gateway.services.turn.finalize_turn")
+    async def test_audio_chunk_tagged_with_turn_id(
+        self,
+        mock_finalize,
+        mock_set_ttaf,
+        mock_set_ttft,
+        mock_create_turn,
+        mock_update_last_seen,
+        turn_service,
+        mock_db,
+        mock_session_with_character,
+    ):
+        """audio_chunk에 turnId가 붙는지 확인 (binary frame header용)"""
+        mock_create_turn.return_value = 7
+
+        with patch(
+            "app.gateway.services.turn.get_session_with_character",
+            return_value=mock_session_with_character,
+        ):
+            events = [e async for e in turn_service.process_message(mock_db, "session-1", "Hello")]
+
+        assert events[2]["turnId"] == 7
+
     @patch("app.gateway.services.turn.update_session_last_seen")
     @patch("app.gateway.services.turn.create_turn")
     @patch("app.gateway.services.turn.set_ttft")
@@ -321,3 +354,145 @@ class TestTurnServiceSessionValidation:
             with pytest.raises(ValueError, match="has no character bound"):
                 async for _ in turn_service.process_message(mock_db, "session-1", "Hello"):
                     pass
+
+
+class TestTurnServiceInterruption:
+    """barge-in (턴 취소) 테스트"""
+
+    @pytest.fixture
+    def slow_orchestrator(self):
+        orchestrator = MagicMock()
+
+        async def fake_stream_events(session_id, user_text):
+            yield {"type": "token", "text": "Hel"}
+            yield {"type": "token", "text": "lo"}
+            await asyncio.sleep(10)  # LLM/TTS가 아직 도는 중
+            yield {"type": "done", "assistant_text": "Hello world"}
+
+        orchestrator.stream_events = fake_stream_events
+        return orchestrator
+
+    @patch("app.gateway.services.turn.update_session_last_seen")
+    @patch("app.gateway.services.turn.create_turn")
+    @patch("app.gateway.services.turn.set_ttft")
+    @patch("app.gateway.services.turn.finalize_turn")
+    async def test_cancel_finalizes_with_partial_text(
+        self, mock_finalize, mock_set_ttft, mock_create_turn, mock_update_last_seen, slow_orchestrator
+    ):
+        mock_create_turn.return_value = 5
+        turn_service = create_turn_service(slow_orchestrator)
+        received = []
+
+        async def run():
+            async for event in turn_service.process_message(AsyncMock(), "session-1", "Hi"):
+                received.append(event)
+
+        with patch(
+            "app.gateway.services.turn.get_session_with_character",
+            return_value=(MagicMock(), MagicMock()),
+        ):
+            task = asyncio.create_task(run())
+            while len(received) < 2:
+                await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        mock_finalize.assert_called_once()
+        assert mock_finalize.call_args.args[1:] == (5, "Hello")
+        assert mock_finalize.call_args.kwargs == {"interrupted": True}
+
+    @patch("app.gateway.services.turn.update_session_last_seen")
+    @patch("app.gateway.services.turn.create_turn")
+    @patch("app.gateway.services.turn.set_ttft")
+    @patch("app.gateway.services.turn.set_ttaf")
+    @patch("app.gateway.services.turn.finalize_turn")
+    async def test_close_after_done_is_not_an_interruption(
+        self, mock_finalize, mock_set_ttaf, mock_set_ttft, mock_create_turn, mock_update_last_seen
+    ):
+        orchestrator = MagicMock()
+
+        async def fake_stream_events(session_id, user_text):
+            yield {"type": "token", "text": "Hi"}
+            yield {"type": "done", "assistant_text": "Hi"}
+
+        orchestrator.stream_events = fake_stream_events
+        mock_create_turn.return_value = 5
+        turn_service = create_turn_service(orchestrator)
+
+        with patch(
+            "app.gateway.services.turn.get_session_with_character",
+            return_value=(MagicMock(), MagicMock()),
+        ):
+            events = turn_service.process_message(AsyncMock(), "session-1", "Hi")
+            async for event in events:
+                if event["type"] == "done":
+                    break
+            await events.aclose()
+
+        mock_finalize.assert_called_once_with(ANY, 5, "Hi")
+
+
+def open_upstream(name: str) -> Upstream:
+    breaker = CircuitBreaker(name, failure_threshold=1, reset_timeout_s=60)
+    breaker.record_failure()
+    return Upstream(breaker, RetryPolicy(max_attempts=1))
+
+
+class TestOpenBreaker:
+    """breaker가 열려 있을 때 실제 Orchestrator로 턴을 돌리면 멈추지 않고 error 이벤트로 끝나는지 테스트"""
+
+    @pytest.fixture
+    def mock_cache_client(self):
+        cache = MagicMock()
+        cache.get_history = AsyncMock(return_value=[])
+        cache.flush_last_turn_to_cache = AsyncMock()
+        return cache
+
+    async def run_turn(self, orchestrator) -> list[dict]:
+        turn_service = create_turn_service(orchestrator)
+        with (
+            patch("app.gateway.services.turn.get_session_with_character", return_value=(MagicMock(), MagicMock())),
+            patch("app.gateway.services.turn.create_turn", return_value=1),
+            patch("app.gateway.services.turn.update_session_last_seen"),
+            patch("app.gateway.services.turn.set_ttft"),
+            patch("app.gateway.services.turn.set_ttaf"),
+            patch("app.gateway.services.turn.finalize_turn") as mock_finalize,
+        ):
+            events = []
+            async with asyncio.timeout(2):
+                async for event in turn_service.process_message(AsyncMock(), "session-1", "Hi"):
+                    events.append(event)
+        mock_finalize.assert_called_once()
+        return events
+
+    async def test_open_tts_breaker_ends_turn_with_error(self, mock_cache_client):
+        llm = MagicMock()
+
+        async def stream(user_text, history):
+            yield "Hello there."
+
+        llm.stream = stream
+        orchestrator = Orchestrator(
+            cache_client=mock_cache_client,
+            tts=TTSClient("http://tts", upstream=open_upstream("tts")),
+            llm=llm,
+        )
+
+        events = await self.run_turn(orchestrator)
+
+        assert events[-1]["type"] == "error"
+        assert "tts circuit open" in events[-1]["message"]
+
+    async def test_open_llm_breaker_ends_turn_with_error(self, mock_cache_client):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+        orchestrator = Orchestrator(
+            cache_client=mock_cache_client,
+            tts=MagicMock(synthesize=AsyncMock(return_value=b"audio")),
+            llm=OpenAILLM(api_key="sk-test", client=client, upstream=open_upstream("llm")),
+        )
+
+        events = await self.run_turn(orchestrator)
+
+        assert events[-1]["type"] == "error"
+        assert "unavailable" in events[-1]["message"]
+        await client.aclose()
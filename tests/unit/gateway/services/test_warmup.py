@@ -0,0 +1,96 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.gateway.services.warmup import WarmupService, warm_phrases
+
+
+def make_character(voice="alloy", greeting=None, id=1):
+    character = MagicMock()
+    character.id = id
+    character.voice = voice
+    character.greeting = greeting
+    return character
+
+
+@asynccontextmanager
+async def fake_session():
+    yield AsyncMock()
+
+
+class TestWarmPhrases:
+    """warm_phrases() 테스트"""
+
+    def test_greeting_first_then_fillers(self):
+        character = make_character(greeting="Hi, I'm Kai!")
+        assert warm_phrases(character, ["Hmm.", "Okay."]) == ["Hi, I'm Kai!", "Hmm.", "Okay."]
+
+    def test_without_greeting(self):
+        assert warm_phrases(make_character(), ["Hmm."]) == ["Hmm."]
+
+
+class TestWarmupService:
+    """WarmupService 테스트"""
+
+    @pytest.fixture
+    def clients(self):
+        return {}
+
+    @pytest.fixture
+    def service(self, clients):
+        def factory(voice):
+            client = clients.get(voice)
+            if client is None:
+                client = clients[voice] = MagicMock()
+                client.warm = AsyncMock(return_value={"warmed": 1})
+            return client
+
+        return WarmupService(
+            tts_factory=factory,
+            session_factory=fake_session,
+            filler_phrases=["Hmm."],
+            budget_s=5,
+        )
+
+    async def test_one_group_per_character(self, service, clients):
+        await service.warm_characters([
+            make_character("alloy", "Hello!", id=1),
+            make_character("alloy", "Hey.", id=2),
+            make_character("nova", id=3),
+        ])
+
+        alloy = {c.kwargs["group"]: c.args[0] for c in clients["alloy"].warm.await_args_list}
+        assert alloy == {"character:1": ["Hello!", "Hmm."], "character:2": ["Hey.", "Hmm."]}
+        assert clients["nova"].warm.await_args.args[0] == ["Hmm."]
+        assert clients["nova"].warm.await_args.kwargs["group"] == "character:3"
+
+    async def test_sends_empty_list_to_release_old_phrases(self, service, clients):
+        service.filler_phrases = []
+        await service.warm_characters([make_character("alloy", None, id=4)])
+
+        assert clients["alloy"].warm.await_args.args[0] == []
+        assert clients["alloy"].warm.await_args.kwargs["group"] == "character:4"
+
+    async def test_tts_error_is_logged_not_raised(self, service, clients):
+        def failing(voice):
+            client = MagicMock()
+            client.warm = AsyncMock(side_effect=httpx.ConnectError("down"))
+            return client
+
+        service._tts_factory = failing
+        await service.warm_characters([make_character()])
+
+    async def test_schedule_all_runs_in_background(self, service, clients):
+        with patch(
+            "app.gateway.services.warmup.list_characters",
+            AsyncMock(return_value=[make_character(greeting="Hello!")]),
+        ):
+            service.schedule_all()
+            assert len(service._tasks) == 1
+            await service.aclose()
+            service.schedule_all()
+            await next(iter(service._tasks))
+
+        assert clients["alloy"].warm.await_args.args[0] == ["Hello!", "Hmm."]
@@ -0,0 +1,36 @@
+import pytest
+
+from app.shared.framing import STATUS_ERROR, decode_frames, encode_frame, iter_frames
+
+
+async def chunked(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+class TestFraming:
+    """length-prefixed frame 인코딩/디코딩 테스트"""
+
+    def test_roundtrip(self):
+        data = encode_frame(0, b"audio") + encode_frame(1, b"oops", status=STATUS_ERROR)
+        frames = decode_frames(data)
+
+        assert [(f.index, f.ok, f.payload) for f in frames] == [
+            (0, True, b"audio"),
+            (1, False, b"oops"),
+        ]
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 1024])
+    async def test_iter_frames_across_chunk_boundaries(self, size):
+        """frame이 청크 경계에서 잘려도 복원되는지 확인"""
+        data = b"".join(encode_frame(i, bytes([i]) * (i * 5)) for i in range(5))
+        frames = [f async for f in iter_frames(chunked(data, size))]
+
+        assert [f.index for f in frames] == [0, 1, 2, 3, 4]
+        assert frames[3].payload == b"\x03" * 15
+
+    async def test_iter_frames_rejects_truncated_stream(self):
+        data = encode_frame(0, b"audio")[:-1]
+        with pytest.raises(ValueError, match="truncated"):
+            async for _ in iter_frames(chunked(data, 4)):
+                pass
@@ -0,0 +1,252 @@
+import random
+
+import httpx
+import pytest
+
+from app.gateway.clients.llm import LLMError, OpenAILLM
+from app.gateway.clients.tts import TTSChannel, TTSChannelClient, TTSChannelError, TTSClient
+from app.shared.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    Upstream,
+    is_retryable,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_upstream(max_attempts=3, threshold=5, clock=None, fast_fail=True) -> tuple[Upstream, list[float]]:
+    slept: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        slept.append(delay)
+
+    breaker = CircuitBreaker("test", failure_threshold=threshold, reset_timeout_s=10, fast_fail=fast_fail,
+                             clock=clock or FakeClock())
+    upstream = Upstream(breaker, RetryPolicy(max_attempts=max_attempts), rng=random.Random(0), sleep=sleep)
+    return upstream, slept
+
+
+def sse_body(*tokens: str) -> bytes:
+    events = ['data: {"choices": [{"delta": {"content": "%s"}}]}\n\n' % t for t in tokens]
+    return ("".join(events) + "data: [DONE]\n\n").encode()
+
+
+class TestCircuitBreaker:
+    """breaker 상태 전이 테스트"""
+
+    def test_opens_after_threshold_and_fast_fails(self):
+        breaker = CircuitBreaker("b", failure_threshold=2, reset_timeout_s=10, clock=FakeClock())
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+        assert breaker.snapshot()["rejected"] == 1
+
+    def test_half_open_single_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("b", failure_threshold=1, reset_timeout_s=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        breaker.allow()  # probe
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        breaker.allow()
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("b", failure_threshold=1, reset_timeout_s=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert breaker.opened == 2
+
+    def test_observe_only_mode(self):
+        breaker = CircuitBreaker("b", failure_threshold=1, fast_fail=False, clock=FakeClock())
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        breaker.allow()  # 막지 않는다
+
+
+class TestRetryPolicy:
+    def test_full_jitter_bounded(self):
+        policy = RetryPolicy(base_delay_s=0.1, max_delay_s=0.5)
+        rng = random.Random(3)
+        for attempt in range(6):
+            assert 0 <= policy.backoff(attempt, rng) <= min(0.5, 0.1 * 2 ** attempt)
+
+    def test_retryable_classification(self):
+        request = httpx.Request("GET", "http://x")
+        assert is_retryable(httpx.ConnectError("down"))
+        assert is_retryable(httpx.HTTPStatusError("", request=request, response=httpx.Response(503)))
+        assert not is_retryable(httpx.HTTPStatusError("", request=request, response=httpx.Response(401)))
+        assert is_retryable(LLMError("slow", retryable=True))
+        assert not is_retryable(LLMError("bad key"))
+
+
+class TestUpstreamStream:
+    async def test_retries_before_first_byte(self):
+        upstream, slept = make_upstream()
+        calls = 0
+
+        async def open_stream():
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                raise LLMError("503", retryable=True)
+            yield "a"
+            yield "b"
+
+        assert [x async for x in upstream.stream(open_stream)] == ["a", "b"]
+        assert calls == 3
+        assert len(slept) == 2
+        assert upstream.snapshot()["retries"] == 2
+        assert upstream.breaker.state == CLOSED
+
+    async def test_no_retry_after_first_byte(self):
+        upstream, slept = make_upstream()
+        calls = 0
+
+        async def open_stream():
+            nonlocal calls
+            calls += 1
+            yield "a"
+            raise LLMError("reset", retryable=True)
+
+        out = []
+        with pytest.raises(LLMError):
+            async for x in upstream.stream(open_stream):
+                out.append(x)
+        assert out == ["a"]
+        assert calls == 1 and slept == []
+        assert upstream.breaker.failures == 1
+
+    async def test_non_retryable_raised_immediately(self):
+        upstream, slept = make_upstream()
+
+        async def open_stream():
+            raise LLMError("Invalid OpenAI API key")
+            yield
+
+        with pytest.raises(LLMError, match="Invalid"):
+            async for _ in upstream.stream(open_stream):
+                pass
+        assert slept == [] and upstream.breaker.failures == 0
+
+    async def test_open_breaker_skips_upstream(self):
+        upstream, _ = make_upstream(max_attempts=1, threshold=1)
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            raise httpx.ConnectError("down")
+
+        with pytest.raises(httpx.ConnectError):
+            await upstream.call(fn)
+        with pytest.raises(CircuitOpenError):
+            await upstream.call(fn)
+        assert calls == 1
+
+
+class TestClientsWired:
+    """실제 클라이언트가 Upstream을 거치는지 테스트"""
+
+    async def test_openai_llm_retries_429(self):
+        responses = [httpx.Response(429), httpx.Response(200, content=sse_body("hi"))]
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: responses.pop(0)))
+        upstream, slept = make_upstream()
+        llm = OpenAILLM(api_key="sk-test", client=client, upstream=upstream)
+
+        assert [t async for t in llm.stream("hello", [])] == ["hi"]
+        assert len(slept) == 1
+        await client.aclose()
+
+    async def test_openai_llm_open_breaker_is_llm_error(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(500)))
+        upstream, _ = make_upstream(max_attempts=1, threshold=1)
+        llm = OpenAILLM(api_key="sk-test", client=client, upstream=upstream)
+
+        for expected in ("API error: 500", "unavailable"):
+            with pytest.raises(LLMError, match=expected):
+                async for _ in llm.stream("hello", []):
+                    pass
+        await client.aclose()
+
+    async def test_tts_client_retries(self, monkeypatch):
+        responses = [httpx.Response(503), httpx.Response(200, content=b"audio")]
+        transport = httpx.MockTransport(lambda r: responses.pop(0))
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: real_client(transport=transport, **kw))
+        upstream, slept = make_upstream()
+
+        client = TTSClient("http://tts", upstream=upstream)
+        assert await client.synthesize("hi") == b"audio"
+        assert len(slept) == 1
+
+    async def test_tts_channel_client_retries_error_frame(self):
+        class FlakyChannel:
+            calls = 0
+
+            async def synthesize(self, text, voice, fmt="wav"):
+                self.calls += 1
+                if self.calls == 1:
+                    raise TTSChannelError("overloaded", retryable=True)
+                return b"audio"
+
+        channel = FlakyChannel()
+        upstream, slept = make_upstream()
+
+        client = TTSChannelClient(channel, upstream=upstream)
+        assert await client.synthesize("hi") == b"audio"
+        assert channel.calls == 2 and len(slept) == 1
+
+    async def test_tts_channel_invalid_request_not_retried(self):
+        class Channel:
+            calls = 0
+
+            async def synthesize(self, text, voice, fmt="wav"):
+                self.calls += 1
+                raise TTSChannelError("invalid request")
+
+        channel = Channel()
+        upstream, slept = make_upstream(threshold=1)
+
+        client = TTSChannelClient(channel, upstream=upstream)
+        for _ in range(3):
+            with pytest.raises(TTSChannelError):
+                await client.synthesize("")
+        # 잘못된 입력은 breaker를 열지 않는다
+        assert channel.calls == 3 and slept == []
+        assert upstream.breaker.state == CLOSED
+
+    async def test_tts_channel_connect_failure_opens_breaker(self):
+        # 아무도 안 듣는 포트: 연결 실패도 재시도 대상이고 breaker에 잡힌다
+        channel = TTSChannel("ws://127.0.0.1:1/ws/tts", open_timeout=1.0)
+        upstream, _ = make_upstream(max_attempts=1, threshold=1)
+        client = TTSChannelClient(channel, upstream=upstream)
+
+        with pytest.raises(TTSChannelError, match="connect failed") as exc_info:
+            await client.synthesize("hi")
+        assert exc_info.value.retryable
+        with pytest.raises(CircuitOpenError):
+            async for _ in client.stream("hi"):
+                pass
+        await channel.aclose()
@@ -0,0 +1,99 @@
+import random
+
+import httpx
+import pytest
+
+from app.gateway.clients.llm import LLMError, OpenAILLM
+from app.standin.config import Settings
+from app.standin.faults import Latency
+from app.standin.main import create_app
+from app.tts.services.synthesizer import OpenAISynthesizer, SynthesizeOptions, SynthesizerError
+
+BASE_URL = "http://standin/v1"
+
+
+def fast_settings(**overrides) -> Settings:
+    values = dict(
+        STANDIN_TTFT_MEDIAN_MS=0,
+        STANDIN_TOKEN_MEDIAN_MS=0,
+        STANDIN_TTS_TTFB_MEDIAN_MS=0,
+        STANDIN_REPLY_TOKENS=12,
+        STANDIN_SEED=7,
+    )
+    return Settings(**(values | overrides))
+
+
+def client_for(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+
+
+class TestChatCompletions:
+    """실제 OpenAILLM 코드 경로를 stand-in에 붙여서 테스트"""
+
+    async def test_openai_llm_streams_from_standin(self):
+        app = create_app(fast_settings())
+        async with client_for(app) as client:
+            llm = OpenAILLM(api_key="sk-local", client=client, base_url=BASE_URL)
+            tokens = [t async for t in llm.stream("hello there", [])]
+
+        assert len(tokens) == 12
+        assert "".join(tokens).startswith("You said: hello there")
+        assert app.state.faults.stats.to_dict() == {
+            "requests": 1, "ok": 1, "errors": 0, "rate_limited": 0, "aborted": 0, "in_flight": 0,
+        }
+
+    async def test_injected_429(self):
+        app = create_app(fast_settings(STANDIN_RATE_LIMIT_RATE=1.0))
+        async with client_for(app) as client:
+            llm = OpenAILLM(api_key="sk-local", client=client, base_url=BASE_URL)
+            with pytest.raises(LLMError, match="rate limit"):
+                async for _ in llm.stream("hi", []):
+                    pass
+
+    async def test_concurrency_limit_returns_429(self):
+        app = create_app(fast_settings(STANDIN_MAX_CONCURRENCY=1))
+        faults = app.state.faults
+        faults.admit()  # 다른 요청이 하나 진행 중인 상태
+        async with client_for(app) as client:
+            r = await client.post(
+                f"{BASE_URL}/chat/completions",
+                headers={"Authorization": "Bearer x"},
+                json={"model": "m", "messages": []},
+            )
+        assert r.status_code == 429
+        assert r.headers["retry-after"] == "1"
+
+    async def test_missing_bearer_is_401(self):
+        async with client_for(create_app(fast_settings())) as client:
+            r = await client.post(f"{BASE_URL}/chat/completions", json={"model": "m", "messages": []})
+        assert r.status_code == 401
+
+
+class TestAudioSpeech:
+    async def test_openai_synthesizer_against_standin(self):
+        app = create_app(fast_settings(STANDIN_TTS_MS_PER_CHAR=10, STANDIN_TTS_SAMPLE_RATE=8000))
+        synth = OpenAISynthesizer(api_key="sk-local", client=client_for(app), base_url=BASE_URL)
+        audio = await synth.synthesize("hello", SynthesizeOptions())
+        await synth.aclose()
+
+        # 5글자 * 10ms * 8kHz * 16bit + wav 헤더
+        assert audio[:4] == b"RIFF"
+        assert len(audio) == 44 + 5 * 80 * 2
+
+    async def test_injected_500(self):
+        app = create_app(fast_settings(STANDIN_ERROR_RATE=1.0))
+        synth = OpenAISynthesizer(api_key="sk-local", client=client_for(app), base_url=BASE_URL)
+        with pytest.raises(SynthesizerError, match="500"):
+            await synth.synthesize("hello")
+        await synth.aclose()
+
+
+class TestLatency:
+    def test_fixed_when_p99_not_above_median(self):
+        assert Latency(200, 200).sample(random.Random(0)) == 0.2
+
+    def test_lognormal_median_and_tail(self):
+        rng = random.Random(1)
+        samples = sorted(Latency(100, 400).sample(rng) for _ in range(20000))
+        assert samples[10000] == pytest.approx(0.1, rel=0.05)
+        assert samples[19800] == pytest.approx(0.4, rel=0.15)
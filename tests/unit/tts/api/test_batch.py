@@ -0,0 +1,74 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.shared.framing import decode_frames
+from app.tts.main import app
+from app.tts.services.encoder import EncoderError
+from app.tts.services.synthesizer import SynthesizerError
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+class TestBatchEndpoint:
+    """POST /tts/batch 테스트"""
+
+    def test_returns_frames_in_request_order(self, client):
+        segments = [{"text": "Hi."}, {"text": "How are you doing today?"}, {"text": "Bye!"}]
+        r = client.post("/tts/batch", json={"segments": segments})
+
+        assert r.status_code == 200
+        assert r.headers["x-batch-segments"] == "3"
+        frames = decode_frames(r.content)
+        assert [f.index for f in frames] == [0, 1, 2]
+        assert all(f.ok for f in frames)
+        for frame, segment in zip(frames, segments):
+            assert frame.payload == client.post("/tts", json=segment).content
+
+    def test_rejects_empty_batch(self, client):
+        r = client.post("/tts/batch", json={"segments": []})
+        assert r.status_code == 422
+
+    def test_encoder_error_becomes_error_frame(self, client, monkeypatch):
+        service = client.app.state.synthesis
+        real_synthesize = service.synthesize
+
+        async def synthesize(req):
+            if req.text == "broken":
+                raise EncoderError("ffmpeg failed to encode opus")
+            return await real_synthesize(req)
+
+        monkeypatch.setattr(service, "synthesize", synthesize)
+        r = client.post("/tts/batch", json={"segments": [{"text": "broken"}, {"text": "Fine."}]})
+
+        assert r.status_code == 200
+        frames = decode_frames(r.content)
+        assert [f.index for f in frames] == [0, 1]
+        assert not frames[0].ok and b"ffmpeg" in frames[0].payload
+        assert frames[1].ok
+
+
+class TestSingleEndpointErrors:
+    """POST /tts 가 합성/인코딩 실패를 처리되지 않은 500 대신 오류 응답으로 돌려주는지 테스트"""
+
+    def test_encoder_error_is_error_response(self, client, monkeypatch):
+        async def synthesize(req):
+            raise EncoderError("ffmpeg failed to encode opus")
+
+        monkeypatch.setattr(client.app.state.synthesis, "synthesize", synthesize)
+        r = client.post("/tts", json={"text": "Hi."})
+
+        assert r.status_code == 500
+        assert r.json() == {"detail": "ffmpeg failed to encode opus"}
+
+    def test_retryable_synthesizer_error_is_503(self, client, monkeypatch):
+        async def synthesize(req):
+            raise SynthesizerError("upstream timeout", retryable=True)
+
+        monkeypatch.setattr(client.app.state.synthesis, "synthesize", synthesize)
+        r = client.post("/tts", json={"text": "Hi."})
+
+        assert r.status_code == 503
@@ -0,0 +1,62 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.shared.framing import STATUS_END, STATUS_ERROR, STATUS_FATAL, STATUS_OK, decode_frames
+from app.tts.main import app
+
+
+class TestTTSChannelEndpoint:
+    """/ws/tts 테스트"""
+
+    def test_streams_frames_until_end(self):
+        with TestClient(app) as client:
+            expected = client.post("/tts", json={"text": "Hello"}).content
+            with client.websocket_connect("/ws/tts") as ws:
+                ws.send_text(json.dumps({"id": 7, "text": "Hello"}))
+                audio = b""
+                while True:
+                    (frame,) = decode_frames(ws.receive_bytes())
+                    assert frame.index == 7
+                    if frame.status == STATUS_END:
+                        break
+                    audio += frame.payload
+
+        assert audio == expected
+
+    def test_unexpected_error_sends_error_frame(self, monkeypatch):
+        async def broken(req):
+            raise OSError("disk full")
+            yield b""
+
+        with TestClient(app) as client:
+            monkeypatch.setattr(app.state.synthesis, "stream", broken)
+            with client.websocket_connect("/ws/tts") as ws:
+                ws.send_text(json.dumps({"id": 3, "text": "Hello"}))
+                (frame,) = decode_frames(ws.receive_bytes())
+
+        assert frame.index == 3
+        assert frame.status == STATUS_ERROR
+
+    def test_malformed_message_keeps_connection(self):
+        with TestClient(app) as client:
+            with client.websocket_connect("/ws/tts") as ws:
+                ws.send_text("{not json")
+                ws.send_text("[1, 2]")
+                ws.send_text(json.dumps({"id": 1, "text": "Hi"}))
+                while True:
+                    (frame,) = decode_frames(ws.receive_bytes())
+                    if frame.status != STATUS_OK:
+                        break
+
+        assert frame.index == 1
+        assert frame.status == STATUS_END
+
+    def test_invalid_request_sends_fatal_frame(self):
+        with TestClient(app) as client:
+            with client.websocket_connect("/ws/tts") as ws:
+                ws.send_text(json.dumps({"id": 4, "text": ""}))
+                (frame,) = decode_frames(ws.receive_bytes())
+
+        assert frame.index == 4
+        assert frame.status == STATUS_FATAL
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from app.tts.services.admission import AdmissionController, AdmissionRejected
+
+
+class TestAdmissionController:
+    """AdmissionController 테스트"""
+
+    async def test_admits_up_to_max_concurrency(self):
+        admission = AdmissionController(max_concurrency=2, max_queue=0, max_wait_s=1.0)
+
+        async with admission.slot():
+            async with admission.slot():
+                assert admission.stats().in_flight == 2
+
+        stats = admission.stats()
+        assert stats.in_flight == 0
+        assert stats.admitted == 2
+
+    async def test_rejects_when_queue_is_full(self):
+        admission = AdmissionController(max_concurrency=1, max_queue=0, max_wait_s=1.0)
+
+        async with admission.slot():
+            with pytest.raises(AdmissionRejected) as exc_info:
+                async with admission.slot():
+                    pass
+
+        assert exc_info.value.reason == "queue_full"
+        assert exc_info.value.retry_after >= 1
+        assert admission.stats().rejected_queue_full == 1
+
+    async def test_rejects_after_max_queue_wait(self):
+        admission = AdmissionController(max_concurrency=1, max_queue=1, max_wait_s=0.01)
+
+        async with admission.slot():
+            with pytest.raises(AdmissionRejected, match="queue_timeout"):
+                async with admission.slot():
+                    pass
+
+        stats = admission.stats()
+        assert stats.rejected_queue_timeout == 1
+        assert stats.queue_depth == 0
+
+    async def test_queued_request_runs_when_slot_frees(self):
+        admission = AdmissionController(max_concurrency=1, max_queue=1, max_wait_s=1.0)
+        release = asyncio.Event()
+
+        async def holder():
+            async with admission.slot():
+                await release.wait()
+
+        async def waiter():
+            async with admission.slot():
+                return "ran"
+
+        hold_task = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        wait_task = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        assert admission.stats().queue_depth == 1
+
+        release.set()
+        assert await wait_task == "ran"
+        await hold_task
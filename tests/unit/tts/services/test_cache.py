@@ -0,0 +1,92 @@
+from app.tts.services.cache import AudioCache, DiskTier, MemoryLRU, cache_key
+
+
+class TestCacheKey:
+    """cache_key() 테스트"""
+
+    def test_whitespace_is_normalized(self):
+        assert cache_key("Hi  there ", "alloy", "wav", "tts-1", 24000) == cache_key(
+            "Hi there", "alloy", "wav", "tts-1", 24000
+        )
+
+    def test_each_field_changes_key(self):
+        base = cache_key("Hi", "alloy", "wav", "tts-1", 24000)
+        assert base != cache_key("Hi", "echo", "wav", "tts-1", 24000)
+        assert base != cache_key("Hi", "alloy", "mp3", "tts-1", 24000)
+        assert base != cache_key("Hi", "alloy", "wav", "tts-1-hd", 24000)
+        assert base != cache_key("Hi", "alloy", "wav", "tts-1", 16000)
+
+
+class TestMemoryLRU:
+    """MemoryLRU 테스트"""
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        lru = MemoryLRU(max_bytes=10)
+        lru.put("a", b"1234")
+        lru.put("b", b"1234")
+        lru.get("a")  # a를 최근 사용으로
+        lru.put("c", b"1234")
+
+        assert lru.get("b") is None
+        assert lru.get("a") == b"1234"
+        assert lru.get("c") == b"1234"
+        assert lru.size == 8
+        assert lru.evictions == 1
+
+    def test_skips_values_larger_than_capacity(self):
+        lru = MemoryLRU(max_bytes=4)
+        lru.put("a", b"12345")
+        assert lru.get("a") is None
+        assert lru.size == 0
+
+
+class TestDiskTier:
+    """DiskTier 테스트"""
+
+    def test_survives_restart(self, tmp_path):
+        DiskTier(tmp_path, max_bytes=100).put("ab12", b"audio")
+
+        reopened = DiskTier(tmp_path, max_bytes=100)
+        assert reopened.get("ab12") == b"audio"
+        assert reopened.size == 5
+
+    def test_evicts_oldest_when_over_budget(self, tmp_path):
+        disk = DiskTier(tmp_path, max_bytes=10)
+        disk.put("aa01", b"123456")
+        disk.put("bb02", b"123456")
+
+        assert disk.get("aa01") is None
+        assert disk.get("bb02") == b"123456"
+        assert disk.evictions == 1
+        assert not (tmp_path / "aa" / "aa01.seg").exists()
+
+    def test_truncated_file_is_a_miss(self, tmp_path):
+        disk = DiskTier(tmp_path, max_bytes=100)
+        disk.put("ab12", b"audio")
+        (tmp_path / "ab" / "ab12.seg").write_bytes(b"")
+
+        assert disk.get("ab12") is None
+        assert len(disk) == 0 and disk.size == 0
+
+
+class TestAudioCache:
+    """AudioCache 테스트"""
+
+    async def test_miss_then_memory_hit(self):
+        cache = AudioCache(memory_bytes=100)
+        assert await cache.get("k") == (None, "miss")
+        await cache.put("k", b"audio")
+        assert await cache.get("k") == (b"audio", "memory")
+
+        stats = cache.stats()
+        assert stats.misses == 1
+        assert stats.memory_hits == 1
+        assert stats.memory_bytes == 5
+
+    async def test_disk_hit_promotes_to_memory(self, tmp_path):
+        await AudioCache(memory_bytes=100, disk_dir=str(tmp_path), disk_bytes=100).put("ab", b"x")
+
+        cache = AudioCache(memory_bytes=100, disk_dir=str(tmp_path), disk_bytes=100)
+        assert await cache.get("ab") == (b"x", "disk")
+        assert await cache.get("ab") == (b"x", "memory")
+        assert cache.stats().disk_hits == 1
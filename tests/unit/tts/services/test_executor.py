@@ -0,0 +1,25 @@
+import asyncio
+
+from app.tts.services.executor import ProcessPoolSynthesizer
+from app.tts.services.synthesizer import DummySynthesizer, SynthesizerOptions
+
+
+class TestProcessPoolSynthesizer:
+    """ProcessPoolSynthesizer 테스트 (실제 워커 프로세스 사용)"""
+
+    async def test_matches_inline_render(self):
+        local = DummySynthesizer(SynthesizerOptions(sample_rate=16000))
+        pool = ProcessPoolSynthesizer(local, workers=2)
+        try:
+            await pool.warm_up()
+            texts = ["Hi.", "Hello there, how are you?", "x" * 200, "Bye!"]
+            results = await asyncio.gather(*(pool.synthesize(t) for t in texts))
+        finally:
+            await pool.aclose()
+
+        assert results == [local.render(t) for t in texts]
+        assert pool.model == "dummy"
+
+    def test_slot_size_covers_longest_clip(self):
+        local = DummySynthesizer()
+        assert len(local.render("x" * 1000)) == local.max_output_bytes
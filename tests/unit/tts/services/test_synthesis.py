@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from app.tts.schemas.tts import TTSRequest
+from app.tts.services.cache import AudioCache
+from app.tts.services.encoder import AudioEncoder
+from app.tts.services.synthesis import SynthesisService
+from app.tts.services.synthesizer import DummySynthesizer, OpenAIFormat
+from app.tts.services.warm import WarmPhraseStore
+
+
+class CountingSynthesizer(DummySynthesizer):
+    def __init__(self):
+        super().__init__()
+        self.formats = []
+
+    async def synthesize(self, text, options=None):
+        self.formats.append(options.format)
+        return await super().synthesize(text, options)
+
+
+@pytest.fixture
+def synthesizer():
+    return CountingSynthesizer()
+
+
+@pytest.fixture
+def service(synthesizer):
+    return SynthesisService(
+        synthesizer=synthesizer,
+        audio_cache=AudioCache(memory_bytes=10 * 1024 * 1024),
+        encoder=AudioEncoder(sample_rate=24000, ffmpeg_path=None),
+    )
+
+
+class TestLazyEncoding:
+    """synthesize-once, encode-lazily 테스트"""
+
+    async def test_wav_is_identical_to_direct_synthesis(self, service):
+        audio, tier = await service.synthesize(TTSRequest(text="Hello there"))
+        assert tier == "miss"
+        assert audio == DummySynthesizer().render("Hello there")
+
+    async def test_second_format_reuses_canonical_pcm(self, service, synthesizer):
+        await service.synthesize(TTSRequest(text="Hello", format=OpenAIFormat.WAV))
+        pcm, tier = await service.synthesize(TTSRequest(text="Hello", format=OpenAIFormat.PCM))
+
+        assert synthesizer.formats == [OpenAIFormat.PCM]
+        assert tier == "memory"
+        assert service.stats()["upstream_calls"] == 1
+
+    async def test_encoded_from_cached_pcm(self, service, synthesizer):
+        await service.synthesize(TTSRequest(text="Hello", format=OpenAIFormat.PCM))
+        _audio, tier = await service.synthesize(TTSRequest(text="Hello", format=OpenAIFormat.WAV))
+
+        assert tier == "encoded"
+        assert synthesizer.formats == [OpenAIFormat.PCM]
+        assert service.stats()["local_encodes"] == {"wav": 1}
+
+    async def test_unencodable_format_goes_upstream(self, service, synthesizer):
+        """ffmpeg가 없으면 압축 포맷은 업스트림에 그대로 요청한다"""
+        await service.synthesize(TTSRequest(text="Hello", format=OpenAIFormat.MP3))
+        assert synthesizer.formats == [OpenAIFormat.MP3]
+
+
+class TestNegotiation:
+    """accept_formats 협상 테스트"""
+
+    def test_picks_smallest_locally_encodable_format(self, service):
+        req = TTSRequest(text="Hi", accept_formats=[OpenAIFormat.WAV, OpenAIFormat.PCM])
+        assert service.negotiate(req).format == OpenAIFormat.PCM
+
+    def test_prefers_opus_when_ffmpeg_is_available(self, synthesizer):
+        service = SynthesisService(
+            synthesizer=synthesizer,
+            encoder=AudioEncoder(sample_rate=24000, ffmpeg_path="/usr/bin/ffmpeg"),
+        )
+        req = TTSRequest(text="Hi", accept_formats=[OpenAIFormat.WAV, OpenAIFormat.OPUS])
+        assert service.negotiate(req).format == OpenAIFormat.OPUS
+
+    def test_falls_back_to_upstream_formats(self, service):
+        req = TTSRequest(text="Hi", accept_formats=[OpenAIFormat.MP3, OpenAIFormat.AAC])
+        assert service.negotiate(req).format == OpenAIFormat.AAC
+
+
+class TestWarm:
+    """warm() / WarmPhraseStore 테스트"""
+
+    @pytest.fixture
+    def warm_service(self, synthesizer):
+        return SynthesisService(
+            synthesizer=synthesizer,
+            audio_cache=AudioCache(memory_bytes=10 * 1024 * 1024),
+            encoder=AudioEncoder(sample_rate=24000, ffmpeg_path=None),
+            warm_store=WarmPhraseStore(max_bytes=10 * 1024 * 1024),
+        )
+
+    async def test_warmed_phrase_is_served_from_store(self, warm_service, synthesizer):
+        result = await warm_service.warm([TTSRequest(text="Hello!")], budget_s=5)
+        assert result["warmed"] == 1
+
+        audio, tier = await warm_service.synthesize(TTSRequest(text="Hello!"))
+        assert tier == "warm"
+        assert audio == DummySynthesizer().render("Hello!")
+        assert len(synthesizer.formats) == 1
+
+    async def test_rewarm_is_skipped(self, warm_service):
+        await warm_service.warm([TTSRequest(text="Hello!")], budget_s=5)
+        result = await warm_service.warm([TTSRequest(text="Hello!")], budget_s=5)
+        assert result == {"warmed": 0, "already_warm": 1, "failed": 0, "timed_out": 0, "released": 0}
+
+    async def test_budget_cancels_slow_phrases(self, warm_service, synthesizer):
+        async def slow(text, options=None):
+            await asyncio.sleep(10)
+
+        synthesizer.synthesize = slow
+        result = await warm_service.warm([TTSRequest(text="a"), TTSRequest(text="b")], budget_s=0.05)
+        assert result["timed_out"] == 2
+        assert len(warm_service.warm_store) == 0
+
+    def test_store_is_pinned_not_evicted(self):
+        store = WarmPhraseStore(max_bytes=8)
+        assert store.put("a", b"1234")
+        assert store.put("b", b"1234")
+        assert not store.put("c", b"1")
+        assert store.get("a") == b"1234"
+        assert store.stats().rejected == 1
+
+    async def test_rewarm_group_releases_stale_phrases(self, warm_service):
+        old = TTSRequest(text="Hi, I'm Kai!")
+        filler = TTSRequest(text="Hmm.")
+        await warm_service.warm([old, filler], budget_s=5, group="character:1")
+        await warm_service.warm([filler], budget_s=5, group="character:2")
+
+        # 인사말이 바뀜: 예전 인사말은 풀리고, 다른 캐릭터도 쓰는 filler는 남는다
+        result = await warm_service.warm([TTSRequest(text="Hello, Kai here."), filler], budget_s=5, group="character:1")
+        assert result["released"] == 1
+        assert result["warmed"] == 1
+        store = warm_service.warm_store
+        assert warm_service.key(old) not in store
+        assert warm_service.key(filler) in store
+
+        await warm_service.warm([], budget_s=5, group="character:1")
+        await warm_service.warm([], budget_s=5, group="character:2")
+        assert len(store) == 0
+        assert store.size == 0
+
+    def test_static_phrase_survives_group_release(self):
+        store = WarmPhraseStore(max_bytes=8)
+        store.put("a", b"1234")
+        store.put("a", b"1234", group="g")
+        assert store.retain("g", set()) == 0
+        assert "a" in store
@@ -0,0 +1,157 @@
+import io
+import math
+import struct
+import wave
+
+import httpx
+import pytest
+
+from app.shared.resilience import CircuitBreaker, RetryPolicy, Upstream
+from app.tts.services.synthesizer import (
+    DummySynthesizer,
+    OpenAISynthesizer,
+    SynthesizeOptions,
+    SynthesizerError,
+    SynthesizerOptions,
+)
+
+
+def reference_synthesize(text: str, opt: SynthesizerOptions) -> bytes:
+    """기존 샘플 단위 루프 구현 (바이트 동일성 비교용)"""
+    dur_ms = max(opt.min_ms, min(opt.max_ms, len(text) * opt.ms_per_char))
+    framerate = opt.sample_rate
+    n_frames = int(dur_ms / 1000.0 * framerate)
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(framerate)
+        for i in range(n_frames):
+            t = i / framerate
+            sample = opt.volume * math.sin(2 * math.pi * opt.tone_hz * t)
+            pcm = int(max(-1.0, min(1.0, sample)) * 32767)
+            wf.writeframes(struct.pack("<h", pcm))
+    return buf.getvalue()
+
+
+class TestDummySynthesizer:
+    """DummySynthesizer.render() 테스트"""
+
+    @pytest.mark.parametrize("text", ["a", "Hi.", "Hello there, how are you?", "x" * 200])
+    def test_byte_identical_to_reference(self, text):
+        """기존 루프 구현과 바이트 단위로 같은지 확인"""
+        opt = SynthesizerOptions()
+        assert DummySynthesizer(opt).render(text) == reference_synthesize(text, opt)
+
+    @pytest.mark.parametrize(
+        "opt",
+        [
+            SynthesizerOptions(sample_rate=16000),
+            SynthesizerOptions(sample_rate=22050, tone_hz=523),
+            SynthesizerOptions(sample_rate=48000, volume=1.0),
+            SynthesizerOptions(sample_rate=8000, min_ms=1, ms_per_char=1),
+        ],
+    )
+    def test_byte_identical_for_other_options(self, opt):
+        """샘플레이트/톤/볼륨이 달라도 동일한지 확인"""
+        text = "The quick brown fox."
+        assert DummySynthesizer(opt).render(text) == reference_synthesize(text, opt)
+
+    def test_output_is_valid_wav(self):
+        """wave 모듈로 다시 읽을 수 있는지 확인"""
+        audio = DummySynthesizer().render("Hello!")
+        with wave.open(io.BytesIO(audio), "rb") as wf:
+            assert wf.getnchannels() == 1
+            assert wf.getsampwidth() == 2
+            assert wf.getframerate() == 24000
+            assert wf.getnframes() == int(0.21 * 24000)
+
+
+class TestDummySynthesizerStream:
+    """DummySynthesizer.synthesize() / stream() 테스트"""
+
+    async def test_synthesize_returns_rendered_audio(self):
+        synth = DummySynthesizer()
+        assert await synth.synthesize("Hi.") == synth.render("Hi.")
+
+    async def test_stream_concatenates_to_synthesize_output(self):
+        """스트림을 이어 붙이면 synthesize() 결과와 같은지 확인"""
+        synth = DummySynthesizer()
+        text = "Hello there, how are you?"
+        chunks = [chunk async for chunk in synth.stream(text)]
+        assert b"".join(chunks) == synth.render(text)
+
+    async def test_stream_yields_header_then_frame_blocks(self):
+        """헤더 다음에 stream_block_ms 단위 블록이 오는지 확인"""
+        opt = SynthesizerOptions(stream_block_ms=50)
+        chunks = [chunk async for chunk in DummySynthesizer(opt).stream("x" * 100)]
+
+        assert len(chunks[0]) == 44
+        block_size = 24000 * 50 // 1000 * 2
+        assert all(len(c) == block_size for c in chunks[1:-1])
+        assert 0 < len(chunks[-1]) <= block_size
+
+
+class TestOpenAISynthesizer:
+    """OpenAISynthesizer가 주입된 커넥션 풀을 재사용하는지 테스트"""
+
+    @staticmethod
+    def make_synthesizer(handler) -> OpenAISynthesizer:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return OpenAISynthesizer(api_key="sk-test", client=client)
+
+    async def test_synthesize_reuses_client(self):
+        """여러 번 호출해도 같은 클라이언트로 요청하는지 확인"""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=b"audio")
+
+        synth = self.make_synthesizer(handler)
+        client = synth._client
+        assert await synth.synthesize("one") == b"audio"
+        assert await synth.synthesize("two", SynthesizeOptions()) == b"audio"
+
+        assert synth._client is client
+        assert len(requests) == 2
+        assert requests[0].headers["Authorization"] == "Bearer sk-test"
+        await synth.aclose()
+        assert client.is_closed
+
+    async def test_stream_yields_upstream_chunks(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"a" * 10_000)
+
+        synth = self.make_synthesizer(handler)
+        chunks = [chunk async for chunk in synth.stream("hello")]
+        assert b"".join(chunks) == b"a" * 10_000
+
+    @pytest.mark.parametrize(
+        ("status_code", "message"),
+        [(401, "Invalid OpenAI API key"), (429, "rate limit"), (500, "OpenAI API error: 500")],
+    )
+    async def test_status_errors_are_mapped(self, status_code, message):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(status_code)
+
+        synth = self.make_synthesizer(handler)
+        with pytest.raises(SynthesizerError, match=message):
+            await synth.synthesize("hello")
+        with pytest.raises(SynthesizerError, match=message):
+            async for _ in synth.stream("hello"):
+                pass
+
+    async def test_upstream_retries_before_first_byte(self):
+        responses = [httpx.Response(503), httpx.Response(429), httpx.Response(200, content=b"audio")]
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: responses.pop(0)))
+
+        async def no_sleep(_delay):
+            pass
+
+        upstream = Upstream(CircuitBreaker("openai_tts"), RetryPolicy(max_attempts=3), sleep=no_sleep)
+        synth = OpenAISynthesizer(api_key="sk-test", client=client, upstream=upstream)
+        assert [chunk async for chunk in synth.stream("hello")] == [b"audio"]
+        assert upstream.retries == 2
+        await synth.aclose()